@@ -0,0 +1,190 @@
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+import numpy as np
+from src.bench.vocabulary import make_terms, make_words
+from src.core.speaker_assignment import SpeakerTurns, assign_word_speakers
+from src.core.vocabulary_processor import VocabularyProcessor
+from src.utils.logger import configure_logger
+
+WORDS_PER_SEGMENT = 12
+WORDS_PER_SECOND = 2.5
+SPEAKER_TURN_SECONDS = 15.0
+BENCHMARKS = ["vocabulary", "format_segments", "speaker_assignment", "save_transcript"]
+
+def make_aligned_segments(words: List[str], rng: random.Random) -> List[Dict[str, Any]]:
+    segments = []
+    position = 0.0
+    for index in range(0, len(words), WORDS_PER_SEGMENT):
+        chunk = words[index:index + WORDS_PER_SEGMENT]
+        seg_words = []
+        for word in chunk:
+            length = rng.uniform(0.2, 0.6)
+            seg_words.append({
+                "word": word,
+                "start": round(position, 3),
+                "end": round(position + length, 3),
+                "score": round(rng.uniform(0.3, 1.0), 3)
+            })
+            position += length + rng.uniform(0.0, 0.2)
+        segments.append({
+            "start": seg_words[0]["start"],
+            "end": seg_words[-1]["end"],
+            "text": " " + " ".join(chunk),
+            "words": seg_words
+        })
+        position += rng.uniform(0.2, 1.5)
+    return segments
+
+def make_turns(duration: float, rng: random.Random) -> SpeakerTurns:
+    starts, ends, speakers = [], [], []
+    position = 0.0
+    while position < duration:
+        length = rng.uniform(2.0, SPEAKER_TURN_SECONDS)
+        starts.append(position)
+        ends.append(position + length)
+        speakers.append(f"SPEAKER_{rng.randrange(4):02d}")
+        position += length + rng.uniform(-0.5, 1.0)
+    return SpeakerTurns(np.array(starts), np.array(ends), np.array(speakers, dtype=object))
+
+def measure(run: Callable[[Any], Any], setup: Callable[[], Any], words: int, repeats: int) -> Dict[str, Any]:
+    best = float("inf")
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+    
+    state = setup()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    output = run(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del output
+    blocks = sum(max(0, stat.count_diff) for stat in after.compare_to(before, "lineno"))
+    
+    return {
+        "words": words,
+        "seconds": round(best, 6),
+        "words_per_sec": round(words / best, 1) if best > 0 else 0.0,
+        "alloc_blocks": blocks,
+        "alloc_peak_mb": round(peak / (1024 * 1024), 3)
+    }
+
+def run_benchmarks(names: List[str], sizes: List[int], terms: int, repeats: int, seed: int, work_dir: Path) -> Dict[str, Any]:
+    from src.core.transcriber import Transcriber
+    
+    rng = random.Random(seed)
+    vocabulary = make_terms(terms, rng)
+    processor = VocabularyProcessor(str(work_dir / "vocabularies"))
+    processor.save_profile("bench", vocabulary)
+    processor.get_matcher("bench")
+    transcriber = Transcriber(model_name="base", backend="stub")
+    
+    results = {}
+    for size in sizes:
+        words = make_words(vocabulary, size, rng)
+        aligned = make_aligned_segments(words, rng)
+        formatted = transcriber.format_segments(aligned)
+        turns = make_turns(aligned[-1]["end"], rng)
+        transcript = {"metadata": {"source_file": "bench.wav"}, "segments": formatted}
+        output_path = str(work_dir / "transcript.json")
+        
+        cases = {
+            "vocabulary": (
+                lambda segments: processor.apply_vocabulary(segments, "bench", 2, False, True),
+                lambda: [dict(seg) for seg in formatted]
+            ),
+            "format_segments": (
+                transcriber.format_segments,
+                lambda: aligned
+            ),
+            "speaker_assignment": (
+                lambda segments: assign_word_speakers(turns, {"segments": segments}),
+                lambda: aligned
+            ),
+            "save_transcript": (
+                lambda output: transcriber.save_transcript(output, output_path),
+                lambda: transcript
+            ),
+        }
+        for name in names:
+            run, setup = cases[name]
+            key = f"{name}@{size}"
+            results[key] = measure(run, setup, size, repeats)
+            result = results[key]
+            print(
+                f"{key:<28} {result['seconds']:9.4f}s {result['words_per_sec']:>14,.0f} words/s "
+                f"{result['alloc_blocks']:>10,} blocks {result['alloc_peak_mb']:9.2f} MB peak"
+            )
+    return results
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    comparison = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if not reference:
+            continue
+        for metric, lower_is_better in [("words_per_sec", False), ("alloc_peak_mb", True), ("alloc_blocks", True)]:
+            if not reference.get(metric):
+                continue
+            change = (current[metric] - reference[metric]) / reference[metric]
+            regressed = change > threshold if lower_is_better else change < -threshold
+            comparison.append({
+                "benchmark": key,
+                "metric": metric,
+                "baseline": reference[metric],
+                "current": current[metric],
+                "change": round(change, 4),
+                "regressed": regressed
+            })
+    return comparison
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for transcript post-processing")
+    parser.add_argument("--bench", action="append", choices=BENCHMARKS, help="Benchmarks to run (default: all)")
+    parser.add_argument("--words", default="10000,100000", help="Comma-separated transcript sizes in words")
+    parser.add_argument("--terms", type=int, default=10000, help="Vocabulary profile size")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Write results JSON to this path")
+    parser.add_argument("--baseline", default=None, help="Compare against a stored results JSON")
+    parser.add_argument("--save-baseline", default=None, help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative regression")
+    args = parser.parse_args()
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="transcription-micro-"))
+    configure_logger(str(work_dir / "logs"))
+    sizes = [int(size) for size in args.words.split(",") if size]
+    results = run_benchmarks(args.bench or BENCHMARKS, sizes, args.terms, args.repeats, args.seed, work_dir)
+    report = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "terms": args.terms, "results": results}
+    
+    regressed = False
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        report["comparison"] = compare(results, baseline["results"], args.threshold)
+        for entry in report["comparison"]:
+            if entry["regressed"]:
+                print(f"REGRESSION {entry['benchmark']} {entry['metric']}: {entry['baseline']} -> {entry['current']} ({entry['change']:+.1%})")
+        regressed = any(entry["regressed"] for entry in report["comparison"])
+    
+    for path in [args.output, args.save_baseline]:
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+    
+    if regressed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,313 @@
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import numpy as np
+from src.core.backends import SAMPLE_RATE
+from src.core.vad_cache import configure_vad_cache
+from src.core.queue_manager import QueueManager, QueueStatus
+from src.core.worker_pool import EVENT_STARTED, EVENT_FINISHED, EVENT_ERROR
+from src.utils.config import DEFAULT_SETTINGS
+from src.utils.logger import configure_logger
+from src.utils.resources import ResourceSampler
+
+CORPORA = {
+    "smoke": {"durations": [20, 60], "silence": [0.2], "containers": ["wav"]},
+    "default": {"durations": [30, 120, 600], "silence": [0.1, 0.4], "containers": ["wav", "mp4", "mkv"]},
+    "long": {"durations": [1800, 3600], "silence": [0.2], "containers": ["wav", "mp4"]},
+}
+
+BENCH_SETTINGS = dict(DEFAULT_SETTINGS, pcm_cache_mb=0, backend="stub")
+
+LOWER_IS_BETTER = ["total_wall", "mean_rtf", "p50_latency", "p90_latency"]
+HIGHER_IS_BETTER = ["throughput"]
+MIN_COMPARABLE_SECONDS = 0.05
+MIN_GAP_SECONDS = 0.4
+
+def synthesize_speech(duration: float, silence_ratio: float, rng: random.Random) -> np.ndarray:
+    total = int(duration * SAMPLE_RATE)
+    audio = np.zeros(total, dtype=np.float32)
+    noise = np.random.default_rng(rng.randrange(1 << 30))
+    audio += noise.normal(0, 0.002, total).astype(np.float32)
+    
+    position = int(rng.uniform(0.2, 1.0) * SAMPLE_RATE)
+    while position < total:
+        burst = int(rng.uniform(1.0, 6.0) * SAMPLE_RATE)
+        end = min(total, position + burst)
+        t = np.arange(end - position, dtype=np.float32) / SAMPLE_RATE
+        f0 = rng.uniform(100, 250)
+        voice = sum(np.sin(2 * np.pi * f0 * h * t) / h for h in range(1, 5))
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(3, 5) * t) ** 2
+        audio[position:end] += (0.2 * voice * envelope).astype(np.float32)
+        
+        gap = burst * silence_ratio / max(1e-6, 1 - silence_ratio) * rng.uniform(0.5, 1.5)
+        position = end + max(int(MIN_GAP_SECONDS * SAMPLE_RATE), int(gap))
+    return np.clip(audio, -1, 1)
+
+def write_wav(path: Path, audio: np.ndarray):
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+def convert_container(source: Path, target: Path) -> bool:
+    cmd = [
+        'ffmpeg', '-nostdin', '-y',
+        '-f', 'lavfi', '-i', 'color=c=black:s=64x64:r=5',
+        '-i', str(source),
+        '-shortest',
+        '-c:v', 'mpeg4',
+        '-c:a', 'aac',
+        str(target)
+    ]
+    try:
+        subprocess.run(cmd, capture_output=True, check=True)
+        return True
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error creating {target.name}: {e}")
+        return False
+
+def build_corpus(directory: Path, corpus: Dict[str, List], seed: int) -> List[Dict[str, Any]]:
+    directory.mkdir(parents=True, exist_ok=True)
+    have_ffmpeg = shutil.which("ffmpeg") is not None
+    rng = random.Random(seed)
+    entries = []
+    
+    for duration in corpus["durations"]:
+        for silence in corpus["silence"]:
+            stem = f"synthetic_{duration}s_{int(silence * 100)}pct"
+            wav_path = directory / f"{stem}.wav"
+            write_wav(wav_path, synthesize_speech(duration, silence, rng))
+            
+            for container in corpus["containers"]:
+                path = directory / f"{stem}.{container}"
+                if container != "wav":
+                    if not have_ffmpeg:
+                        print(f"Skipping {path.name}: ffmpeg not found")
+                        continue
+                    if not convert_container(wav_path, path):
+                        continue
+                entries.append({
+                    "path": str(path),
+                    "duration": float(duration),
+                    "silence_ratio": silence,
+                    "container": container
+                })
+    return entries
+
+def parse_overrides(values: List[str]) -> Dict[str, Any]:
+    overrides = {}
+    for value in values:
+        key, _, raw = value.partition("=")
+        try:
+            overrides[key] = json.loads(raw)
+        except json.JSONDecodeError:
+            overrides[key] = raw
+    return overrides
+
+def run_corpus(entries: List[Dict[str, Any]], settings: Dict[str, Any], pipeline_depth: int = 2) -> Dict[str, Any]:
+    from src.core.pipeline import TranscriptionPipeline
+    
+    queue_manager = QueueManager()
+    items = {}
+    for entry in entries:
+        item = queue_manager.add_item(entry["path"], preset=settings["preset"], model=settings["model"])
+        items[item.id] = entry
+    
+    lock = threading.Lock()
+    started: Dict[str, float] = {}
+    finished: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    
+    def emit(event):
+        kind, item_id = event[0], event[1]
+        now = time.perf_counter()
+        with lock:
+            if kind == EVENT_STARTED:
+                started[item_id] = now
+            elif kind == EVENT_FINISHED:
+                finished[item_id] = (now, event[2], event[3])
+                queue_manager.update_status(item_id, QueueStatus.COMPLETE, 100)
+                queue_manager.record_output(item_id, event[3])
+            elif kind == EVENT_ERROR:
+                errors[item_id] = event[2]
+                queue_manager.update_status(item_id, QueueStatus.ERROR, 0, event[2])
+    
+    sampler = ResourceSampler().start()
+    run_start = time.perf_counter()
+    pipeline = TranscriptionPipeline(emit, cpu_threads=settings.get("threads_per_worker", 0), queue_size=pipeline_depth)
+    submitted: Dict[str, float] = {}
+    while True:
+        item = queue_manager.get_next_queued()
+        if item is None:
+            break
+        queue_manager.start_item(item.id, settings)
+        submitted[item.id] = time.perf_counter()
+        pipeline.submit(item.id, item.file_path, settings, item.queued_at)
+    pipeline.close()
+    wall = time.perf_counter() - run_start
+    sampler.stop()
+    
+    files = []
+    for item_id, entry in items.items():
+        result = {
+            "file": Path(entry["path"]).name,
+            "container": entry["container"],
+            "duration": entry["duration"],
+            "silence_ratio": entry["silence_ratio"]
+        }
+        if item_id in finished:
+            end, transcript, output_path = finished[item_id]
+            processing = end - started.get(item_id, submitted[item_id])
+            segments = transcript.get("segments", [])
+            result.update({
+                "status": "complete",
+                "latency": round(end - submitted[item_id], 4),
+                "processing": round(processing, 4),
+                "rtf": round(processing / entry["duration"], 6),
+                "segments": len(segments),
+                "words": sum(len(seg["text"].split()) for seg in segments),
+                "output_bytes": os.path.getsize(output_path)
+            })
+        else:
+            result.update({"status": "error", "error": errors.get(item_id, "no result")})
+        files.append(result)
+    
+    return {"wall": wall, "files": files, "resources": sampler.summary()}
+
+def summarize(run: Dict[str, Any], records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    done = [f for f in run["files"] if f["status"] == "complete"]
+    latencies = np.array([f["latency"] for f in done]) if done else np.zeros(1)
+    audio_seconds = sum(f["duration"] for f in done)
+    
+    stage_seconds: Dict[str, float] = {}
+    for record in records:
+        for stage, seconds in record.get("stage_times", {}).items():
+            stage_seconds[stage] = round(stage_seconds.get(stage, 0.0) + seconds, 4)
+    
+    return {
+        "files": len(run["files"]),
+        "failures": len(run["files"]) - len(done),
+        "audio_seconds": audio_seconds,
+        "total_wall": round(run["wall"], 4),
+        "throughput": round(audio_seconds / run["wall"], 2) if run["wall"] > 0 else 0.0,
+        "mean_rtf": round(float(np.mean([f["rtf"] for f in done])), 6) if done else 0.0,
+        "p50_latency": round(float(np.percentile(latencies, 50)), 4),
+        "p90_latency": round(float(np.percentile(latencies, 90)), 4),
+        "peak_rss_mb": run["resources"].get("peak_rss_mb", 0.0),
+        "stage_seconds": stage_seconds
+    }
+
+def compare(summary: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    checks = [(name, summary.get(name), baseline.get(name), True) for name in LOWER_IS_BETTER]
+    checks += [(name, summary.get(name), baseline.get(name), False) for name in HIGHER_IS_BETTER]
+    for stage, seconds in baseline.get("stage_seconds", {}).items():
+        if seconds >= MIN_COMPARABLE_SECONDS:
+            checks.append((f"stage:{stage}", summary.get("stage_seconds", {}).get(stage), seconds, True))
+    
+    comparison = []
+    for name, current, reference, lower_is_better in checks:
+        if current is None or not reference:
+            continue
+        change = (current - reference) / reference
+        regressed = change > threshold if lower_is_better else change < -threshold
+        comparison.append({
+            "metric": name,
+            "baseline": reference,
+            "current": current,
+            "change": round(change, 4),
+            "regressed": regressed
+        })
+    return comparison
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the end-to-end transcription pipeline")
+    parser.add_argument("--backend", default="stub", help="Transcription backend (stub or whisperx)")
+    parser.add_argument("--model", default=None, help="ASR model name")
+    parser.add_argument("--corpus", choices=sorted(CORPORA), default="smoke")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pipeline-depth", type=int, default=2)
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE")
+    parser.add_argument("--work-dir", default=None, help="Directory for the corpus, outputs and logs")
+    parser.add_argument("--output", default=None, help="Write results JSON to this path")
+    parser.add_argument("--baseline", default=None, help="Compare against a stored results JSON")
+    parser.add_argument("--save-baseline", default=None, help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed relative regression")
+    args = parser.parse_args()
+    
+    if args.backend == "whisperx" and importlib.util.find_spec("whisperx") is None:
+        print("whisperx is not installed; use --backend stub")
+        sys.exit(2)
+    
+    work_dir = Path(args.work_dir) if args.work_dir else Path(tempfile.mkdtemp(prefix="transcription-bench-"))
+    output_dir = work_dir / "outputs"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    logger = configure_logger(str(work_dir / "logs"))
+    configure_vad_cache(str(work_dir / "vad"))
+    
+    settings = dict(BENCH_SETTINGS, backend=args.backend, output_dir=str(output_dir))
+    if args.model:
+        settings["model"] = args.model
+    settings.update(parse_overrides(args.overrides))
+    
+    entries = build_corpus(work_dir / "corpus", CORPORA[args.corpus], args.seed)
+    print(f"Corpus: {len(entries)} files, {sum(e['duration'] for e in entries):.0f}s of audio in {work_dir}")
+    
+    run = run_corpus(entries, settings, args.pipeline_depth)
+    summary = summarize(run, logger.metrics.get_records("performance"))
+    results = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "backend": args.backend,
+        "corpus": args.corpus,
+        "seed": args.seed,
+        "settings": {key: value for key, value in settings.items() if key != "hf_token"},
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count()
+        },
+        "summary": summary,
+        "files": run["files"],
+        "resources": run["resources"]
+    }
+    
+    print(f"Processed {summary['files']} files ({summary['failures']} failed) in {summary['total_wall']:.2f}s")
+    print(f"Throughput: {summary['throughput']:.1f}x realtime, mean RTF {summary['mean_rtf']:.5f}")
+    print(f"Latency p50 {summary['p50_latency']:.3f}s, p90 {summary['p90_latency']:.3f}s, peak RSS {summary['peak_rss_mb']:.0f} MB")
+    for stage, seconds in sorted(summary["stage_seconds"].items(), key=lambda item: -item[1]):
+        print(f"  {stage:<16} {seconds:8.3f}s")
+    
+    regressed = False
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        results["comparison"] = compare(summary, baseline["summary"], args.threshold)
+        for entry in results["comparison"]:
+            marker = "REGRESSION" if entry["regressed"] else "ok"
+            print(f"{entry['metric']:<24} {entry['baseline']:>10} -> {entry['current']:>10} ({entry['change']:+.1%}) {marker}")
+        regressed = any(entry["regressed"] for entry in results["comparison"])
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+    
+    if summary["failures"] or regressed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,194 @@
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from src.utils.warmup import WARMUP_MODULES
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+IMPORT_TARGETS = ["src.ui.main_window", "src.cli"]
+HEAVY_MODULES = WARMUP_MODULES + ["pyannote.core", "torchaudio", "transformers"]
+SLOWEST_MODULES = 10
+
+IMPORT_SCRIPT = """
+import json, sys
+import {target}
+print(json.dumps(sorted(name for name in {heavy!r} if name in sys.modules)))
+"""
+
+FIRST_PAINT_SCRIPT = """
+import json, sys, time
+start = float(sys.argv[1])
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+from src.ui.main_window import MainWindow
+imported = time.time() - start
+window = MainWindow()
+
+def painted():
+    print(json.dumps({"imported": imported, "first_paint": time.time() - start}))
+    app.quit()
+
+window.first_paint.connect(painted)
+window.show()
+app.exec()
+"""
+
+def child_env(home: str) -> Dict[str, str]:
+    env = dict(os.environ, HOME=home, PYTHONPATH=str(REPO_ROOT))
+    if sys.platform.startswith("linux") and not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        modules.append({
+            "module": fields[2].strip(),
+            "self": int(fields[0]) / 1e6,
+            "cumulative": int(fields[1]) / 1e6
+        })
+    return modules
+
+def measure_import(target: str, repeats: int, home: str) -> Dict[str, Any]:
+    runs = []
+    slowest: List[Dict[str, Any]] = []
+    eager: List[str] = []
+    for _ in range(repeats):
+        start = time.time()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT.format(target=target, heavy=HEAVY_MODULES)],
+            cwd=REPO_ROOT, env=child_env(home), capture_output=True, text=True
+        )
+        wall = time.time() - start
+        if proc.returncode != 0:
+            return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit code {proc.returncode}"}
+        
+        modules = parse_importtime(proc.stderr)
+        own = next((entry for entry in modules if entry["module"] == target), None)
+        runs.append({"seconds": own["cumulative"] if own else wall, "wall": wall})
+        slowest = sorted(modules, key=lambda entry: entry["self"], reverse=True)[:SLOWEST_MODULES]
+        eager = json.loads(proc.stdout.strip().splitlines()[-1])
+    
+    return {
+        "seconds": round(statistics.median(run["seconds"] for run in runs), 4),
+        "wall_seconds": round(statistics.median(run["wall"] for run in runs), 4),
+        "eager_heavy_imports": eager,
+        "slowest": [{**entry, "self": round(entry["self"], 4), "cumulative": round(entry["cumulative"], 4)} for entry in slowest]
+    }
+
+def measure_first_paint(repeats: int, home: str, timeout: float) -> Dict[str, Any]:
+    if importlib.util.find_spec("PyQt6") is None:
+        return {"error": "PyQt6 is not installed"}
+    
+    runs = []
+    for _ in range(repeats):
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-c", FIRST_PAINT_SCRIPT, repr(time.time())],
+                cwd=REPO_ROOT, env=child_env(home), capture_output=True, text=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            return {"error": f"window did not paint within {timeout:.0f}s"}
+        lines = [line for line in proc.stdout.splitlines() if line.startswith("{")]
+        if proc.returncode != 0 or not lines:
+            return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit code {proc.returncode}"}
+        runs.append(json.loads(lines[-1]))
+    
+    return {
+        "seconds": round(statistics.median(run["first_paint"] for run in runs), 4),
+        "min_seconds": round(min(run["first_paint"] for run in runs), 4),
+        "import_seconds": round(statistics.median(run["imported"] for run in runs), 4)
+    }
+
+def run_benchmarks(targets: List[str], repeats: int, paint: bool, timeout: float) -> Dict[str, Any]:
+    home = tempfile.mkdtemp(prefix="transcription-startup-")
+    results = {}
+    for target in targets:
+        result = measure_import(target, repeats, home)
+        results[f"import:{target}"] = result
+        if "error" in result:
+            print(f"import {target:<24} skipped: {result['error']}")
+            continue
+        print(f"import {target:<24} {result['seconds']:8.3f}s (process {result['wall_seconds']:.3f}s)")
+        for entry in result["slowest"][:5]:
+            print(f"    {entry['module']:<40} {entry['self']:8.4f}s self {entry['cumulative']:8.4f}s cumulative")
+        if result["eager_heavy_imports"]:
+            print(f"    eager heavy imports: {', '.join(result['eager_heavy_imports'])}")
+    
+    if paint:
+        result = measure_first_paint(repeats, home, timeout)
+        results["first_paint"] = result
+        if "error" in result:
+            print(f"first paint {'':<19} skipped: {result['error']}")
+        else:
+            print(f"first paint {'':<19} {result['seconds']:8.3f}s (min {result['min_seconds']:.3f}s, imports {result['import_seconds']:.3f}s)")
+    return results
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    comparison = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if not reference or not reference.get("seconds") or not current.get("seconds"):
+            continue
+        change = (current["seconds"] - reference["seconds"]) / reference["seconds"]
+        comparison.append({
+            "benchmark": key,
+            "metric": "seconds",
+            "baseline": reference["seconds"],
+            "current": current["seconds"],
+            "change": round(change, 4),
+            "regressed": change > threshold
+        })
+    return comparison
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import and first-paint benchmark")
+    parser.add_argument("--target", action="append", help="Module to import in a fresh interpreter (default: GUI and CLI entry points)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--no-paint", action="store_true", help="Skip the time-to-first-paint measurement")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for the window to paint")
+    parser.add_argument("--output", default=None, help="Write results JSON to this path")
+    parser.add_argument("--baseline", default=None, help="Compare against a stored results JSON")
+    parser.add_argument("--save-baseline", default=None, help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.3, help="Allowed relative regression")
+    args = parser.parse_args()
+    
+    results = run_benchmarks(args.target or IMPORT_TARGETS, max(1, args.repeats), not args.no_paint, args.timeout)
+    report: Dict[str, Any] = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0], "results": results}
+    
+    eager = {key: result["eager_heavy_imports"] for key, result in results.items() if result.get("eager_heavy_imports")}
+    for key, modules in eager.items():
+        print(f"REGRESSION {key} imports {', '.join(modules)} at start-up")
+    
+    regressed = bool(eager)
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        report["comparison"] = compare(results, baseline["results"], args.threshold)
+        for entry in report["comparison"]:
+            if entry["regressed"]:
+                print(f"REGRESSION {entry['benchmark']} {entry['metric']}: {entry['baseline']} -> {entry['current']} ({entry['change']:+.1%})")
+        regressed = regressed or any(entry["regressed"] for entry in report["comparison"])
+    
+    for path in [args.output, args.save_baseline]:
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+    
+    if regressed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
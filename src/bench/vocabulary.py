@@ -0,0 +1,80 @@
+import argparse
+import random
+import string
+import time
+from typing import Dict, List
+from Levenshtein import distance as levenshtein_distance
+from src.core.vocabulary_matcher import VocabularyMatcher
+
+def make_terms(count: int, rng: random.Random) -> Dict[str, str]:
+    terms = {}
+    while len(terms) < count:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 12)))
+        terms[word] = word.capitalize()
+    return terms
+
+def make_words(terms: Dict[str, str], count: int, rng: random.Random) -> List[str]:
+    keys = list(terms)
+    words = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.1:
+            word = rng.choice(keys)
+        elif roll < 0.2:
+            word = list(rng.choice(keys))
+            word[rng.randrange(len(word))] = rng.choice(string.ascii_lowercase)
+            word = "".join(word)
+        else:
+            word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+        words.append(word + rng.choice(["", "", ",", "."]))
+    return words
+
+def legacy_correct(terms: Dict[str, str], words: List[str], threshold: int) -> List[str]:
+    words = list(words)
+    for i, word in enumerate(words):
+        word_clean = word.strip('.,!?;:"\'-').lower()
+        for phonetic, correct in terms.items():
+            phonetic_lower = phonetic.lower()
+            if word_clean == phonetic_lower:
+                words[i] = word.replace(word_clean, correct, 1)
+                break
+            elif levenshtein_distance(word_clean, phonetic_lower) <= threshold:
+                words[i] = word.replace(word_clean, correct, 1)
+                break
+    return words
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vocabulary correction")
+    parser.add_argument("--terms", type=int, default=10000)
+    parser.add_argument("--words", type=int, default=2000)
+    parser.add_argument("--threshold", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    terms = make_terms(args.terms, rng)
+    words = make_words(terms, args.words, rng)
+    
+    start = time.perf_counter()
+    expected = legacy_correct(terms, words, args.threshold)
+    legacy_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    matcher = VocabularyMatcher(terms)
+    matcher.build_index(min(args.threshold, 2))
+    build_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    actual = matcher.correct_words(words, args.threshold)
+    match_time = time.perf_counter() - start
+    
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"terms={args.terms} words={args.words} threshold={args.threshold}")
+    print(f"legacy:  {legacy_time:.3f}s ({args.words / legacy_time:,.0f} words/s)")
+    print(f"matcher: {match_time:.3f}s ({args.words / match_time:,.0f} words/s), index build {build_time:.3f}s")
+    print(f"speedup: {legacy_time / match_time:.1f}x, mismatches: {mismatches}")
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,211 @@
+import argparse
+import glob
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from src.core.queue_manager import QueueManager, QueueStatus
+from src.core.transcript_index import TranscriptIndex
+from src.core.worker_pool import (
+    WorkerPool, EVENT_PROGRESS, EVENT_SEGMENTS, EVENT_FINISHED, EVENT_ERROR
+)
+from src.utils.config import ConfigManager, DEFAULT_SETTINGS
+
+GLOB_CHARS = set("*?[")
+
+def parse_value(raw: str) -> Any:
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return raw
+
+def parse_overrides(values: List[str]) -> Dict[str, Any]:
+    overrides = {}
+    for value in values:
+        key, separator, raw = value.partition("=")
+        if not separator or not key:
+            raise ValueError(f"Expected KEY=VALUE, got {value!r}")
+        if key not in DEFAULT_SETTINGS and key != "backend":
+            print(f"Warning: unknown setting {key!r}", file=sys.stderr)
+        overrides[key] = parse_value(raw)
+    return overrides
+
+def expand_inputs(patterns: List[str]) -> Tuple[List[str], List[str]]:
+    files: List[str] = []
+    missing: List[str] = []
+    for pattern in patterns:
+        if GLOB_CHARS & set(pattern):
+            matches = sorted(path for path in glob.glob(pattern, recursive=True) if Path(path).is_file())
+            if not matches:
+                missing.append(pattern)
+            files.extend(matches)
+        elif Path(pattern).is_file():
+            files.append(pattern)
+        else:
+            missing.append(pattern)
+    return list(dict.fromkeys(files)), missing
+
+def read_manifest(manifest_path: str) -> List[Tuple[str, Dict[str, Any]]]:
+    base_dir = Path(manifest_path).parent
+    entries = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{manifest_path}:{line_number}: {e}")
+            if isinstance(entry, str):
+                entry = {"path": entry}
+            if "path" not in entry:
+                raise ValueError(f"{manifest_path}:{line_number}: missing \"path\"")
+            
+            path = Path(entry.pop("path"))
+            if not path.is_absolute():
+                path = base_dir / path
+            overrides = entry.pop("settings", {})
+            overrides.update(entry)
+            entries.append((str(path), overrides))
+    return entries
+
+def build_settings(args) -> Dict[str, Any]:
+    settings = dict(DEFAULT_SETTINGS)
+    if args.app_settings:
+        settings.update(ConfigManager().load_settings() or {})
+    if args.settings:
+        with open(args.settings, 'r') as f:
+            settings.update(json.load(f))
+    settings.update(parse_overrides(args.overrides))
+    if args.output_dir:
+        settings["output_dir"] = args.output_dir
+    if args.workers:
+        settings["max_workers"] = args.workers
+    return settings
+
+class BatchRunner:
+    def __init__(self, settings: Dict[str, Any], reuse: bool = True, verbose: bool = False):
+        self.settings = settings
+        self.verbose = verbose
+        self.queue_manager = QueueManager(TranscriptIndex() if reuse else None, on_item_ready=self.on_item_ready)
+        self.worker_pool = WorkerPool(settings.get("max_workers", 1), settings.get("threads_per_worker", 0))
+        self.item_settings: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+    
+    def add(self, file_path: str, overrides: Optional[Dict[str, Any]] = None):
+        settings = dict(self.settings, **(overrides or {}))
+        Path(settings["output_dir"]).mkdir(parents=True, exist_ok=True)
+        item = self.queue_manager.add_item(file_path, preset=settings["preset"], model=settings["model"], settings=settings)
+        self.item_settings[item.id] = settings
+    
+    def on_item_ready(self, item):
+        if item.status == QueueStatus.CACHED:
+            self.results[item.id] = {"file": item.file_path, "status": "cached", "output": item.output_path}
+            print(f"↺ {item.filename}: reused existing transcript {item.output_path}")
+    
+    def submit_ready(self):
+        while self.worker_pool.has_capacity():
+            item = self.queue_manager.get_next_queued()
+            if item is None:
+                return
+            settings = self.item_settings[item.id]
+            self.queue_manager.start_item(item.id, settings)
+            self.worker_pool.submit(item.id, item.file_path, settings, item.queued_at)
+            if self.verbose:
+                print(f"=== Processing: {item.filename} ===")
+    
+    def handle(self, event: Tuple):
+        kind, item_id = event[0], event[1]
+        item = self.queue_manager.get_item(item_id)
+        name = item.filename if item else item_id
+        
+        if kind == EVENT_PROGRESS:
+            self.queue_manager.update_status(item_id, QueueStatus.PROCESSING, event[2])
+            if self.verbose:
+                print(f"{name}: {event[3]} ({event[2]}%)")
+        elif kind == EVENT_SEGMENTS:
+            if self.verbose:
+                for seg in event[2]:
+                    print(f"{name} [{seg['start']:.1f}s] {seg['text']}")
+        elif kind == EVENT_FINISHED:
+            transcript, output_path = event[2], event[3]
+            self.queue_manager.update_status(item_id, QueueStatus.COMPLETE, 100)
+            self.queue_manager.record_output(item_id, output_path)
+            self.results[item_id] = {
+                "file": item.file_path if item else name,
+                "status": "complete",
+                "output": output_path,
+                "segments": len(transcript["segments"])
+            }
+            print(f"✓ {name} -> {output_path} ({len(transcript['segments'])} segments)")
+        elif kind == EVENT_ERROR:
+            self.queue_manager.update_status(item_id, QueueStatus.ERROR, error=event[2])
+            self.results[item_id] = {"file": item.file_path if item else name, "status": "error", "error": event[2]}
+            print(f"✗ {name}: {event[2]}", file=sys.stderr)
+    
+    def run(self) -> List[Dict[str, Any]]:
+        try:
+            self.submit_ready()
+            while self.worker_pool.active_count > 0 or self.queue_manager.hashing_count > 0:
+                event = self.worker_pool.get_event(timeout=0.5)
+                if event is not None:
+                    self.handle(event)
+                self.submit_ready()
+        finally:
+            self.queue_manager.shutdown()
+            self.worker_pool.shutdown()
+        return [self.results[item.id] for item in self.queue_manager.items if item.id in self.results]
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Transcribe audio/video files without the GUI")
+    parser.add_argument("inputs", nargs="*", help="Files or glob patterns (quote globs to use recursive **)")
+    parser.add_argument("--manifest", help="JSONL file with one {\"path\": ..., \"settings\": {...}} object per line")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE", help="Override a setting (JSON values)")
+    parser.add_argument("--settings", help="JSON file with settings")
+    parser.add_argument("--app-settings", action="store_true", help="Start from the GUI's saved settings")
+    parser.add_argument("--output-dir", help="Directory for transcripts")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (default: max_workers setting)")
+    parser.add_argument("--no-reuse", action="store_true", help="Do not reuse transcripts of identical inputs")
+    parser.add_argument("--summary", help="Write a JSON summary of the run to this path")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print progress and transcript segments")
+    args = parser.parse_args(argv)
+    
+    try:
+        settings = build_settings(args)
+        files, missing = expand_inputs(args.inputs)
+        entries = [(path, {}) for path in files]
+        if args.manifest:
+            entries.extend(read_manifest(args.manifest))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    for pattern in missing:
+        print(f"Error: no such file: {pattern}", file=sys.stderr)
+    if not entries:
+        print("Error: no input files", file=sys.stderr)
+        return 2
+    
+    start = time.time()
+    runner = BatchRunner(settings, reuse=not args.no_reuse, verbose=args.verbose)
+    for path, overrides in entries:
+        runner.add(path, overrides)
+    
+    try:
+        results = runner.run()
+    except KeyboardInterrupt:
+        print("Interrupted", file=sys.stderr)
+        return 130
+    
+    failures = [result for result in results if result["status"] == "error"]
+    print(f"{len(results) - len(failures)}/{len(results)} files transcribed in {time.time() - start:.1f}s")
+    
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump({"results": results, "missing": missing}, f, indent=2)
+    return 1 if failures or missing else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
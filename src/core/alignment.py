@@ -0,0 +1,110 @@
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import torch
+import whisperx
+from torch.nn.utils.rnn import pad_sequence
+from whisperx.audio import SAMPLE_RATE
+
+MIN_INPUT_SAMPLES = 400
+BUCKET_RATIO = 1.25
+
+class BatchedAlignModel:
+    def __init__(self, model, batch_size: int = 8):
+        self.model = model
+        self.batch_size = batch_size
+        self.emissions: Dict[Tuple[int, int], torch.Tensor] = {}
+        self.audio: Optional[torch.Tensor] = None
+        
+        first_norm = model.feature_extractor.conv_layers[0].layer_norm
+        self.batch_features = not isinstance(first_norm, torch.nn.GroupNorm)
+    
+    def __getattr__(self, name):
+        return getattr(self.model, name)
+    
+    def __call__(self, waveforms: torch.Tensor, lengths=None):
+        if lengths is None and waveforms.shape[0] == 1:
+            span = self._span(waveforms)
+            emission = self.emissions.get(span) if span is not None else None
+            if emission is not None:
+                return emission, None
+        return self.model(waveforms, lengths=lengths)
+    
+    def _span(self, waveform: torch.Tensor) -> Optional[Tuple[int, int]]:
+        audio = self.audio
+        if audio is None or waveform.dim() != 2 or waveform.stride(-1) != 1:
+            return None
+        if waveform.untyped_storage().data_ptr() != audio.untyped_storage().data_ptr():
+            return None
+        start = waveform.storage_offset() - audio.storage_offset()
+        if start < 0 or start + waveform.shape[-1] > audio.shape[-1]:
+            return None
+        return start, start + waveform.shape[-1]
+    
+    def precompute(self, segments: List[Dict[str, Any]], audio: torch.Tensor, dictionary: Dict[str, int]):
+        self.audio = audio
+        crops = []
+        seen = set()
+        for seg in segments:
+            f1 = int(seg["start"] * SAMPLE_RATE)
+            f2 = min(int(seg["end"] * SAMPLE_RATE), audio.shape[-1])
+            if f1 >= audio.shape[-1] or f2 - f1 < MIN_INPUT_SAMPLES or not _alignable(seg["text"], dictionary):
+                continue
+            if (f1, f2) in seen:
+                continue
+            seen.add((f1, f2))
+            crops.append(((f1, f2), audio[:, f1:f2]))
+        
+        crops.sort(key=lambda item: item[1].shape[-1])
+        bucket: List[Tuple[Tuple[int, int], torch.Tensor]] = []
+        for item in crops:
+            if bucket and (len(bucket) >= self.batch_size or item[1].shape[-1] > bucket[0][1].shape[-1] * BUCKET_RATIO):
+                self._run_batch(bucket)
+                bucket = []
+            bucket.append(item)
+        if bucket:
+            self._run_batch(bucket)
+    
+    def clear(self):
+        self.emissions.clear()
+        self.audio = None
+    
+    def _run_batch(self, bucket: List[Tuple[Tuple[int, int], torch.Tensor]]):
+        crops = [crop for _, crop in bucket]
+        with torch.inference_mode():
+            if self.batch_features:
+                lengths = torch.tensor([crop.shape[-1] for crop in crops], device=crops[0].device)
+                waveforms = pad_sequence([crop[0] for crop in crops], batch_first=True)
+                features, feature_lengths = self.model.feature_extractor(waveforms, lengths)
+            else:
+                per_crop = [self.model.feature_extractor(crop, None)[0][0] for crop in crops]
+                feature_lengths = torch.tensor([len(features) for features in per_crop], device=crops[0].device)
+                features = pad_sequence(per_crop, batch_first=True)
+            
+            emissions = self.model.encoder(features, feature_lengths)
+            if self.model.aux is not None:
+                emissions = self.model.aux(emissions)
+        
+        for index, (span, _) in enumerate(bucket):
+            self.emissions[span] = emissions[index:index + 1, :int(feature_lengths[index])]
+
+def _alignable(text: str, dictionary: Dict[str, int]) -> bool:
+    return any(char in dictionary for char in text.strip().lower().replace(" ", "|"))
+
+def align_batched(
+    segments: List[Dict[str, Any]],
+    model,
+    metadata: Dict[str, Any],
+    audio: np.ndarray,
+    device: str,
+    batch_size: int = 8
+) -> Dict[str, Any]:
+    if batch_size <= 1 or metadata.get("type") != "torchaudio" or not hasattr(model, "encoder"):
+        return whisperx.align(segments, model, metadata, audio, device, return_char_alignments=False)
+    
+    waveform = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32)).unsqueeze(0).to(device)
+    batched = BatchedAlignModel(model, batch_size)
+    batched.precompute(segments, waveform, metadata["dictionary"])
+    try:
+        return whisperx.align(segments, batched, metadata, waveform, device, return_char_alignments=False)
+    finally:
+        batched.clear()
\ No newline at end of file
@@ -0,0 +1,98 @@
+from typing import Any, Dict, List, Optional, Union
+import importlib
+import threading
+import numpy as np
+
+SAMPLE_RATE = 16000
+DEFAULT_BACKEND = "whisperx"
+
+class WhisperXBackend:
+    name = "whisperx"
+    
+    def load_asr_model(self, model_name: str, device: str, compute_type: str, asr_options: Dict[str, Any], threads: int):
+        import whisperx
+        return whisperx.load_model(
+            model_name,
+            device=device,
+            compute_type=compute_type,
+            language="en",
+            asr_options=asr_options,
+            threads=threads
+        )
+    
+    def load_align_model(self, language_code: str, device: str):
+        import whisperx
+        return whisperx.load_align_model(language_code=language_code, device=device)
+    
+    def load_diarize_model(self, hf_token: str, device: str):
+        import torch
+        from pyannote.audio import Pipeline
+        pipeline = Pipeline.from_pretrained(
+            "pyannote/speaker-diarization-3.1",
+            use_auth_token=hf_token
+        )
+        pipeline.to(torch.device(device))
+        return pipeline
+    
+    def load_audio(self, path: str) -> np.ndarray:
+        import whisperx
+        return whisperx.load_audio(path)
+    
+    def vad_params(self, model) -> Dict[str, Any]:
+        return {
+            "method": type(model.vad_model).__name__,
+            "onset": model._vad_params["vad_onset"],
+            "offset": model._vad_params["vad_offset"]
+        }
+    
+    def detect_speech(self, model, audio: np.ndarray, chunk_size: int, onset: float, offset: float) -> List[Dict[str, Any]]:
+        from whisperx.vads import Vad, Pyannote
+        vad_model = model.vad_model
+        vad_class = type(vad_model) if isinstance(vad_model, Vad) else Pyannote
+        
+        waveform = vad_class.preprocess_audio(audio)
+        speech = vad_model({"waveform": waveform, "sample_rate": SAMPLE_RATE})
+        return vad_class.merge_chunks(speech, chunk_size, onset=onset, offset=offset)
+    
+    def align(
+        self,
+        segments: List[Dict[str, Any]],
+        model,
+        metadata: Dict[str, Any],
+        audio: np.ndarray,
+        device: str,
+        batch_size: int
+    ) -> Dict[str, Any]:
+        from src.core.alignment import align_batched
+        return align_batched(segments, model, metadata, audio, device, batch_size)
+    
+    def diarize(self, model, audio: Union[np.ndarray, str]):
+        if isinstance(audio, np.ndarray):
+            import torch
+            audio = {"waveform": torch.from_numpy(np.asarray(audio, dtype=np.float32))[None], "sample_rate": SAMPLE_RATE}
+        return model(audio)
+
+BACKENDS: Dict[str, str] = {
+    "whisperx": "src.core.backends:WhisperXBackend",
+    "stub": "src.bench.stub_backend:StubBackend",
+}
+
+_backend_instances: Dict[str, Any] = {}
+_backend_lock = threading.Lock()
+
+def register_backend(name: str, target: str):
+    with _backend_lock:
+        BACKENDS[name] = target
+        _backend_instances.pop(name, None)
+
+def get_backend(name: Optional[str] = None):
+    name = name or DEFAULT_BACKEND
+    with _backend_lock:
+        backend = _backend_instances.get(name)
+        if backend is None:
+            if name not in BACKENDS:
+                raise ValueError(f"Unknown transcription backend: {name}")
+            module_name, class_name = BACKENDS[name].split(":")
+            backend = getattr(importlib.import_module(module_name), class_name)()
+            _backend_instances[name] = backend
+        return backend
\ No newline at end of file
@@ -0,0 +1,35 @@
+from typing import Any, Callable, Optional
+import contextvars
+import threading
+from src.utils.timings import StageTimings
+
+class DiarizationTask:
+    def __init__(self, run: Callable[[], Any], timings: Optional[StageTimings] = None):
+        self.run = run
+        self.timings = timings
+        self.result = None
+        self.error: Optional[Exception] = None
+        self.thread: Optional[threading.Thread] = None
+    
+    def start(self) -> "DiarizationTask":
+        context = contextvars.copy_context()
+        self.thread = threading.Thread(target=context.run, args=(self._run,), name="diarization", daemon=True)
+        self.thread.start()
+        return self
+    
+    def _run(self):
+        try:
+            if self.timings is not None:
+                with self.timings.measure("diarize"):
+                    self.result = self.run()
+            else:
+                self.result = self.run()
+        except Exception as e:
+            self.error = e
+    
+    def join(self):
+        if self.thread is not None:
+            self.thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.result
\ No newline at end of file
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+import gc
+import threading
+
+ALIGN_MODEL_SIZE_MB = 360
+DIARIZE_MODEL_SIZE_MB = 120
+DEFAULT_MEMORY_BUDGET_MB = 8000
+
+class PooledModel:
+    def __init__(self, key: Hashable, model: Any, size_mb: float):
+        self.key = key
+        self.model = model
+        self.size_mb = size_mb
+        self.hits = 0
+
+class ModelPool:
+    def __init__(self, memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB):
+        self.memory_budget_mb = memory_budget_mb
+        self._models: "OrderedDict[Hashable, PooledModel]" = OrderedDict()
+        self._loading: Dict[Hashable, threading.Event] = {}
+        self._lock = threading.RLock()
+    
+    def get(self, key: Hashable, loader: Callable[[], Any], size_mb: float) -> Any:
+        while True:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    self._models.move_to_end(key)
+                    entry.hits += 1
+                    return entry.model
+                
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    break
+            loading.wait()
+        
+        try:
+            model = loader()
+            if size_mb <= 0:
+                size_mb = _estimate_size_mb(model)
+            with self._lock:
+                self._models[key] = PooledModel(key, model, size_mb)
+                self._evict_over_budget()
+            return model
+        finally:
+            with self._lock:
+                del self._loading[key]
+            loading.set()
+    
+    def contains(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._models
+    
+    def evict(self, key: Hashable) -> bool:
+        with self._lock:
+            if key not in self._models:
+                return False
+            del self._models[key]
+        _release_memory()
+        return True
+    
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+        _release_memory()
+    
+    def set_memory_budget(self, memory_budget_mb: int):
+        with self._lock:
+            self.memory_budget_mb = memory_budget_mb
+            self._evict_over_budget()
+    
+    def total_size_mb(self) -> float:
+        with self._lock:
+            return sum(entry.size_mb for entry in self._models.values())
+    
+    def get_entries(self) -> List[Tuple[Hashable, float, int]]:
+        with self._lock:
+            return [(entry.key, entry.size_mb, entry.hits) for entry in self._models.values()]
+    
+    def _evict_over_budget(self):
+        evicted = False
+        while len(self._models) > 1 and self.total_size_mb() > self.memory_budget_mb:
+            self._models.popitem(last=False)
+            evicted = True
+        if evicted:
+            _release_memory()
+
+def model_key(kind: str, *parts: Any, options: Optional[Dict[str, Any]] = None) -> Tuple:
+    frozen_options = ()
+    if options:
+        frozen_options = tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in sorted(options.items())
+        )
+    return (kind, *parts, frozen_options)
+
+def _estimate_size_mb(model: Any) -> float:
+    if isinstance(model, tuple):
+        return sum(_estimate_size_mb(part) for part in model)
+    parameters = getattr(model, "parameters", None)
+    if not callable(parameters):
+        return 0.0
+    try:
+        return sum(param.numel() * param.element_size() for param in parameters()) / (1024 * 1024)
+    except (TypeError, AttributeError):
+        return 0.0
+
+def _release_memory():
+    gc.collect()
+    try:
+        import torch
+        if torch.backends.mps.is_available():
+            torch.mps.empty_cache()
+    except ImportError:
+        pass
+
+_pool_instance = None
+
+def get_model_pool() -> ModelPool:
+    global _pool_instance
+    if _pool_instance is None:
+        _pool_instance = ModelPool()
+    return _pool_instance
\ No newline at end of file
@@ -0,0 +1,152 @@
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+import os
+
+PHONETIC_VERSION = 3
+PHONETIC_MIN_LENGTH = 5
+VOWELS = set("AEIOU")
+FRONT_VOWELS = set("EIY")
+
+def metaphone(word: str) -> str:
+    letters = "".join(char for char in word.upper() if "A" <= char <= "Z")
+    if not letters:
+        return ""
+    
+    if letters[:2] in ("KN", "GN", "PN", "AE", "WR"):
+        letters = letters[1:]
+    if letters[0] == "X":
+        letters = "S" + letters[1:]
+    if letters[:2] == "WH":
+        letters = "W" + letters[2:]
+    
+    key = []
+    length = len(letters)
+    for i, char in enumerate(letters):
+        prev = letters[i - 1] if i > 0 else ""
+        next1 = letters[i + 1] if i + 1 < length else ""
+        next2 = letters[i + 2] if i + 2 < length else ""
+        
+        if char == prev and char != "C":
+            continue
+        
+        if char in VOWELS:
+            if i == 0:
+                key.append(char)
+        elif char == "B":
+            if not (prev == "M" and i == length - 1):
+                key.append("B")
+        elif char == "C":
+            if next1 == "I" and next2 == "A":
+                key.append("X")
+            elif next1 == "H":
+                key.append("K" if prev == "S" else "X")
+            elif next1 in FRONT_VOWELS:
+                if prev != "S":
+                    key.append("S")
+            else:
+                key.append("K")
+        elif char == "D":
+            if next1 == "G" and next2 in FRONT_VOWELS:
+                key.append("J")
+            else:
+                key.append("T")
+        elif char == "G":
+            if prev == "D" and next1 in FRONT_VOWELS:
+                continue
+            if next1 == "H" and (i + 2 >= length or next2 not in VOWELS) and (i + 2 < length or prev in VOWELS):
+                continue
+            if next1 == "N" and (i + 2 == length or letters[i + 2:] == "ED"):
+                continue
+            if next1 in FRONT_VOWELS and prev != "G":
+                key.append("J")
+            else:
+                key.append("K")
+        elif char == "H":
+            if prev in "CSPTG":
+                continue
+            if prev in VOWELS and next1 not in VOWELS:
+                continue
+            key.append("H")
+        elif char == "K":
+            if prev != "C":
+                key.append("K")
+        elif char == "P":
+            key.append("F" if next1 == "H" else "P")
+        elif char == "Q":
+            key.append("K")
+        elif char == "S":
+            if next1 == "H" or (next1 == "I" and next2 in ("O", "A")):
+                key.append("X")
+            else:
+                key.append("S")
+        elif char == "T":
+            if next1 == "I" and next2 in ("O", "A"):
+                key.append("X")
+            elif next1 == "H":
+                key.append("0")
+            elif not (next1 == "C" and next2 == "H"):
+                key.append("T")
+        elif char == "V":
+            key.append("F")
+        elif char == "W" or char == "Y":
+            if next1 in VOWELS:
+                key.append(char)
+        elif char == "X":
+            key.append("KS")
+        elif char == "Z":
+            key.append("S")
+        else:
+            key.append(char)
+    
+    codes = "".join(key)
+    return "".join(code for i, code in enumerate(codes) if i == 0 or code != codes[i - 1])
+
+class PhoneticIndex:
+    def __init__(self, keys: Optional[Dict[str, int]] = None):
+        self.keys: Dict[str, int] = keys or {}
+    
+    @classmethod
+    def build(cls, terms: List[str]) -> "PhoneticIndex":
+        keys: Dict[str, int] = {}
+        for index, term in enumerate(terms):
+            if len(term) < PHONETIC_MIN_LENGTH:
+                continue
+            key = metaphone(term)
+            if key:
+                keys.setdefault(key, index)
+        return cls(keys)
+    
+    @classmethod
+    def for_profile(cls, profile_path: Path, terms: List[str]) -> "PhoneticIndex":
+        index_path = profile_path.parent / "index" / f"{profile_path.stem}.phonetic.json"
+        try:
+            stat = profile_path.stat()
+            source = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "terms": len(terms)}
+        except OSError:
+            return cls.build(terms)
+        
+        if index_path.exists():
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == PHONETIC_VERSION and data.get("source") == source:
+                    return cls(data["keys"])
+            except Exception as e:
+                print(f"Error loading phonetic index {index_path}: {e}")
+        
+        phonetic_index = cls.build(terms)
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = index_path.with_suffix(".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": PHONETIC_VERSION, "source": source, "keys": phonetic_index.keys}, f)
+            os.replace(temp_path, index_path)
+        except Exception as e:
+            print(f"Error saving phonetic index {index_path}: {e}")
+        return phonetic_index
+    
+    def lookup(self, word: str) -> Optional[int]:
+        if len(word) < PHONETIC_MIN_LENGTH:
+            return None
+        return self.keys.get(metaphone(word))
\ No newline at end of file
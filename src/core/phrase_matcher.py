@@ -0,0 +1,79 @@
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+PUNCTUATION = '.,!?;:"\'-'
+JOINERS = "-"
+
+def clean_token(token: str) -> str:
+    return token.strip(PUNCTUATION).lower()
+
+def phrase_tokens(phrase: str) -> List[str]:
+    return [token for token in (clean_token(part) for part in phrase.split()) if token]
+
+def phrase_barriers(words: Sequence[str]) -> Set[int]:
+    barriers = set()
+    for position in range(1, len(words)):
+        left, right = words[position - 1], words[position]
+        separator = left[len(left.rstrip(PUNCTUATION)):] + right[:len(right) - len(right.lstrip(PUNCTUATION))]
+        if any(char not in JOINERS for char in separator):
+            barriers.add(position)
+    return barriers
+
+class PhraseMatcher:
+    def __init__(self, phrases: Sequence[Tuple[List[str], int]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[Tuple[int, int]]] = [[]]
+        self.vocabulary = set()
+        
+        for tokens, term_index in phrases:
+            self.add(tokens, term_index)
+        self.build_links()
+    
+    def add(self, tokens: List[str], term_index: int):
+        state = 0
+        for token in tokens:
+            self.vocabulary.add(token)
+            next_state = self.goto[state].get(token)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][token] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        if not self.outputs[state]:
+            self.outputs[state].append((len(tokens), term_index))
+    
+    def build_links(self):
+        pending = deque(self.goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for token, next_state in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(token, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+                pending.append(next_state)
+    
+    def scan(self, tokens: Sequence[str], barriers: Optional[Set[int]] = None) -> List[Tuple[int, int, int]]:
+        matches = []
+        state = 0
+        for position, token in enumerate(tokens):
+            if barriers and position in barriers:
+                state = 0
+            while state and token not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(token, 0)
+            for length, term_index in self.outputs[state]:
+                matches.append((position + 1 - length, position + 1, term_index))
+        
+        matches.sort(key=lambda match: (match[0], match[0] - match[1], match[2]))
+        selected = []
+        covered = 0
+        for start, end, term_index in matches:
+            if start >= covered:
+                selected.append((start, end, term_index))
+                covered = end
+        return selected
\ No newline at end of file
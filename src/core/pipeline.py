@@ -0,0 +1,253 @@
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.utils.hashing import file_digest
+from src.core.backends import DEFAULT_BACKEND
+from src.utils.config import DEFAULT_SETTINGS
+from src.utils.timings import StageTimings
+from src.utils.tracing import Tracer, activate
+from src.utils.resources import ResourceSampler
+from src.core.worker_pool import (
+    EVENT_STARTED, EVENT_PROGRESS, EVENT_SEGMENTS, EVENT_FINISHED, EVENT_ERROR,
+    get_output_path
+)
+
+class PipelineJob:
+    def __init__(self, item_id: str, audio_path: str, settings: Dict[str, Any], queued_at: Optional[float] = None):
+        self.item_id = item_id
+        self.audio_path = audio_path
+        self.settings = settings
+        self.queued_at = queued_at
+        self.start_time = time.time()
+        self.queue_wait: Optional[float] = None
+        self.transcriber = None
+        self.audio = None
+        self.stream = None
+        self.temp_file: Optional[str] = None
+        self.content_hash: Optional[str] = None
+        self.enable_diarization = False
+        self.timings = StageTimings(self.start_time)
+        self.tracer = Tracer(audio_path, self.start_time)
+        self.diarization = None
+        self.aligned_segments: List[Dict[str, Any]] = []
+        self.segments: List[Dict[str, Any]] = []
+        self.transcript: Optional[Dict[str, Any]] = None
+        self.failed = False
+
+class TranscriptionPipeline:
+    def __init__(self, emit: Callable[[Tuple], None], cpu_threads: int = 0, queue_size: int = 2):
+        self.emit = emit
+        self.cpu_threads = cpu_threads
+        
+        self.decode_queue: "queue.Queue[Optional[PipelineJob]]" = queue.Queue(maxsize=queue_size)
+        self.asr_queue: "queue.Queue[Optional[PipelineJob]]" = queue.Queue(maxsize=queue_size)
+        self.align_queue: "queue.Queue[Optional[Tuple[PipelineJob, Optional[Tuple]]]]" = queue.Queue(maxsize=queue_size * 16)
+        self.write_queue: "queue.Queue[Optional[PipelineJob]]" = queue.Queue(maxsize=queue_size * 2)
+        
+        self.threads = [
+            threading.Thread(target=self._decode_stage, name="pipeline-decode", daemon=True),
+            threading.Thread(target=self._asr_stage, name="pipeline-asr", daemon=True),
+            threading.Thread(target=self._align_stage, name="pipeline-align", daemon=True),
+            threading.Thread(target=self._write_stage, name="pipeline-write", daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+    
+    def submit(self, item_id: str, audio_path: str, settings: Dict[str, Any], queued_at: Optional[float] = None):
+        self.decode_queue.put(PipelineJob(item_id, audio_path, settings, queued_at))
+    
+    def close(self):
+        self.decode_queue.put(None)
+        for thread in self.threads:
+            thread.join()
+    
+    def _fail(self, job: PipelineJob, error: Exception):
+        if not job.failed:
+            job.failed = True
+            if job.transcriber is not None:
+                job.transcriber.log_failure(job.audio_path, job.settings.get("beam_size", DEFAULT_SETTINGS["beam_size"]), error)
+            self.emit((EVENT_ERROR, job.item_id, str(error)))
+            if job.timings.sampler is not None:
+                job.timings.sampler.stop()
+            job.tracer.save()
+        self._discard_audio(job)
+    
+    def _discard_audio(self, job: PipelineJob):
+        job.audio = None
+        if job.stream is not None:
+            job.stream.close()
+        if job.temp_file and Path(job.temp_file).exists():
+            Path(job.temp_file).unlink()
+        job.temp_file = None
+    
+    def _decode_stage(self):
+        from src.core.transcriber import Transcriber
+        from src.core.model_pool import get_model_pool
+        
+        while True:
+            job = self.decode_queue.get()
+            if job is None:
+                self.asr_queue.put(None)
+                return
+            
+            job.start_time = time.time()
+            job.timings = StageTimings(job.start_time, ResourceSampler().start())
+            job.tracer = Tracer(job.audio_path, job.start_time)
+            if job.queued_at is not None:
+                job.queue_wait = max(0.0, job.start_time - job.queued_at)
+            self.emit((EVENT_STARTED, job.item_id, os.getpid()))
+            with activate(job.tracer):
+                try:
+                    self.emit((EVENT_PROGRESS, job.item_id, 10, "Decoding audio..."))
+                    get_model_pool().set_memory_budget(job.settings.get("model_memory_budget_mb", DEFAULT_SETTINGS["model_memory_budget_mb"]))
+                    job.transcriber = Transcriber(
+                        model_name=job.settings["model"],
+                        device="cpu",
+                        compute_type=job.settings["compute_type"],
+                        cpu_threads=self.cpu_threads,
+                        shard_workers=job.settings.get("shard_workers", DEFAULT_SETTINGS["shard_workers"]),
+                        shard_seconds=job.settings.get("shard_seconds", DEFAULT_SETTINGS["shard_seconds"]),
+                        shard_min_duration=job.settings.get("shard_min_duration", DEFAULT_SETTINGS["shard_min_duration"]),
+                        pcm_cache_mb=job.settings.get("pcm_cache_mb", DEFAULT_SETTINGS["pcm_cache_mb"]),
+                        stream_window_seconds=job.settings.get("stream_window_seconds", DEFAULT_SETTINGS["stream_window_seconds"]),
+                        align_batch_size=job.settings.get("align_batch_size", DEFAULT_SETTINGS["align_batch_size"]),
+                        backend=job.settings.get("backend", DEFAULT_BACKEND)
+                    )
+                    job.enable_diarization = job.transcriber.diarization_enabled(job.settings["enable_diarization"])
+                    with job.timings.measure("decode"):
+                        if job.transcriber.stream_window_seconds > 0:
+                            job.stream = job.transcriber.open_stream(job.audio_path)
+                        else:
+                            job.audio, job.temp_file = job.transcriber.prepare_audio(job.audio_path)
+                            job.content_hash = file_digest(job.audio_path)
+                except Exception as e:
+                    self._fail(job, e)
+                    continue
+            
+            self.asr_queue.put(job)
+    
+    def _asr_stage(self):
+        while True:
+            job = self.asr_queue.get()
+            if job is None:
+                self.align_queue.put(None)
+                return
+            
+            with activate(job.tracer):
+                try:
+                    self.emit((EVENT_PROGRESS, job.item_id, 30, "Transcribing audio..."))
+                    with job.timings.measure("load_models"):
+                        job.transcriber.load_model(job.settings["beam_size"])
+                    self._start_diarization(job)
+                    if job.stream is not None:
+                        chunks = job.transcriber.iter_stream_chunks(job.stream, job.settings["batch_size"])
+                    else:
+                        chunks = (
+                            (chunk, job.audio, 0.0)
+                            for chunk in job.transcriber.iter_asr_chunks(
+                                job.audio,
+                                job.settings["batch_size"],
+                                job.content_hash
+                            )
+                        )
+                    for chunk in job.timings.measure_iter("asr", chunks):
+                        self.align_queue.put((job, chunk))
+                except Exception as e:
+                    self._fail(job, e)
+            
+            self.align_queue.put((job, None))
+    
+    def _align_stage(self):
+        while True:
+            entry = self.align_queue.get()
+            if entry is None:
+                self.write_queue.put(None)
+                return
+            
+            job, chunk = entry
+            if job.failed:
+                continue
+            
+            with activate(job.tracer):
+                try:
+                    if chunk is not None:
+                        asr_segments, chunk_audio, time_offset = chunk
+                        with job.timings.measure("align"):
+                            aligned, segments = job.transcriber.process_chunk(
+                                asr_segments,
+                                chunk_audio,
+                                enable_vocabulary=job.settings.get("enable_vocabulary", DEFAULT_SETTINGS["enable_vocabulary"]),
+                                vocabulary_profile=job.settings.get("vocabulary_profile", DEFAULT_SETTINGS["vocabulary_profile"]),
+                                vocabulary_threshold=job.settings.get("vocabulary_threshold", DEFAULT_SETTINGS["vocabulary_threshold"]),
+                                time_offset=time_offset,
+                                vocabulary_fuzzy_phrases=job.settings.get("vocabulary_fuzzy_phrases", DEFAULT_SETTINGS["vocabulary_fuzzy_phrases"]),
+                                vocabulary_phonetic=job.settings.get("vocabulary_phonetic", DEFAULT_SETTINGS["vocabulary_phonetic"])
+                            )
+                        job.aligned_segments.extend(aligned)
+                        job.segments.extend(segments)
+                        if segments:
+                            self.emit((EVENT_SEGMENTS, job.item_id, [dict(seg) for seg in segments]))
+                        continue
+                    
+                    self._finish(job)
+                except Exception as e:
+                    self._fail(job, e)
+                    continue
+            
+            self._discard_audio(job)
+            self.write_queue.put(job)
+    
+    def _start_diarization(self, job: PipelineJob):
+        hf_token = job.settings["hf_token"] if job.settings["hf_token"] else None
+        if not (job.enable_diarization and hf_token):
+            return
+        job.diarization = job.transcriber.start_diarization(job.audio, hf_token, job.timings)
+    
+    def _finish(self, job: PipelineJob):
+        settings = job.settings
+        enable_diarization = job.enable_diarization
+        
+        if job.diarization is not None:
+            self.emit((EVENT_PROGRESS, job.item_id, 70, "Assigning speakers..."))
+            with job.timings.measure("diarize_wait"):
+                diarize_segments = job.diarization.join()
+            with job.timings.measure("assign_speakers"):
+                job.transcriber.assign_speakers(diarize_segments, job.aligned_segments, job.segments)
+            job.diarization = None
+        
+        total_samples = len(job.audio) if job.audio is not None else job.stream.total_samples
+        job.transcript = job.transcriber.build_output(
+            job.audio_path,
+            total_samples / 16000.0,
+            job.segments,
+            time.time() - job.start_time,
+            settings["beam_size"],
+            settings["batch_size"],
+            enable_diarization,
+            settings.get("enable_vocabulary", DEFAULT_SETTINGS["enable_vocabulary"]),
+            job.timings,
+            preset=settings.get("preset"),
+            queue_wait=job.queue_wait
+        )
+    
+    def _write_stage(self):
+        while True:
+            job = self.write_queue.get()
+            if job is None:
+                return
+            
+            with activate(job.tracer):
+                try:
+                    self.emit((EVENT_PROGRESS, job.item_id, 90, "Saving transcript..."))
+                    output_path = get_output_path(job.settings, job.audio_path)
+                    job.transcriber.save_transcript(job.transcript, output_path)
+                    job.transcriber.release_models()
+                    job.tracer.save()
+                    
+                    self.emit((EVENT_PROGRESS, job.item_id, 100, "Complete"))
+                    self.emit((EVENT_FINISHED, job.item_id, job.transcript, output_path))
+                except Exception as e:
+                    self._fail(job, e)
\ No newline at end of file
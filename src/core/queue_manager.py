@@ -1,13 +1,21 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List
+from typing import Callable, Optional, List, Dict, Any
 from pathlib import Path
+import time
+from src.core.transcript_index import TranscriptIndex, copy_transcript
+from src.utils.hashing import file_digest
+
+HASH_WORKERS = 2
 
 class QueueStatus(Enum):
+    HASHING = "hashing"
     QUEUED = "queued"
     PROCESSING = "processing"
     COMPLETE = "complete"
     ERROR = "error"
+    CACHED = "cached"
 
 @dataclass
 class QueueItem:
@@ -21,17 +29,33 @@ class QueueItem:
     batch_size: int = 8
     error_message: Optional[str] = None
     output_path: Optional[str] = None
+    content_hash: Optional[str] = None
+    settings: Optional[Dict[str, Any]] = None
+    queued_at: float = field(default_factory=time.time)
     
     @property
     def filename(self):
         return Path(self.file_path).name
 
 class QueueManager:
-    def __init__(self):
+    def __init__(
+        self,
+        transcript_index: Optional[TranscriptIndex] = None,
+        on_item_ready: Optional[Callable[[QueueItem], None]] = None
+    ):
         self.items: List[QueueItem] = []
         self._id_counter = 0
+        self.transcript_index = transcript_index
+        self.on_item_ready = on_item_ready
+        self._hash_executor: Optional[ThreadPoolExecutor] = None
         
-    def add_item(self, file_path: str, preset: str = "Balanced", model: str = "base") -> QueueItem:
+    def add_item(
+        self,
+        file_path: str,
+        preset: str = "Balanced",
+        model: str = "base",
+        settings: Optional[Dict[str, Any]] = None
+    ) -> QueueItem:
         self._id_counter += 1
         item = QueueItem(
             id=str(self._id_counter),
@@ -40,9 +64,70 @@ class QueueManager:
             preset=preset,
             model=model
         )
+        
+        if settings is not None and self.transcript_index is not None:
+            item.status = QueueStatus.HASHING
+            if self._hash_executor is None:
+                self._hash_executor = ThreadPoolExecutor(HASH_WORKERS, thread_name_prefix="hash")
+            self._hash_executor.submit(self._hash_item, item, dict(settings))
+            
         self.items.append(item)
         return item
         
+    def _hash_item(self, item: QueueItem, settings: Dict[str, Any]):
+        try:
+            self._reuse_cached(item, settings)
+        except Exception as e:
+            print(f"Error checking transcript cache for {item.file_path}: {e}")
+        finally:
+            if item.status == QueueStatus.HASHING:
+                item.status = QueueStatus.QUEUED
+            if self.on_item_ready is not None:
+                self.on_item_ready(item)
+                
+    @property
+    def hashing_count(self) -> int:
+        return sum(1 for item in self.items if item.status == QueueStatus.HASHING)
+        
+    def _reuse_cached(self, item: QueueItem, settings: Dict[str, Any]):
+        assert self.transcript_index is not None
+        try:
+            item.content_hash = file_digest(item.file_path)
+        except OSError as e:
+            print(f"Error hashing {item.file_path}: {e}")
+            return
+            
+        cached_path = self.transcript_index.lookup(item.content_hash, settings)
+        if not cached_path:
+            return
+            
+        output_path = f"{settings['output_dir']}/{Path(item.file_path).stem}_transcript.json"
+        try:
+            item.output_path = copy_transcript(cached_path, output_path)
+        except OSError as e:
+            print(f"Error reusing cached transcript: {e}")
+            return
+            
+        item.settings = dict(settings)
+        item.status = QueueStatus.CACHED
+        item.progress = 100
+        
+    def start_item(self, item_id: str, settings: Dict[str, Any]):
+        item = self.get_item(item_id)
+        if item:
+            item.settings = dict(settings)
+            item.status = QueueStatus.PROCESSING
+            item.progress = 0
+            
+    def record_output(self, item_id: str, output_path: str):
+        item = self.get_item(item_id)
+        if not item:
+            return
+            
+        item.output_path = output_path
+        if self.transcript_index is not None and item.content_hash and item.settings:
+            self.transcript_index.record(item.content_hash, item.settings, output_path, item.filename)
+        
     def get_next_queued(self) -> Optional[QueueItem]:
         for item in self.items:
             if item.status == QueueStatus.QUEUED:
@@ -59,10 +144,18 @@ class QueueManager:
                 break
                 
     def clear_completed(self):
-        self.items = [item for item in self.items if item.status != QueueStatus.COMPLETE]
+        self.items = [
+            item for item in self.items
+            if item.status not in (QueueStatus.COMPLETE, QueueStatus.CACHED)
+        ]
         
     def get_item(self, item_id: str) -> Optional[QueueItem]:
         for item in self.items:
             if item.id == item_id:
                 return item
-        return None
\ No newline at end of file
+        return None
+        
+    def shutdown(self):
+        if self._hash_executor is not None:
+            self._hash_executor.shutdown(wait=False, cancel_futures=True)
+            self._hash_executor = None
\ No newline at end of file
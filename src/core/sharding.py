@@ -0,0 +1,138 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import multiprocessing
+import sys
+import threading
+import numpy as np
+
+SAMPLE_RATE = 16000
+CUT_WINDOW = 0.25
+
+_executors: Dict[Tuple, ProcessPoolExecutor] = {}
+_executors_lock = threading.Lock()
+_shard_transcriber = None
+
+def fit_shard_workers(workers: int, model_size_mb: float, free_mb: float) -> int:
+    if model_size_mb <= 0:
+        return workers
+    return max(0, min(workers, int(free_mb // model_size_mb)))
+
+def plan_shards(vad_segments: List[Dict[str, Any]], shard_seconds: float) -> List[List[Dict[str, Any]]]:
+    shards = []
+    current: List[Dict[str, Any]] = []
+    
+    for seg in vad_segments:
+        if current and seg["end"] - current[0]["start"] > shard_seconds:
+            cut = _best_cut(current, seg, shard_seconds)
+            shards.append(current[:cut])
+            current = current[cut:]
+        current.append(seg)
+    
+    if current:
+        shards.append(current)
+    return shards
+
+def _best_cut(current: List[Dict[str, Any]], next_seg: Dict[str, Any], shard_seconds: float) -> int:
+    shard_start = current[0]["start"]
+    best_cut = len(current)
+    best_gap = next_seg["start"] - current[-1]["end"]
+    
+    for cut in range(len(current) - 1, 0, -1):
+        if current[cut - 1]["end"] - shard_start < shard_seconds * (1 - CUT_WINDOW):
+            break
+        gap = current[cut]["start"] - current[cut - 1]["end"]
+        if gap > best_gap:
+            best_cut = cut
+            best_gap = gap
+    return best_cut
+
+def shard_bounds(shard: List[Dict[str, Any]], total_samples: int) -> Tuple[int, int]:
+    start = int(shard[0]["start"] * SAMPLE_RATE)
+    end = min(int(shard[-1]["end"] * SAMPLE_RATE) + 1, total_samples)
+    return start, end
+
+def _init_shard_worker(backend: str, model_name: str, device: str, compute_type: str, beam_size: int, cpu_threads: int):
+    global _shard_transcriber
+    from src.core.transcriber import Transcriber
+    
+    try:
+        import torch
+        torch.set_num_threads(cpu_threads)
+    except ImportError:
+        pass
+    
+    _shard_transcriber = Transcriber(
+        model_name=model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        backend=backend
+    )
+    _shard_transcriber.load_model(beam_size)
+
+def _decode_shard(
+    audio: Union[np.ndarray, str],
+    sample_offset: int,
+    vad_segments: List[Dict[str, Any]],
+    batch_size: int
+) -> List[Dict[str, Any]]:
+    assert _shard_transcriber is not None
+    if isinstance(audio, str):
+        start, end = shard_bounds(vad_segments, sys.maxsize)
+        audio = np.memmap(audio, dtype=np.float32, mode="r")[start:end]
+    
+    segments = []
+    for batch in _shard_transcriber.decode_speech(audio, vad_segments, batch_size, sample_offset=sample_offset):
+        segments.extend(batch)
+    return segments
+
+def get_shard_executor(
+    backend: str,
+    model_name: str,
+    device: str,
+    compute_type: str,
+    beam_size: int,
+    workers: int,
+    cpu_threads: int
+) -> ProcessPoolExecutor:
+    key = (backend, model_name, device, compute_type, beam_size, workers, cpu_threads)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            for stale in _executors.values():
+                stale.shutdown(wait=False)
+            _executors.clear()
+            
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_shard_worker,
+                initargs=(backend, model_name, device, compute_type, beam_size, cpu_threads)
+            )
+            _executors[key] = executor
+        return executor
+
+def decode_sharded(
+    executor: ProcessPoolExecutor,
+    audio: np.ndarray,
+    shards: List[List[Dict[str, Any]]],
+    batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    mapped_file = None
+    if isinstance(audio, np.memmap) and audio.filename and audio.offset == 0:
+        mapped_file = str(audio.filename)
+    
+    futures = []
+    for shard in shards:
+        start, end = shard_bounds(shard, len(audio))
+        source = mapped_file if mapped_file else audio[start:end]
+        futures.append(executor.submit(_decode_shard, source, start, shard, batch_size))
+    
+    try:
+        for future in futures:
+            segments = future.result()
+            for index in range(0, len(segments), max(batch_size, 1)):
+                yield segments[index:index + max(batch_size, 1)]
+    finally:
+        for future in futures:
+            future.cancel()
\ No newline at end of file
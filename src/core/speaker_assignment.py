@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Tuple
+import numpy as np
+
+class SpeakerTurns:
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, speakers: np.ndarray):
+        order = np.argsort(starts, kind="stable")
+        self.starts = np.asarray(starts, dtype=np.float64)[order]
+        self.ends = np.asarray(ends, dtype=np.float64)[order]
+        self.labels, self.codes = np.unique(np.asarray(speakers, dtype=object)[order], return_inverse=True)
+    
+    @classmethod
+    def from_diarization(cls, diarization) -> "SpeakerTurns":
+        if hasattr(diarization, "itertracks"):
+            turns = [(turn.start, turn.end, label) for turn, _, label in diarization.itertracks(yield_label=True)]
+            starts = np.array([turn[0] for turn in turns], dtype=np.float64)
+            ends = np.array([turn[1] for turn in turns], dtype=np.float64)
+            speakers = np.array([turn[2] for turn in turns], dtype=object)
+            return cls(starts, ends, speakers)
+        return cls(
+            diarization["start"].to_numpy(dtype=np.float64),
+            diarization["end"].to_numpy(dtype=np.float64),
+            diarization["speaker"].to_numpy(dtype=object)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def assign(self, starts: np.ndarray, ends: np.ndarray, fill_nearest: bool = False) -> np.ndarray:
+        if len(starts) == 0 or len(self) == 0:
+            return np.full(len(starts), -1, dtype=np.int64)
+        if fill_nearest:
+            return self._assign_nearest(starts, ends)
+        return self._assign_overlapping(starts, ends)
+    
+    def _assign_overlapping(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        word_order = np.argsort(starts, kind="stable")
+        covering_turns, covered = _expand_ranges(
+            np.searchsorted(starts[word_order], self.starts, side="right"),
+            np.searchsorted(starts[word_order], self.ends, side="left")
+        )
+        inner_items, inner_turns = _expand_ranges(
+            np.searchsorted(self.starts, starts, side="left"),
+            np.searchsorted(self.starts, ends, side="left")
+        )
+        item_index = np.concatenate((word_order[covered], inner_items))
+        turn_index = np.concatenate((covering_turns, inner_turns))
+        
+        overlap = (
+            np.minimum(self.ends[turn_index], ends[item_index])
+            - np.maximum(self.starts[turn_index], starts[item_index])
+        )
+        hit = overlap > 0
+        item_index = item_index[hit]
+        speaker_count = len(self.labels)
+        flat = item_index * speaker_count + self.codes[turn_index[hit]]
+        
+        totals = np.bincount(flat, weights=overlap[hit], minlength=len(starts) * speaker_count)
+        totals = totals.reshape(len(starts), speaker_count)
+        hits = np.bincount(item_index, minlength=len(starts)) > 0
+        return np.where(hits, np.argmax(totals, axis=1), -1)
+    
+    def _assign_nearest(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        totals = np.empty((len(starts), len(self.labels)), dtype=np.float64)
+        for code in range(len(self.labels)):
+            mask = self.codes == code
+            speaker_starts = np.sort(self.starts[mask])
+            speaker_ends = np.sort(self.ends[mask])
+            start_sums = np.concatenate(([0.0], np.cumsum(speaker_starts)))
+            end_sums = np.concatenate(([0.0], np.cumsum(speaker_ends)))
+            
+            below = np.searchsorted(speaker_ends, ends, side="left")
+            min_end_sum = end_sums[below] + ends * (len(speaker_ends) - below)
+            above = np.searchsorted(speaker_starts, starts, side="right")
+            max_start_sum = (start_sums[-1] - start_sums[above]) + starts * above
+            totals[:, code] = min_end_sum - max_start_sum
+        return np.argmax(totals, axis=1)
+
+def _expand_ranges(first: np.ndarray, last: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    counts = np.maximum(last - first, 0)
+    owners = np.repeat(np.arange(len(first)), counts)
+    group_start = np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, np.repeat(first, counts) + np.arange(counts.sum()) - group_start
+
+def _timed_items(items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], np.ndarray, np.ndarray]:
+    timed = [item for item in items if "start" in item]
+    starts = np.array([item["start"] for item in timed], dtype=np.float64)
+    ends = np.array([item["end"] for item in timed], dtype=np.float64)
+    return timed, starts, ends
+
+def _apply(turns: SpeakerTurns, items: List[Dict[str, Any]], fill_nearest: bool):
+    timed, starts, ends = _timed_items(items)
+    for item, code in zip(timed, turns.assign(starts, ends, fill_nearest)):
+        if code >= 0:
+            item["speaker"] = turns.labels[code]
+
+def assign_word_speakers(diarization, transcript_result: Dict[str, Any], fill_nearest: bool = False) -> Dict[str, Any]:
+    turns = diarization if isinstance(diarization, SpeakerTurns) else SpeakerTurns.from_diarization(diarization)
+    segments = transcript_result["segments"]
+    
+    _apply(turns, segments, fill_nearest)
+    words = [word for seg in segments for word in seg.get("words", [])]
+    _apply(turns, words, fill_nearest)
+    return transcript_result
\ No newline at end of file
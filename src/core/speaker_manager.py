@@ -1,30 +1,41 @@
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 import json
-import torch
+import os
 import numpy as np
-from pyannote.audio import Inference
-from pyannote.core import SlidingWindowFeature
+
+if TYPE_CHECKING:
+    import torch
+    from pyannote.audio import Inference
 
 class SpeakerProfile:
-    def __init__(self, name: str, embedding: torch.Tensor, reference_path: str):
+    def __init__(self, name: str, embedding: np.ndarray, reference_path: str):
         self.name = name
         self.embedding = embedding
         self.reference_path = reference_path
 
 class SpeakerManager:
-    def __init__(self, profiles_dir: Optional[str] = None):
+    def __init__(self, profiles_dir: Optional[str] = None, dtype=np.float32):
         if profiles_dir:
             self.profiles_dir = Path(profiles_dir)
         else:
             self.profiles_dir = Path.home() / "Library" / "Application Support" / "TranscriptionTool" / "speakers"
         
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        self.matrix_path = self.profiles_dir / "profiles.npy"
+        self.index_path = self.profiles_dir / "index.json"
+        self.legacy_dir = self.profiles_dir / "legacy"
+        self.dtype = np.dtype(dtype)
+        
         self.profiles: Dict[str, SpeakerProfile] = {}
-        self.inference_model: Optional[Inference] = None
+        self.matrix = np.zeros((0, 0), dtype=self.dtype)
+        self.names: List[str] = []
+        self._normalized: Optional[np.ndarray] = None
+        self.inference_model: Optional["Inference"] = None
         
     def load_inference_model(self, hf_token: str):
         if self.inference_model is None:
+            from pyannote.audio import Inference
             self.inference_model = Inference(
                 "pyannote/embedding",
                 use_auth_token=hf_token
@@ -32,6 +43,8 @@ class SpeakerManager:
             
     def create_profile(self, name: str, audio_path: str, hf_token: str) -> bool:
         try:
+            import torch
+            from pyannote.core import SlidingWindowFeature
             self.load_inference_model(hf_token)
             
             if self.inference_model is None:
@@ -40,59 +53,133 @@ class SpeakerManager:
             embedding_result = self.inference_model(audio_path)
             
             if isinstance(embedding_result, SlidingWindowFeature):
-                embedding_array = embedding_result.data
-                avg_embedding = torch.tensor(np.mean(embedding_array, axis=0))
-            elif isinstance(embedding_result, np.ndarray):
-                if len(embedding_result.shape) > 1:
-                    avg_embedding = torch.tensor(np.mean(embedding_result, axis=0))
-                else:
-                    avg_embedding = torch.tensor(embedding_result)
+                avg_embedding = np.mean(embedding_result.data, axis=0)
             elif isinstance(embedding_result, torch.Tensor):
                 if len(embedding_result.shape) > 1:
-                    avg_embedding = embedding_result.mean(dim=0)
+                    avg_embedding = embedding_result.mean(dim=0).cpu().numpy()
                 else:
-                    avg_embedding = embedding_result
+                    avg_embedding = embedding_result.cpu().numpy()
             else:
-                avg_embedding = torch.tensor(embedding_result)
-            
-            profile_data = {
-                "name": name,
-                "embedding": avg_embedding.tolist(),
-                "reference_path": audio_path
-            }
-            
-            profile_path = self.profiles_dir / f"{name}.json"
-            with open(profile_path, 'w') as f:
-                json.dump(profile_data, f)
-                
-            self.profiles[name] = SpeakerProfile(
-                name=name,
-                embedding=avg_embedding,
-                reference_path=audio_path
-            )
+                embedding_array = np.asarray(embedding_result)
+                if len(embedding_array.shape) > 1:
+                    avg_embedding = np.mean(embedding_array, axis=0)
+                else:
+                    avg_embedding = embedding_array
             
+            self.add_profile(name, avg_embedding, audio_path)
             return True
         except Exception as e:
             print(f"Error creating speaker profile: {e}")
             return False
-            
-    def load_profiles(self):
-        self.profiles.clear()
+    
+    def add_profile(self, name: str, embedding: np.ndarray, reference_path: str):
+        self.load_store()
+        entries = self.read_index()
+        vectors = [np.asarray(self.matrix[row]) for row in range(len(entries))]
+        
+        entry = {"name": name, "reference_path": reference_path}
+        if name in self.names:
+            row = self.names.index(name)
+            entries[row] = entry
+            vectors[row] = embedding
+        else:
+            entries.append(entry)
+            vectors.append(embedding)
+        
+        self.write_store(entries, vectors)
+        self.load_profiles()
+    
+    def read_index(self) -> List[Dict[str, str]]:
+        if not self.index_path.exists():
+            return []
+        with open(self.index_path, 'r') as f:
+            return json.load(f)
+    
+    def write_store(self, entries: List[Dict[str, str]], vectors: List[np.ndarray]):
+        dims = {len(vector) for vector in vectors}
+        if len(dims) > 1:
+            raise ValueError(f"Embedding sizes differ: {sorted(dims)}")
+        matrix = np.array(vectors, dtype=self.dtype).reshape(len(vectors), dims.pop() if dims else 0)
+        
+        self.matrix = np.zeros((0, 0), dtype=self.dtype)
+        temp_matrix = self.matrix_path.with_name("profiles.tmp.npy")
+        temp_index = self.index_path.with_suffix(".tmp")
+        np.save(temp_matrix, matrix)
+        with open(temp_index, 'w') as f:
+            json.dump(entries, f)
+        os.replace(temp_matrix, self.matrix_path)
+        os.replace(temp_index, self.index_path)
+    
+    def migrate_json_profiles(self):
+        legacy_files = [path for path in self.profiles_dir.glob("*.json") if path != self.index_path]
+        if not legacy_files:
+            return
         
-        for profile_file in self.profiles_dir.glob("*.json"):
+        self.load_store()
+        entries = self.read_index()
+        vectors = [np.asarray(self.matrix[row]) for row in range(len(entries))]
+        names = [entry["name"] for entry in entries]
+        
+        migrated = []
+        for profile_file in sorted(legacy_files):
             try:
                 with open(profile_file, 'r') as f:
                     data = json.load(f)
-                    
-                embedding = torch.tensor(data["embedding"])
-                
-                self.profiles[data["name"]] = SpeakerProfile(
-                    name=data["name"],
-                    embedding=embedding,
-                    reference_path=data["reference_path"]
-                )
+                entry = {"name": data["name"], "reference_path": data["reference_path"]}
+                embedding = np.asarray(data["embedding"], dtype=np.float32)
+                if data["name"] in names:
+                    entries[names.index(data["name"])] = entry
+                    vectors[names.index(data["name"])] = embedding
+                else:
+                    names.append(data["name"])
+                    entries.append(entry)
+                    vectors.append(embedding)
+                migrated.append(profile_file)
             except Exception as e:
-                print(f"Error loading profile {profile_file}: {e}")
+                print(f"Error migrating profile {profile_file}: {e}")
+        
+        if not migrated:
+            return
+        self.write_store(entries, vectors)
+        self.legacy_dir.mkdir(exist_ok=True)
+        for profile_file in migrated:
+            os.replace(profile_file, self.legacy_dir / profile_file.name)
+    
+    def load_store(self):
+        self._normalized = None
+        if not self.matrix_path.exists() or not self.index_path.exists():
+            self.matrix = np.zeros((0, 0), dtype=self.dtype)
+            self.names = []
+            return
+        
+        self.names = [entry["name"] for entry in self.read_index()]
+        if len(self.names) == 0:
+            self.matrix = np.zeros((0, 0), dtype=self.dtype)
+            return
+        self.matrix = np.load(self.matrix_path, mmap_mode="r")
+        if len(self.matrix) != len(self.names):
+            print(f"Error loading profiles: {len(self.names)} names for {len(self.matrix)} embeddings")
+            count = min(len(self.matrix), len(self.names))
+            self.matrix = self.matrix[:count]
+            self.names = self.names[:count]
+            
+    def load_profiles(self):
+        self.profiles.clear()
+        
+        try:
+            self.migrate_json_profiles()
+            self.load_store()
+            entries = self.read_index()[:len(self.names)]
+        except Exception as e:
+            print(f"Error loading profiles: {e}")
+            return
+        
+        for row, entry in enumerate(entries):
+            self.profiles[entry["name"]] = SpeakerProfile(
+                name=entry["name"],
+                embedding=self.matrix[row],
+                reference_path=entry["reference_path"]
+            )
                 
     def get_profile(self, name: str) -> Optional[SpeakerProfile]:
         return self.profiles.get(name)
@@ -101,16 +188,54 @@ class SpeakerManager:
         return list(self.profiles.keys())
         
     def delete_profile(self, name: str) -> bool:
-        profile_path = self.profiles_dir / f"{name}.json"
         try:
-            if profile_path.exists():
-                profile_path.unlink()
-            if name in self.profiles:
-                del self.profiles[name]
+            self.load_store()
+            if name in self.names:
+                row = self.names.index(name)
+                entries = self.read_index()
+                vectors = [np.asarray(self.matrix[index]) for index in range(len(entries)) if index != row]
+                del entries[row]
+                self.write_store(entries, vectors)
+            self.load_profiles()
             return True
         except Exception as e:
             print(f"Error deleting profile: {e}")
             return False
+    
+    def get_normalized_matrix(self) -> np.ndarray:
+        if self._normalized is None:
+            matrix = np.asarray(self.matrix, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._normalized = matrix / np.maximum(norms, 1e-12)
+        return self._normalized
+    
+    def similarity(self, embeddings: Union[np.ndarray, "torch.Tensor"]) -> np.ndarray:
+        if hasattr(embeddings, "detach"):
+            embeddings = embeddings.detach().cpu().numpy()
+        queries = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        
+        profiles = self.get_normalized_matrix()
+        if len(profiles) == 0:
+            return np.zeros((len(queries), 0), dtype=np.float32)
+        return queries @ profiles.T
+    
+    def match(
+        self,
+        embeddings: Union[np.ndarray, "torch.Tensor"],
+        threshold: float = 0.0
+    ) -> List[Tuple[Optional[str], float]]:
+        scores = self.similarity(embeddings)
+        if scores.shape[1] == 0:
+            return [(None, 0.0) for _ in range(len(scores))]
+        
+        best = np.argmax(scores, axis=1)
+        best_scores = scores[np.arange(len(scores)), best]
+        return [
+            (self.names[index] if score >= threshold else None, float(score))
+            for index, score in zip(best, best_scores)
+        ]
             
-    def get_embeddings_dict(self) -> Dict[str, torch.Tensor]:
-        return {name: profile.embedding for name, profile in self.profiles.items()}
\ No newline at end of file
+    def get_embeddings_dict(self) -> Dict[str, "torch.Tensor"]:
+        import torch
+        return {name: torch.from_numpy(np.array(profile.embedding, dtype=np.float32)) for name, profile in self.profiles.items()}
\ No newline at end of file
@@ -1,61 +1,453 @@
-import whisperx
-import torch
 import json
+import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterator, Generator, Callable, Union
+from src.core.backends import SAMPLE_RATE, DEFAULT_BACKEND, get_backend
 from src.core.vocabulary_processor import VocabularyProcessor
+from src.core.model_manager import MODEL_INFO
+from src.core.model_pool import (
+    ModelPool, get_model_pool, model_key,
+    ALIGN_MODEL_SIZE_MB, DIARIZE_MODEL_SIZE_MB
+)
 from src.utils.logger import get_logger
+from src.utils.timings import StageTimings
+from src.utils.resources import ResourceSampler
+from src.utils.tracing import Tracer, activate, current_tracer, span
+from src.core.vad_cache import get_vad_cache
+from src.core.diarization import DiarizationTask
+from src.core.speaker_assignment import assign_word_speakers
+from src.core.sharding import plan_shards, fit_shard_workers, get_shard_executor, decode_sharded
 from src.utils.preprocessing import extract_audio_if_video
+from src.utils.hashing import file_digest
+from src.utils.audio_cache import get_pcm_cache
+from src.utils.audio_stream import AudioStream, STREAM_MARGIN_SECONDS, MIN_STREAM_WINDOW_SECONDS
 import time
+import os
 
 class Transcriber:
-    def __init__(self, model_name: str = "large-v3", device: str = "cpu", compute_type: str = "int8"):
+    def __init__(
+        self,
+        model_name: str = "large-v3",
+        device: str = "cpu",
+        compute_type: str = "int8",
+        model_pool: Optional[ModelPool] = None,
+        cpu_threads: int = 0,
+        shard_workers: int = 0,
+        shard_seconds: float = 600,
+        shard_min_duration: float = 1800,
+        pcm_cache_mb: int = 0,
+        stream_window_seconds: float = 0,
+        align_batch_size: int = 8,
+        backend: str = DEFAULT_BACKEND
+    ):
         self.model_name = model_name
         self.device = device
         self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.shard_workers = shard_workers
+        self.shard_seconds = shard_seconds
+        self.shard_min_duration = shard_min_duration
+        self.pcm_cache_mb = pcm_cache_mb
+        self.stream_window_seconds = stream_window_seconds
+        self.align_batch_size = align_batch_size
+        self.backend_name = backend
+        self.backend = get_backend(backend)
         self.model = None
         self.align_model = None
         self.align_metadata = None
         self.diarize_model = None
         self.beam_size = 5
+        self.model_pool = model_pool or get_model_pool()
+        self.model_keys: Dict[str, tuple] = {}
         self.vocab_processor = VocabularyProcessor()
+        self.vad_cache = get_vad_cache()
         self.logger = get_logger()
         
+    def get_asr_options(self, beam_size: int) -> Dict[str, Any]:
+        return {
+            "beam_size": beam_size,
+            "best_of": 5,
+            "patience": 1,
+            "length_penalty": 1,
+            "temperatures": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        }
+        
     def load_model(self, beam_size: int = 5):
-        if self.model is None:
-            self.beam_size = beam_size
-            self.model = whisperx.load_model(
-                self.model_name,
-                device=self.device,
-                compute_type=self.compute_type,
-                language="en",
-                asr_options={
-                    "beam_size": beam_size,
-                    "best_of": 5,
-                    "patience": 1,
-                    "length_penalty": 1,
-                    "temperatures": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                }
+        asr_options = self.get_asr_options(beam_size)
+        key = model_key("asr", self.backend_name, self.model_name, self.device, self.compute_type, self.cpu_threads, options=asr_options)
+        if self.model is None or self.model_keys.get("asr") != key:
+            self.model = self.model_pool.get(
+                key,
+                lambda: self.backend.load_asr_model(
+                    self.model_name,
+                    self.device,
+                    self.compute_type,
+                    asr_options,
+                    self.cpu_threads or 4
+                ),
+                MODEL_INFO[self.model_name].size_mb if self.model_name in MODEL_INFO else 0
             )
+            self.model_keys["asr"] = key
+            self.beam_size = beam_size
     
     def load_align_model(self):
         if self.align_model is None:
-            self.align_model, self.align_metadata = whisperx.load_align_model(
-                language_code="en",
-                device=self.device
+            key = model_key("align", self.backend_name, "en", self.device)
+            self.align_model, self.align_metadata = self.model_pool.get(
+                key,
+                lambda: self.backend.load_align_model("en", self.device),
+                ALIGN_MODEL_SIZE_MB
             )
+            self.model_keys["align"] = key
     
     def load_diarize_model(self, hf_token: Optional[str] = None):
         if self.diarize_model is None and hf_token:
-            from pyannote.audio import Pipeline
-            self.diarize_model = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
-                use_auth_token=hf_token
+            key = model_key("diarize", self.backend_name, "pyannote/speaker-diarization-3.1", self.device)
+            self.diarize_model = self.model_pool.get(
+                key,
+                lambda: self.backend.load_diarize_model(hf_token, self.device),
+                DIARIZE_MODEL_SIZE_MB
             )
-            self.diarize_model.to(torch.device(self.device))
+            self.model_keys["diarize"] = key
     
-    def transcribe(
+    def prepare_audio(self, audio_path: str) -> Tuple[np.ndarray, Optional[str]]:
+        if self.pcm_cache_mb > 0:
+            pcm_cache = get_pcm_cache()
+            pcm_cache.set_max_size(self.pcm_cache_mb)
+            return pcm_cache.load(audio_path), None
+        
+        processed_path, temp_file = extract_audio_if_video(audio_path)
+        try:
+            audio = self.backend.load_audio(processed_path)
+        except Exception:
+            if temp_file and Path(temp_file).exists():
+                Path(temp_file).unlink()
+            raise
+        return audio, temp_file
+    
+    def open_stream(self, audio_path: str) -> AudioStream:
+        window_seconds = max(self.stream_window_seconds, MIN_STREAM_WINDOW_SECONDS)
+        return AudioStream(audio_path, window_seconds, SAMPLE_RATE).start()
+    
+    def get_vad_params(self, chunk_size: int = 30) -> Dict[str, Any]:
+        assert self.model is not None
+        return {**self.backend.vad_params(self.model), "chunk_size": chunk_size}
+    
+    def detect_speech(
+        self,
+        audio: np.ndarray,
+        chunk_size: int = 30,
+        content_hash: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        assert self.model is not None
+        
+        vad_params = self.get_vad_params(chunk_size)
+        if content_hash:
+            cached = self.vad_cache.load(content_hash, vad_params)
+            if cached is not None:
+                return cached
+        
+        vad_segments = self.backend.detect_speech(
+            self.model,
+            audio,
+            chunk_size,
+            vad_params["onset"],
+            vad_params["offset"]
+        )
+        
+        if content_hash:
+            self.vad_cache.store(content_hash, vad_params, vad_segments)
+        return vad_segments
+    
+    def decode_speech(
+        self,
+        audio: np.ndarray,
+        vad_segments: List[Dict[str, Any]],
+        batch_size: int = 8,
+        sample_offset: int = 0
+    ) -> Iterator[List[Dict[str, Any]]]:
+        assert self.model is not None
+        
+        def chunks():
+            for seg in vad_segments:
+                f1 = int(seg["start"] * SAMPLE_RATE) - sample_offset
+                f2 = int(seg["end"] * SAMPLE_RATE) - sample_offset
+                yield {"inputs": audio[f1:f2]}
+        
+        batch = []
+        for idx, out in enumerate(self.model(chunks(), batch_size=batch_size, num_workers=0)):
+            text = out["text"]
+            if batch_size in [0, 1, None]:
+                text = text[0]
+            batch.append({
+                "text": text,
+                "start": round(vad_segments[idx]["start"], 3),
+                "end": round(vad_segments[idx]["end"], 3)
+            })
+            if len(batch) >= max(batch_size, 1):
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def fit_shard_workers(self) -> int:
+        model_size_mb = MODEL_INFO[self.model_name].size_mb if self.model_name in MODEL_INFO else 0
+        free_mb = self.model_pool.memory_budget_mb - self.model_pool.total_size_mb()
+        workers = fit_shard_workers(self.shard_workers, model_size_mb, free_mb)
+        if workers < self.shard_workers:
+            print(f"Warning: model memory budget fits {workers} of {self.shard_workers} shard workers")
+        return workers
+    
+    def iter_asr_chunks(
+        self,
+        audio: np.ndarray,
+        batch_size: int = 8,
+        content_hash: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        vad_segments = self.detect_speech(audio, content_hash=content_hash)
+        
+        duration = len(audio) / float(SAMPLE_RATE)
+        shard_workers = self.fit_shard_workers() if self.shard_workers > 1 else 0
+        if shard_workers > 1 and self.shard_seconds > 0 and duration >= self.shard_min_duration:
+            shards = plan_shards(vad_segments, self.shard_seconds)
+            if len(shards) > 1:
+                executor = get_shard_executor(
+                    self.backend_name,
+                    self.model_name,
+                    self.device,
+                    self.compute_type,
+                    self.beam_size,
+                    shard_workers,
+                    max(1, (self.cpu_threads or os.cpu_count() or 1) // shard_workers)
+                )
+                yield from decode_sharded(executor, audio, shards, batch_size)
+                return
+        
+        yield from self.decode_speech(audio, vad_segments, batch_size)
+    
+    def iter_stream_chunks(
+        self,
+        stream: AudioStream,
+        batch_size: int = 8
+    ) -> Iterator[Tuple[List[Dict[str, Any]], np.ndarray, float]]:
+        window_samples = stream.ring.capacity
+        margin_samples = int(STREAM_MARGIN_SECONDS * SAMPLE_RATE)
+        cursor = 0
+        
+        while True:
+            window = stream.window(cursor, window_samples)
+            final = stream.is_final(cursor + len(window))
+            vad_segments = self.detect_speech(window) if len(window) else []
+            
+            if final:
+                committed = vad_segments
+                next_cursor = cursor + len(window)
+            else:
+                limit = (len(window) - margin_samples) / float(SAMPLE_RATE)
+                committed = [seg for seg in vad_segments if seg["end"] <= limit]
+                pending = [seg["start"] for seg in vad_segments if seg["end"] > limit]
+                next_cursor = cursor + max(1, int(min(pending + [limit]) * SAMPLE_RATE))
+            
+            window_offset = cursor / float(SAMPLE_RATE)
+            for batch in self.decode_speech(window, committed, batch_size):
+                start = int(batch[0]["start"] * SAMPLE_RATE)
+                end = min(int(batch[-1]["end"] * SAMPLE_RATE) + 1, len(window))
+                for seg in batch:
+                    seg["start"] = round(seg["start"] + window_offset, 3)
+                    seg["end"] = round(seg["end"] + window_offset, 3)
+                yield batch, window[start:end].copy(), window_offset + start / float(SAMPLE_RATE)
+            
+            stream.consume(next_cursor)
+            if final:
+                return
+            cursor = next_cursor
+    
+    def align_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        audio: np.ndarray,
+        time_offset: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        self.load_align_model()
+        assert self.align_model is not None
+        assert self.align_metadata is not None
+        
+        if time_offset:
+            segments = [
+                dict(seg, start=max(0.0, seg["start"] - time_offset), end=max(0.0, seg["end"] - time_offset))
+                for seg in segments
+            ]
+        
+        result = self.backend.align(
+            segments,
+            self.align_model,
+            self.align_metadata,
+            audio,
+            self.device,
+            self.align_batch_size
+        )
+        
+        if time_offset:
+            for seg in result["segments"]:
+                for item in [seg] + seg.get("words", []):
+                    for field in ("start", "end"):
+                        if field in item:
+                            item[field] = round(item[field] + time_offset, 3)
+        return result["segments"]
+    
+    def diarize(self, audio: Union[np.ndarray, str], hf_token: str):
+        self.load_diarize_model(hf_token)
+        assert self.diarize_model is not None
+        return self.backend.diarize(self.diarize_model, audio)
+    
+    def diarization_enabled(self, enable_diarization: bool) -> bool:
+        if enable_diarization and self.stream_window_seconds > 0:
+            print("Warning: diarization is disabled while streaming; set stream_window_seconds to 0 to diarize")
+            return False
+        return enable_diarization
+    
+    def start_diarization(
+        self,
+        audio: Union[np.ndarray, str],
+        hf_token: str,
+        timings: Optional[StageTimings] = None
+    ) -> DiarizationTask:
+        return DiarizationTask(lambda: self.diarize(audio, hf_token), timings).start()
+    
+    def assign_speakers(self, diarize_segments, aligned_segments: List[Dict[str, Any]], segments: List[Dict[str, Any]]):
+        result = assign_word_speakers(diarize_segments, {"segments": aligned_segments})
+        for segment, aligned in zip(segments, result["segments"]):
+            segment["speaker"] = aligned.get("speaker", None)
+    
+    def format_segments(self, aligned_segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        segments = []
+        for seg in aligned_segments:
+            words = seg.get("words", [])
+            if words:
+                scores = [float(w.get("score", 0.0)) for w in words if "score" in w]
+                avg_confidence = sum(scores) / len(scores) if scores else 0.0
+            else:
+                avg_confidence = 0.0
+            
+            segments.append({
+                "start": seg["start"],
+                "end": seg["end"],
+                "text": seg["text"].strip(),
+                "speaker": seg.get("speaker", None),
+                "confidence": avg_confidence
+            })
+        return segments
+    
+    def process_chunk(
+        self,
+        chunk: List[Dict[str, Any]],
+        audio: np.ndarray,
+        enable_vocabulary: bool = False,
+        vocabulary_profile: Union[str, List[str]] = "default",
+        vocabulary_threshold: int = 2,
+        time_offset: float = 0.0,
+        vocabulary_fuzzy_phrases: bool = False,
+        vocabulary_phonetic: bool = False
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        aligned = self.align_segments(chunk, audio, time_offset)
+        segments = self.format_segments(aligned)
+        
+        if enable_vocabulary:
+            segments = self.vocab_processor.apply_vocabulary(
+                segments,
+                vocabulary_profile,
+                vocabulary_threshold,
+                vocabulary_fuzzy_phrases,
+                vocabulary_phonetic
+            )
+        return aligned, segments
+    
+    def log_failure(self, audio_path: str, beam_size: int, error: Exception):
+        self.logger.log_error(
+            "TranscriptionError",
+            str(error),
+            {
+                "file": str(Path(audio_path).name),
+                "model": self.model_name,
+                "beam_size": beam_size
+            }
+        )
+    
+    def build_output(
+        self,
+        audio_path: str,
+        duration: float,
+        segments: List[Dict[str, Any]],
+        processing_time: float,
+        beam_size: int,
+        batch_size: int,
+        enable_diarization: bool,
+        enable_vocabulary: bool,
+        timings: Optional[StageTimings] = None,
+        preset: Optional[str] = None,
+        queue_wait: Optional[float] = None
+    ) -> Dict[str, Any]:
+        stage_timings = timings.as_dict() if timings is not None else {}
+        tracer = current_tracer()
+        resources = {}
+        if timings is not None and timings.sampler is not None:
+            timings.sampler.stop()
+            resources = timings.sampler.summary()
+        if stage_timings:
+            self.logger.log_timings(
+                str(Path(audio_path).name),
+                stage_timings,
+                {"diarize_asr": round(timings.overlap("diarize", "asr"), 3)}
+            )
+        
+        self.logger.log_performance({
+            "file": str(Path(audio_path).name),
+            "model": self.model_name,
+            "preset": preset,
+            "compute_type": self.compute_type,
+            "audio_duration": duration,
+            "processing_time": processing_time,
+            "ratio": processing_time / duration if duration > 0 else 0,
+            "beam_size": beam_size,
+            "batch_size": batch_size,
+            "diarization": enable_diarization,
+            "vocabulary": enable_vocabulary,
+            "segments_count": len(segments),
+            "queue_wait": queue_wait,
+            "stage_timings": stage_timings,
+            "stage_times": tracer.stage_times() if tracer is not None else {},
+            "resources": resources
+        })
+        
+        self.logger.log_session({
+            "file": str(Path(audio_path).name),
+            "model": self.model_name,
+            "duration": duration,
+            "segments": len(segments),
+            "diarization": enable_diarization,
+            "vocabulary_applied": enable_vocabulary
+        })
+        
+        return {
+            "metadata": {
+                "source_file": str(Path(audio_path).name),
+                "duration": duration,
+                "model": self.model_name,
+                "diarization_enabled": enable_diarization,
+                "vocabulary_applied": enable_vocabulary,
+                "processing_preset": preset or "custom",
+                "parameters": {
+                    "beam_size": self.beam_size,
+                    "compute_type": self.compute_type,
+                    "batch_size": batch_size
+                },
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            },
+            "segments": segments
+        }
+    
+    def transcribe_iter(
         self,
         audio_path: str,
         beam_size: int = 5,
@@ -65,141 +457,195 @@ class Transcriber:
         min_speakers: Optional[int] = None,
         max_speakers: Optional[int] = None,
         enable_vocabulary: bool = False,
-        vocabulary_profile: str = "default",
-        vocabulary_threshold: int = 2
-    ) -> Dict[str, Any]:
-        
-        start_time = time.time()
+        vocabulary_profile: Union[str, List[str]] = "default",
+        vocabulary_threshold: int = 2,
+        vocabulary_fuzzy_phrases: bool = False,
+        vocabulary_phonetic: bool = False,
+        preset: Optional[str] = None,
+        queue_wait: Optional[float] = None
+    ) -> Generator[List[Dict[str, Any]], None, Dict[str, Any]]:
+        tracer = Tracer(audio_path, time.time())
+        steps = self._transcribe_steps(
+            tracer,
+            audio_path,
+            beam_size,
+            batch_size,
+            enable_diarization,
+            hf_token,
+            min_speakers,
+            max_speakers,
+            enable_vocabulary,
+            vocabulary_profile,
+            vocabulary_threshold,
+            vocabulary_fuzzy_phrases,
+            vocabulary_phonetic,
+            preset,
+            queue_wait
+        )
+        try:
+            while True:
+                with activate(tracer):
+                    try:
+                        chunk_segments = next(steps)
+                    except StopIteration as done:
+                        return done.value
+                yield chunk_segments
+        finally:
+            steps.close()
+    
+    def _transcribe_steps(
+        self,
+        tracer: Tracer,
+        audio_path: str,
+        beam_size: int = 5,
+        batch_size: int = 8,
+        enable_diarization: bool = False,
+        hf_token: Optional[str] = None,
+        min_speakers: Optional[int] = None,
+        max_speakers: Optional[int] = None,
+        enable_vocabulary: bool = False,
+        vocabulary_profile: Union[str, List[str]] = "default",
+        vocabulary_threshold: int = 2,
+        vocabulary_fuzzy_phrases: bool = False,
+        vocabulary_phonetic: bool = False,
+        preset: Optional[str] = None,
+        queue_wait: Optional[float] = None
+    ) -> Generator[List[Dict[str, Any]], None, Dict[str, Any]]:
+        start_time = tracer.origin
+        timings = StageTimings(start_time, ResourceSampler().start())
         temp_file = None
+        stream = None
+        enable_diarization = self.diarization_enabled(enable_diarization)
         
         try:
-            processed_path, temp_file = extract_audio_if_video(audio_path)
-            
-            self.load_model(beam_size)
-            assert self.model is not None
-            
-            audio = whisperx.load_audio(processed_path)
+            with timings.measure("load_models"):
+                self.load_model(beam_size)
+                self.load_align_model()
             
-            result = self.model.transcribe(
-                audio,
-                batch_size=batch_size
-            )
-            
-            self.load_align_model()
-            assert self.align_model is not None
-            assert self.align_metadata is not None
-            result = whisperx.align(
-                result["segments"],
-                self.align_model,
-                self.align_metadata,
-                audio,
-                self.device,
-                return_char_alignments=False
-            )
+            with timings.measure("decode"):
+                if self.stream_window_seconds > 0:
+                    audio = None
+                    stream = self.open_stream(audio_path)
+                    chunks = self.iter_stream_chunks(stream, batch_size)
+                else:
+                    audio, temp_file = self.prepare_audio(audio_path)
+                    content_hash = file_digest(audio_path)
+                    chunks = ((chunk, audio, 0.0) for chunk in self.iter_asr_chunks(audio, batch_size, content_hash))
             
+            diarization = None
             if enable_diarization and hf_token:
-                self.load_diarize_model(hf_token)
-                assert self.diarize_model is not None
-                diarize_segments = self.diarize_model(audio)
-                result = whisperx.assign_word_speakers(diarize_segments, result)
+                diarization = self.start_diarization(audio, hf_token, timings)
             
+            aligned_segments = []
             segments = []
-            for seg in result["segments"]:
-                words = seg.get("words", [])
-                if words:
-                    scores = [float(w.get("score", 0.0)) for w in words if "score" in w]
-                    avg_confidence = sum(scores) / len(scores) if scores else 0.0
-                else:
-                    avg_confidence = 0.0
-                
-                segments.append({
-                    "start": seg["start"],
-                    "end": seg["end"],
-                    "text": seg["text"].strip(),
-                    "speaker": seg.get("speaker", None),
-                    "confidence": avg_confidence
-                })
+            for chunk, chunk_audio, time_offset in timings.measure_iter("asr", chunks):
+                with timings.measure("align"):
+                    aligned, chunk_segments = self.process_chunk(
+                        chunk,
+                        chunk_audio,
+                        enable_vocabulary,
+                        vocabulary_profile,
+                        vocabulary_threshold,
+                        time_offset,
+                        vocabulary_fuzzy_phrases,
+                        vocabulary_phonetic
+                    )
+                aligned_segments.extend(aligned)
+                segments.extend(chunk_segments)
+                if chunk_segments:
+                    yield chunk_segments
             
-            if enable_vocabulary:
-                segments = self.vocab_processor.apply_vocabulary(
-                    segments,
-                    vocabulary_profile,
-                    vocabulary_threshold
-                )
+            if diarization is not None:
+                with timings.measure("diarize_wait"):
+                    diarize_segments = diarization.join()
+                with timings.measure("assign_speakers"):
+                    self.assign_speakers(diarize_segments, aligned_segments, segments)
             
-            duration = len(audio) / 16000.0
+            total_samples = len(audio) if audio is not None else stream.total_samples
+            duration = total_samples / float(SAMPLE_RATE)
             processing_time = time.time() - start_time
             
-            self.logger.log_performance({
-                "file": str(Path(audio_path).name),
-                "model": self.model_name,
-                "audio_duration": duration,
-                "processing_time": processing_time,
-                "ratio": processing_time / duration if duration > 0 else 0,
-                "beam_size": beam_size,
-                "batch_size": batch_size,
-                "diarization": enable_diarization,
-                "vocabulary": enable_vocabulary,
-                "segments_count": len(segments)
-            })
-            
-            self.logger.log_session({
-                "file": str(Path(audio_path).name),
-                "model": self.model_name,
-                "duration": duration,
-                "segments": len(segments),
-                "diarization": enable_diarization,
-                "vocabulary_applied": enable_vocabulary
-            })
-            
-            output = {
-                "metadata": {
-                    "source_file": str(Path(audio_path).name),
-                    "duration": duration,
-                    "model": self.model_name,
-                    "diarization_enabled": enable_diarization,
-                    "vocabulary_applied": enable_vocabulary,
-                    "processing_preset": "custom",
-                    "parameters": {
-                        "beam_size": self.beam_size,
-                        "compute_type": self.compute_type,
-                        "batch_size": batch_size
-                    },
-                    "timestamp": datetime.utcnow().isoformat() + "Z"
-                },
-                "segments": segments
-            }
-            
-            return output
+            return self.build_output(
+                audio_path,
+                duration,
+                segments,
+                processing_time,
+                beam_size,
+                batch_size,
+                enable_diarization,
+                enable_vocabulary,
+                timings,
+                preset=preset,
+                queue_wait=queue_wait
+            )
             
         except Exception as e:
-            self.logger.log_error(
-                "TranscriptionError",
-                str(e),
-                {
-                    "file": str(Path(audio_path).name),
-                    "model": self.model_name,
-                    "beam_size": beam_size
-                }
-            )
+            self.log_failure(audio_path, beam_size, e)
             raise
         finally:
+            if stream is not None:
+                stream.close()
             if temp_file and Path(temp_file).exists():
                 Path(temp_file).unlink()
+            timings.sampler.stop()
+            tracer.save()
+    
+    def transcribe(
+        self,
+        audio_path: str,
+        beam_size: int = 5,
+        batch_size: int = 8,
+        enable_diarization: bool = False,
+        hf_token: Optional[str] = None,
+        min_speakers: Optional[int] = None,
+        max_speakers: Optional[int] = None,
+        enable_vocabulary: bool = False,
+        vocabulary_profile: Union[str, List[str]] = "default",
+        vocabulary_threshold: int = 2,
+        vocabulary_fuzzy_phrases: bool = False,
+        vocabulary_phonetic: bool = False,
+        on_segments: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        preset: Optional[str] = None,
+        queue_wait: Optional[float] = None
+    ) -> Dict[str, Any]:
+        stream = self.transcribe_iter(
+            audio_path,
+            beam_size=beam_size,
+            batch_size=batch_size,
+            enable_diarization=enable_diarization,
+            hf_token=hf_token,
+            min_speakers=min_speakers,
+            max_speakers=max_speakers,
+            enable_vocabulary=enable_vocabulary,
+            vocabulary_profile=vocabulary_profile,
+            vocabulary_threshold=vocabulary_threshold,
+            vocabulary_fuzzy_phrases=vocabulary_fuzzy_phrases,
+            vocabulary_phonetic=vocabulary_phonetic,
+            preset=preset,
+            queue_wait=queue_wait
+        )
+        while True:
+            try:
+                segments = next(stream)
+            except StopIteration as done:
+                return done.value
+            if on_segments:
+                on_segments(segments)
     
     def save_transcript(self, transcript: Dict[str, Any], output_path: str):
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(transcript, f, indent=2, ensure_ascii=False)
+        with span("save"):
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(transcript, f, indent=2, ensure_ascii=False)
+    
+    def release_models(self):
+        self.model = None
+        self.align_model = None
+        self.align_metadata = None
+        self.diarize_model = None
+        self.model_keys.clear()
     
     def unload_model(self):
-        if self.model is not None:
-            del self.model
-            self.model = None
-        if self.align_model is not None:
-            del self.align_model
-            self.align_model = None
-        if self.diarize_model is not None:
-            del self.diarize_model
-            self.diarize_model = None
-        if torch.backends.mps.is_available():
-            torch.mps.empty_cache()
\ No newline at end of file
+        keys = list(self.model_keys.values())
+        self.release_models()
+        for key in keys:
+            self.model_pool.evict(key)
\ No newline at end of file
@@ -0,0 +1,168 @@
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+import hashlib
+import json
+import os
+import shutil
+import threading
+from src.core.backends import DEFAULT_BACKEND
+from src.core.vocabulary_registry import VocabularyRegistry, get_vocabulary_registry
+
+FINGERPRINT_KEYS = [
+    "model",
+    "beam_size",
+    "compute_type",
+    "enable_diarization",
+    "min_speakers",
+    "max_speakers",
+    "enable_vocabulary",
+    "vocabulary_profile",
+    "vocabulary_threshold",
+    "vocabulary_fuzzy_phrases",
+    "vocabulary_phonetic",
+    "stream_window_seconds",
+    "align_batch_size",
+]
+
+def vocabulary_signature(profile: Union[str, Sequence[str], None], registry: Optional[VocabularyRegistry] = None) -> List[Any]:
+    registry = registry or get_vocabulary_registry()
+    names = [profile] if isinstance(profile, str) else list(profile or [])
+    return [registry.get_signature(name) for name in names]
+
+def settings_fingerprint(settings: Dict[str, Any], registry: Optional[VocabularyRegistry] = None) -> str:
+    effective = {key: settings.get(key) for key in FINGERPRINT_KEYS}
+    if effective["enable_vocabulary"]:
+        effective["vocabulary_signature"] = vocabulary_signature(effective["vocabulary_profile"], registry)
+    if not effective["enable_vocabulary"]:
+        effective["vocabulary_profile"] = None
+        effective["vocabulary_threshold"] = None
+        effective["vocabulary_fuzzy_phrases"] = None
+        effective["vocabulary_phonetic"] = None
+    if not effective["enable_diarization"]:
+        effective["min_speakers"] = None
+        effective["max_speakers"] = None
+    if settings.get("backend", DEFAULT_BACKEND) != DEFAULT_BACKEND:
+        effective["backend"] = settings["backend"]
+    return json.dumps(effective, sort_keys=True)
+
+def fingerprint_digest(settings: Dict[str, Any], registry: Optional[VocabularyRegistry] = None) -> str:
+    return hashlib.blake2b(settings_fingerprint(settings, registry).encode(), digest_size=8).hexdigest()
+
+def metadata_matches(transcript: Dict[str, Any], settings: Dict[str, Any]) -> bool:
+    metadata = transcript.get("metadata", {})
+    parameters = metadata.get("parameters", {})
+    if metadata.get("diarization_enabled") and not settings.get("enable_diarization"):
+        return False
+    return (
+        metadata.get("model") == settings.get("model")
+        and parameters.get("beam_size") == settings.get("beam_size")
+        and parameters.get("compute_type") == settings.get("compute_type")
+        and bool(metadata.get("vocabulary_applied")) == bool(settings.get("enable_vocabulary"))
+    )
+
+def copy_atomic(source: Path, target: Path):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+class TranscriptIndex:
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        vocabulary_registry: Optional[VocabularyRegistry] = None
+    ):
+        if index_path:
+            self.index_path = Path(index_path)
+        else:
+            self.index_path = Path.home() / "Library" / "Application Support" / "TranscriptionTool" / "transcript_index.json"
+        self.cache_dir = Path(cache_dir) if cache_dir else self.index_path.parent / "transcript_cache"
+        self.vocabulary_registry = vocabulary_registry
+        
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except Exception as e:
+            print(f"Error loading transcript index: {e}")
+            self.entries = {}
+    
+    def save(self):
+        temp_path = self.index_path.with_suffix(".tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(temp_path, self.index_path)
+        except Exception as e:
+            print(f"Error saving transcript index: {e}")
+    
+    def make_key(self, content_hash: str, settings: Dict[str, Any]) -> str:
+        return f"{content_hash}:{settings_fingerprint(settings, self.vocabulary_registry)}"
+    
+    def get_cache_path(self, content_hash: str, settings: Dict[str, Any]) -> Path:
+        return self.cache_dir / f"{content_hash}-{fingerprint_digest(settings, self.vocabulary_registry)}.json"
+    
+    def lookup(self, content_hash: str, settings: Dict[str, Any]) -> Optional[str]:
+        key = self.make_key(content_hash, settings)
+        with self._lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return None
+            if self.is_valid(entry, settings):
+                return entry["cache_path"]
+            del self.entries[key]
+            self.save()
+            return None
+    
+    def is_valid(self, entry: Dict[str, Any], settings: Dict[str, Any]) -> bool:
+        cache_path = entry.get("cache_path")
+        if not cache_path:
+            return False
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                transcript = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return metadata_matches(transcript, settings)
+    
+    def record(self, content_hash: str, settings: Dict[str, Any], output_path: str, source_file: str = ""):
+        key = self.make_key(content_hash, settings)
+        cache_path = self.get_cache_path(content_hash, settings)
+        try:
+            copy_atomic(Path(output_path), cache_path)
+        except OSError as e:
+            print(f"Error caching transcript: {e}")
+            return
+        
+        with self._lock:
+            self.entries[key] = {
+                "cache_path": str(cache_path),
+                "output_path": str(Path(output_path).resolve()),
+                "source_file": source_file,
+                "timestamp": datetime.utcnow().isoformat()
+            }
+            self.save()
+
+def copy_transcript(cached_path: str, output_path: str) -> str:
+    source = Path(cached_path)
+    target = Path(output_path)
+    
+    if target.exists() and target.resolve() == source.resolve():
+        return str(target)
+    
+    copy_atomic(source, target)
+    return str(target)
\ No newline at end of file
@@ -0,0 +1,63 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+import numpy as np
+
+class VadCache:
+    def __init__(self, cache_dir: Optional[str] = None):
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = Path.home() / "Library" / "Caches" / "TranscriptionTool" / "vad"
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def get_path(self, content_hash: str, params: Dict[str, Any]) -> Path:
+        key = hashlib.sha1(f"{content_hash}:{json.dumps(params, sort_keys=True)}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.npy"
+    
+    def load(self, content_hash: str, params: Dict[str, Any]) -> Optional[List[Dict[str, float]]]:
+        path = self.get_path(content_hash, params)
+        if not path.exists():
+            return None
+        try:
+            regions = np.load(path)
+        except Exception as e:
+            print(f"Error loading VAD cache {path}: {e}")
+            return None
+        return [{"start": float(start), "end": float(end)} for start, end in regions]
+    
+    def store(self, content_hash: str, params: Dict[str, Any], vad_segments: List[Dict[str, Any]]):
+        path = self.get_path(content_hash, params)
+        regions = np.array(
+            [[seg["start"], seg["end"]] for seg in vad_segments],
+            dtype=np.float64
+        ).reshape(-1, 2)
+        
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        try:
+            np.save(temp_path, regions)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Error saving VAD cache {path}: {e}")
+            if temp_path.exists():
+                temp_path.unlink()
+    
+    def clear(self):
+        for path in self.cache_dir.glob("*.npy"):
+            path.unlink()
+
+_vad_cache_instance = None
+
+def get_vad_cache() -> VadCache:
+    global _vad_cache_instance
+    if _vad_cache_instance is None:
+        _vad_cache_instance = VadCache()
+    return _vad_cache_instance
+
+def configure_vad_cache(cache_dir: Optional[str] = None) -> VadCache:
+    global _vad_cache_instance
+    _vad_cache_instance = VadCache(cache_dir)
+    return _vad_cache_instance
\ No newline at end of file
@@ -0,0 +1,187 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from Levenshtein import distance as levenshtein_distance
+from src.core.phrase_matcher import PhraseMatcher, PUNCTUATION, clean_token, phrase_barriers, phrase_tokens
+from src.core.phonetics import PhoneticIndex
+
+MAX_INDEX_DISTANCE = 2
+MAX_MEMO_SIZE = 100000
+PHONETIC_SLACK = 1
+
+def fuzzy_token_distance(token: str, threshold: int) -> int:
+    if len(token) >= 8:
+        return min(threshold, 2)
+    if len(token) >= 4:
+        return min(threshold, 1)
+    return 0
+
+def delete_variants(word: str, distance: int) -> Set[str]:
+    variants = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {
+            candidate[:i] + candidate[i + 1:]
+            for candidate in frontier
+            for i in range(len(candidate))
+        }
+        variants |= frontier
+    return variants
+
+class VocabularyMatcher:
+    def __init__(self, terms: Dict[str, str], phonetic: Optional[PhoneticIndex] = None):
+        self.keys: List[str] = []
+        self.corrections: List[str] = []
+        self.exact: Dict[str, int] = {}
+        self.by_length: Dict[int, List[int]] = {}
+        
+        for term, correct in terms.items():
+            key = term.lower()
+            index = len(self.keys)
+            self.keys.append(key)
+            self.corrections.append(correct)
+            self.exact.setdefault(key, index)
+            self.by_length.setdefault(len(key), []).append(index)
+        
+        self.deletes: Dict[str, List[int]] = {}
+        self.index_distance = -1
+        self.phonetic = phonetic
+        self.memo: Dict[Tuple[str, int, bool], Optional[int]] = {}
+        self.closest_memo: Dict[Tuple[str, int], Optional[int]] = {}
+        
+        phrases = []
+        for index, key in enumerate(self.keys):
+            tokens = phrase_tokens(key)
+            if len(tokens) > 1:
+                phrases.append((tokens, index))
+        self.phrases = PhraseMatcher(phrases) if phrases else None
+        self.token_matcher: Optional["VocabularyMatcher"] = None
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def build_index(self, distance: int):
+        deletes: Dict[str, List[int]] = {}
+        for index, key in enumerate(self.keys):
+            for variant in delete_variants(key, distance):
+                deletes.setdefault(variant, []).append(index)
+        self.deletes = deletes
+        self.index_distance = distance
+    
+    def candidates(self, word: str, threshold: int) -> List[int]:
+        if threshold <= MAX_INDEX_DISTANCE:
+            if self.index_distance < threshold:
+                self.build_index(threshold)
+            found: Set[int] = set()
+            for variant in delete_variants(word, threshold):
+                found.update(self.deletes.get(variant, ()))
+            return sorted(found)
+        
+        found_by_length: List[int] = []
+        for length in range(max(0, len(word) - threshold), len(word) + threshold + 1):
+            found_by_length.extend(self.by_length.get(length, ()))
+        return sorted(found_by_length)
+    
+    def find(self, word: str, threshold: int, phonetic: bool = False) -> Optional[int]:
+        memo_key = (word, threshold, phonetic)
+        if memo_key in self.memo:
+            return self.memo[memo_key]
+        
+        exact = self.exact.get(word)
+        result = None
+        if exact is None and phonetic and self.phonetic is not None:
+            index = self.phonetic.lookup(word)
+            if index is not None and levenshtein_distance(word, self.keys[index]) <= threshold + PHONETIC_SLACK:
+                result = index
+        if result is None:
+            result = exact
+            if threshold >= 0:
+                for index in self.candidates(word, threshold):
+                    if exact is not None and index >= exact:
+                        break
+                    key = self.keys[index]
+                    if abs(len(key) - len(word)) > threshold:
+                        continue
+                    if levenshtein_distance(word, key) <= threshold:
+                        result = index
+                        break
+        
+        if len(self.memo) >= MAX_MEMO_SIZE:
+            self.memo.clear()
+        self.memo[memo_key] = result
+        return result
+    
+    def closest(self, word: str, threshold: int) -> Optional[int]:
+        memo_key = (word, threshold)
+        if memo_key in self.closest_memo:
+            return self.closest_memo[memo_key]
+        
+        result = self.exact.get(word)
+        if result is None and threshold > 0:
+            best_distance = threshold + 1
+            for index in self.candidates(word, threshold):
+                distance = levenshtein_distance(word, self.keys[index])
+                if distance < best_distance:
+                    result = index
+                    best_distance = distance
+        
+        if len(self.closest_memo) >= MAX_MEMO_SIZE:
+            self.closest_memo.clear()
+        self.closest_memo[memo_key] = result
+        return result
+    
+    def lookup(self, word: str, threshold: int, phonetic: bool = False) -> Optional[str]:
+        index = self.find(word, threshold, phonetic)
+        return self.corrections[index] if index is not None else None
+    
+    def normalize_tokens(self, words: Sequence[str], threshold: int, fuzzy_phrases: bool) -> List[str]:
+        assert self.phrases is not None
+        tokens = [clean_token(word) for word in words]
+        if not fuzzy_phrases or threshold <= 0:
+            return tokens
+        
+        if self.token_matcher is None:
+            self.token_matcher = VocabularyMatcher({token: token for token in sorted(self.phrases.vocabulary)})
+        
+        normalized = []
+        for token in tokens:
+            index = self.token_matcher.closest(token, fuzzy_token_distance(token, threshold))
+            normalized.append(self.token_matcher.keys[index] if index is not None else token)
+        return normalized
+    
+    def match_phrases(self, words: Sequence[str], threshold: int, fuzzy_phrases: bool = False) -> Dict[int, Tuple[int, int]]:
+        if self.phrases is None:
+            return {}
+        tokens = self.normalize_tokens(words, threshold, fuzzy_phrases)
+        return {start: (end, index) for start, end, index in self.phrases.scan(tokens, phrase_barriers(words))}
+    
+    def replace_phrase(self, words: Sequence[str], correct: str) -> str:
+        first = words[0]
+        last = words[-1]
+        prefix = first[:len(first) - len(first.lstrip(PUNCTUATION))]
+        suffix = last[len(last.rstrip(PUNCTUATION)):]
+        return f"{prefix}{correct}{suffix}"
+    
+    def correct_words(
+        self,
+        words: Sequence[str],
+        threshold: int,
+        fuzzy_phrases: bool = False,
+        phonetic: bool = False
+    ) -> List[str]:
+        words = list(words)
+        spans = self.match_phrases(words, threshold, fuzzy_phrases)
+        
+        corrected = []
+        position = 0
+        while position < len(words):
+            if position in spans:
+                end, index = spans[position]
+                corrected.append(self.replace_phrase(words[position:end], self.corrections[index]))
+                position = end
+                continue
+            
+            word = words[position]
+            word_clean = clean_token(word)
+            correct = self.lookup(word_clean, threshold, phonetic)
+            corrected.append(word.replace(word_clean, correct, 1) if correct is not None else word)
+            position += 1
+        return corrected
\ No newline at end of file
@@ -0,0 +1,122 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import json
+import os
+import threading
+from src.core.vocabulary_matcher import VocabularyMatcher
+from src.core.phonetics import PhoneticIndex
+
+class VocabularyProfile:
+    def __init__(self, name: str, terms: Dict[str, str]):
+        self.name = name
+        self.terms = terms
+
+class VocabularyRegistry:
+    def __init__(self, vocab_dir: Optional[str] = None):
+        if vocab_dir:
+            self.vocab_dir = Path(vocab_dir)
+        else:
+            self.vocab_dir = Path.home() / "Library" / "Application Support" / "TranscriptionTool" / "vocabularies"
+        
+        self.vocab_dir.mkdir(parents=True, exist_ok=True)
+        self.profiles: Dict[str, Tuple[Tuple[int, int], VocabularyProfile]] = {}
+        self.matchers: Dict[Tuple[str, ...], Tuple[Tuple, VocabularyMatcher]] = {}
+        self._lock = threading.RLock()
+    
+    def get_path(self, profile_name: str) -> Path:
+        return self.vocab_dir / f"{profile_name}.json"
+    
+    def get_signature(self, profile_name: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.get_path(profile_name).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def get_profile_names(self) -> List[str]:
+        return sorted(path.stem for path in self.vocab_dir.glob("*.json"))
+    
+    def get_profile(self, profile_name: str) -> Optional[VocabularyProfile]:
+        signature = self.get_signature(profile_name)
+        with self._lock:
+            if signature is None:
+                self.invalidate(profile_name)
+                return None
+            
+            cached = self.profiles.get(profile_name)
+            if cached and cached[0] == signature:
+                return cached[1]
+            
+            try:
+                with open(self.get_path(profile_name), 'r', encoding='utf-8') as f:
+                    terms = json.load(f)
+            except Exception as e:
+                print(f"Error loading vocabulary {self.get_path(profile_name)}: {e}")
+                return None
+            
+            profile = VocabularyProfile(profile_name, terms)
+            self.profiles[profile_name] = (signature, profile)
+            return profile
+    
+    def get_matcher(self, profile_names: Sequence[str]) -> Optional[VocabularyMatcher]:
+        names = tuple(profile_names)
+        with self._lock:
+            profiles = [self.get_profile(name) for name in names]
+            profiles = [profile for profile in profiles if profile is not None]
+            if not profiles:
+                return None
+            
+            signature = tuple((profile.name, self.profiles[profile.name][0]) for profile in profiles)
+            cached = self.matchers.get(names)
+            if cached and cached[0] == signature:
+                return cached[1]
+            
+            terms: Dict[str, str] = {}
+            for profile in profiles:
+                for phonetic, correct in profile.terms.items():
+                    terms.setdefault(phonetic, correct)
+            
+            matcher = VocabularyMatcher(terms)
+            if len(profiles) == 1:
+                matcher.phonetic = PhoneticIndex.for_profile(self.get_path(profiles[0].name), matcher.keys)
+            else:
+                matcher.phonetic = PhoneticIndex.build(matcher.keys)
+            self.matchers[names] = (signature, matcher)
+            return matcher
+    
+    def invalidate(self, profile_name: Optional[str] = None):
+        with self._lock:
+            if profile_name is None:
+                self.profiles.clear()
+                self.matchers.clear()
+                return
+            self.profiles.pop(profile_name, None)
+            for names in [names for names in self.matchers if profile_name in names]:
+                del self.matchers[names]
+    
+    def save_profile(self, profile_name: str, terms: Dict[str, str]):
+        profile_path = self.get_path(profile_name)
+        temp_path = profile_path.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(terms, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, profile_path)
+        self.invalidate(profile_name)
+    
+    def delete_profile(self, profile_name: str):
+        profile_path = self.get_path(profile_name)
+        index_path = self.vocab_dir / "index" / f"{profile_name}.phonetic.json"
+        if profile_path.exists():
+            profile_path.unlink()
+        if index_path.exists():
+            index_path.unlink()
+        self.invalidate(profile_name)
+
+_registry_instance = None
+_registry_lock = threading.Lock()
+
+def get_vocabulary_registry() -> VocabularyRegistry:
+    global _registry_instance
+    with _registry_lock:
+        if _registry_instance is None:
+            _registry_instance = VocabularyRegistry()
+        return _registry_instance
\ No newline at end of file
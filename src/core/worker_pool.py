@@ -0,0 +1,192 @@
+from collections import deque
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+EVENT_STARTED = "started"
+EVENT_PROGRESS = "progress"
+EVENT_SEGMENTS = "segments"
+EVENT_FINISHED = "finished"
+EVENT_ERROR = "error"
+
+WORKER_CHECK_INTERVAL = 0.5
+
+THREAD_ENV_VARS = ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "VECLIB_MAXIMUM_THREADS"]
+
+def default_thread_budget(max_workers: int) -> int:
+    return max(1, (os.cpu_count() or 1) // max(1, max_workers))
+
+def get_output_path(settings: Dict[str, Any], audio_path: str) -> str:
+    return f"{settings['output_dir']}/{Path(audio_path).stem}_transcript.json"
+
+def _worker_main(jobs, events, cpu_threads: int, pipeline_depth: int):
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(cpu_threads)
+    
+    try:
+        import torch
+        torch.set_num_threads(cpu_threads)
+    except ImportError:
+        pass
+    
+    from src.core.pipeline import TranscriptionPipeline
+    pipeline = TranscriptionPipeline(events.put, cpu_threads=cpu_threads, queue_size=pipeline_depth)
+    
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        pipeline.submit(*job)
+    
+    pipeline.close()
+
+class WorkerHandle:
+    def __init__(self, process, jobs):
+        self.process = process
+        self.jobs = jobs
+        self.items: List[str] = []
+
+class WorkerPool:
+    def __init__(self, max_workers: int = 1, threads_per_worker: int = 0, pipeline_depth: int = 2):
+        self.max_workers = max(1, max_workers)
+        self.threads_per_worker = threads_per_worker or default_thread_budget(self.max_workers)
+        self.pipeline_depth = max(1, pipeline_depth)
+        
+        self._context = multiprocessing.get_context("spawn")
+        self._events = None
+        self._workers: List[WorkerHandle] = []
+        self._backlog: Deque[Tuple] = deque()
+        self._pending: Dict[str, Optional[WorkerHandle]] = {}
+        self._failed: Deque[Tuple] = deque()
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+    
+    def start(self):
+        with self._lock:
+            if self._workers:
+                return
+            self._events = self._context.Queue()
+            for _ in range(self.max_workers):
+                self._workers.append(self._spawn())
+    
+    def _spawn(self) -> WorkerHandle:
+        jobs = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(jobs, self._events, self.threads_per_worker, self.pipeline_depth)
+        )
+        process.start()
+        return WorkerHandle(process, jobs)
+    
+    def _dispatch(self):
+        while self._backlog:
+            free = [worker for worker in self._workers if len(worker.items) < self.pipeline_depth]
+            if not free:
+                return
+            worker = min(free, key=lambda handle: len(handle.items))
+            job = self._backlog.popleft()
+            worker.items.append(job[0])
+            self._pending[job[0]] = worker
+            worker.jobs.put(job)
+    
+    def submit(self, item_id: str, audio_path: str, settings: Dict[str, Any], queued_at: Optional[float] = None):
+        self.start()
+        with self._lock:
+            self._pending[item_id] = None
+            self._backlog.append((item_id, audio_path, dict(settings), queued_at))
+            self._dispatch()
+    
+    def has_capacity(self) -> bool:
+        with self._lock:
+            return len(self._pending) < self.max_workers * self.pipeline_depth
+    
+    @property
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._pending) + len(self._failed)
+    
+    def get_event(self, timeout: float = 0.2) -> Optional[Tuple]:
+        with self._lock:
+            if self._failed:
+                return self._failed.popleft()
+            events = self._events
+            check_due = time.monotonic() - self._last_check >= WORKER_CHECK_INTERVAL
+        if events is None:
+            time.sleep(timeout)
+            return None
+        
+        if check_due:
+            failed = self._check_workers()
+            if failed is not None:
+                return failed
+        
+        try:
+            event = events.get(timeout=timeout)
+        except queue.Empty:
+            return self._check_workers()
+        
+        kind, item_id = event[0], event[1]
+        with self._lock:
+            if item_id not in self._pending:
+                return None
+            if kind in (EVENT_FINISHED, EVENT_ERROR):
+                self._release(item_id)
+                self._dispatch()
+        return event
+    
+    def _release(self, item_id: str):
+        worker = self._pending.pop(item_id, None)
+        if worker is not None and item_id in worker.items:
+            worker.items.remove(item_id)
+    
+    def _check_workers(self) -> Optional[Tuple]:
+        with self._lock:
+            self._last_check = time.monotonic()
+            for index, worker in enumerate(self._workers):
+                if worker.process.is_alive():
+                    continue
+                
+                self._workers[index] = self._spawn()
+                message = f"Worker process exited unexpectedly (code {worker.process.exitcode})"
+                for item_id in list(worker.items):
+                    self._release(item_id)
+                    self._failed.append((EVENT_ERROR, item_id, message))
+            self._dispatch()
+            if self._failed:
+                return self._failed.popleft()
+        return None
+    
+    def resize(self, max_workers: int, threads_per_worker: int = 0):
+        max_workers = max(1, max_workers)
+        threads_per_worker = threads_per_worker or default_thread_budget(max_workers)
+        if max_workers == self.max_workers and threads_per_worker == self.threads_per_worker:
+            return
+        if self.active_count > 0:
+            return
+        
+        self.shutdown()
+        self.max_workers = max_workers
+        self.threads_per_worker = threads_per_worker
+    
+    def shutdown(self, timeout: float = 5.0):
+        with self._lock:
+            workers = self._workers
+            self._workers = []
+            self._backlog.clear()
+            self._pending.clear()
+            self._failed.clear()
+        
+        for worker in workers:
+            worker.jobs.put(None)
+        
+        for worker in workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+        
+        self._events = None
\ No newline at end of file
@@ -3,7 +3,6 @@ from PyQt6.QtWidgets import (
     QPushButton, QLineEdit, QTextEdit, QProgressBar
 )
 from PyQt6.QtCore import QThread, pyqtSignal
-import yt_dlp
 from pathlib import Path
 import tempfile
 from typing import cast
@@ -29,6 +28,7 @@ class DownloadWorker(QThread):
             
     def run(self):
         try:
+            import yt_dlp
             output_template = Path(self.output_dir) / "%(title)s.%(ext)s"
             
             ydl_opts = {
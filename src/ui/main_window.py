@@ -3,11 +3,14 @@ from PyQt6.QtWidgets import (
     QPushButton, QTextEdit, QFileDialog, QLabel, QListWidget,
     QListWidgetItem, QSplitter, QMenu
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction
 from pathlib import Path
-from src.core.transcriber import Transcriber
+from src.core.worker_pool import (
+    WorkerPool, EVENT_PROGRESS, EVENT_SEGMENTS, EVENT_FINISHED, EVENT_ERROR
+)
 from src.core.queue_manager import QueueManager, QueueStatus
+from src.core.transcript_index import TranscriptIndex
 from src.ui.settings_dialog import SettingsDialog
 from src.ui.model_dialog import ModelDialog
 from src.ui.vocabulary_editor import VocabularyEditor
@@ -15,83 +18,71 @@ from src.ui.transcript_editor import TranscriptEditor
 from src.ui.stats_dialog import StatsDialog
 from src.ui.speaker_dialog import SpeakerDialog
 from src.ui.download_dialog import DownloadDialog
-from src.utils.config import ConfigManager
+from src.utils.config import ConfigManager, DEFAULT_SETTINGS
+from src.utils.logger import get_logger
+from src.utils.warmup import start_warmup
 import json
 
 class TranscribeWorker(QThread):
-    finished = pyqtSignal(str, dict)
+    finished = pyqtSignal(str, dict, str)
     error = pyqtSignal(str, str)
     progress = pyqtSignal(str, int, str)
+    segments = pyqtSignal(str, list)
     
-    def __init__(self, item_id, audio_path, settings):
+    def __init__(self, worker_pool: WorkerPool):
         super().__init__()
-        self.item_id = item_id
-        self.audio_path = audio_path
-        self.settings = settings
+        self.worker_pool = worker_pool
         
     def run(self):
-        try:
-            self.progress.emit(self.item_id, 10, "Loading model...")
-            transcriber = Transcriber(
-                model_name=self.settings["model"], 
-                device="cpu", 
-                compute_type=self.settings["compute_type"]
-            )
-            
-            self.progress.emit(self.item_id, 30, "Transcribing audio...")
-            transcript = transcriber.transcribe(
-                self.audio_path, 
-                beam_size=self.settings["beam_size"], 
-                batch_size=self.settings["batch_size"],
-                enable_diarization=self.settings["enable_diarization"],
-                hf_token=self.settings["hf_token"] if self.settings["hf_token"] else None,
-                min_speakers=self.settings["min_speakers"],
-                max_speakers=self.settings["max_speakers"],
-                enable_vocabulary=self.settings.get("enable_vocabulary", False),
-                vocabulary_profile=self.settings.get("vocabulary_profile", "default"),
-                vocabulary_threshold=self.settings.get("vocabulary_threshold", 2)
-            )
-            
-            self.progress.emit(self.item_id, 90, "Saving transcript...")
-            output_path = f"{self.settings['output_dir']}/{Path(self.audio_path).stem}_transcript.json"
-            transcriber.save_transcript(transcript, output_path)
-            transcriber.unload_model()
-            
-            self.progress.emit(self.item_id, 100, "Complete")
-            self.finished.emit(self.item_id, transcript)
-        except Exception as e:
-            self.error.emit(self.item_id, str(e))
+        while not self.isInterruptionRequested():
+            event = self.worker_pool.get_event(timeout=0.2)
+            if event is None:
+                continue
+                
+            kind, item_id = event[0], event[1]
+            if kind == EVENT_PROGRESS:
+                self.progress.emit(item_id, event[2], event[3])
+            elif kind == EVENT_SEGMENTS:
+                self.segments.emit(item_id, event[2])
+            elif kind == EVENT_FINISHED:
+                self.finished.emit(item_id, event[2], event[3])
+            elif kind == EVENT_ERROR:
+                self.error.emit(item_id, event[2])
 
 class MainWindow(QMainWindow):
+    first_paint = pyqtSignal()
+    item_ready = pyqtSignal(str)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Transcription Tool")
         self.setMinimumSize(1200, 700)
         
-        self.queue_manager = QueueManager()
+        self.queue_manager = QueueManager(TranscriptIndex(), on_item_ready=lambda item: self.item_ready.emit(item.id))
+        self.worker_pool = None
         self.worker = None
         self.completed_transcripts = {}
         self.config_manager = ConfigManager()
+        self.painted = False
+        self.processing = False
         
-        self.settings = {
-            "preset": "Balanced",
-            "model": "base",
-            "beam_size": 5,
-            "batch_size": 8,
-            "compute_type": "int8",
-            "output_dir": "outputs",
-            "enable_diarization": False,
-            "hf_token": "",
-            "min_speakers": None,
-            "max_speakers": None,
-            "enable_vocabulary": False,
-            "vocabulary_profile": "default",
-            "vocabulary_threshold": 2
-        }
+        self.settings = dict(DEFAULT_SETTINGS)
         
         self.load_settings()
         self.setup_ui()
         self.setup_menu()
+        self.first_paint.connect(self.schedule_warmup)
+        self.item_ready.connect(self.on_item_ready)
+        
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            self.first_paint.emit()
+            
+    def schedule_warmup(self):
+        logger = get_logger()
+        QTimer.singleShot(0, lambda: start_warmup(on_done=logger.log_imports))
         
     def load_settings(self):
         saved_settings = self.config_manager.load_settings()
@@ -299,6 +290,11 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             self.settings = dialog.get_settings()
             self.preset_label.setText(f"Preset: {self.settings['preset']}")
+            if self.worker_pool:
+                self.worker_pool.resize(
+                    self.settings.get("max_workers", 1),
+                    self.settings.get("threads_per_worker", 0)
+                )
             self.model_label.setText(f"Model: {self.settings['model']}")
             self.save_settings()
             
@@ -307,12 +303,7 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             output_file = dialog.get_output_file()
             if output_file and Path(output_file).exists():
-                item = self.queue_manager.add_item(
-                    output_file,
-                    preset=self.settings["preset"],
-                    model=self.settings["model"]
-                )
-                self.add_queue_item_to_list(item)
+                self.enqueue_file(output_file)
                 if self.queue_manager.items:
                     self.process_button.setEnabled(True)
             
@@ -325,19 +316,41 @@ class MainWindow(QMainWindow):
         )
         
         for file_path in file_paths:
-            item = self.queue_manager.add_item(
-                file_path, 
-                preset=self.settings["preset"],
-                model=self.settings["model"]
-            )
-            self.add_queue_item_to_list(item)
+            self.enqueue_file(file_path)
             
         if self.queue_manager.items:
             self.process_button.setEnabled(True)
             
+    def enqueue_file(self, file_path):
+        item = self.queue_manager.add_item(
+            file_path,
+            preset=self.settings["preset"],
+            model=self.settings["model"],
+            settings=self.settings
+        )
+        self.add_queue_item_to_list(item)
+        
+    def on_item_ready(self, item_id):
+        item = self.queue_manager.get_item(item_id)
+        if not item:
+            return
+            
+        if item.status == QueueStatus.CACHED and item.output_path:
+            try:
+                with open(item.output_path, 'r', encoding='utf-8') as f:
+                    self.completed_transcripts[item.id] = json.load(f)
+                self.preview_area.append(f"↺ {item.filename}: reused existing transcript {item.output_path}")
+            except Exception as e:
+                self.preview_area.append(f"✗ Could not read cached transcript for {item.filename}: {e}")
+                
+        if self.processing:
+            self.process_next_item()
+        else:
+            self.refresh_queue_list()
+        
     def add_queue_item_to_list(self, item):
         status_text = f"{item.filename} - {item.status.value}"
-        if item.status == QueueStatus.COMPLETE:
+        if item.status in (QueueStatus.COMPLETE, QueueStatus.CACHED):
             status_text += " [Double-click to edit]"
         else:
             status_text += f" ({item.preset}/{item.model})"
@@ -358,7 +371,7 @@ class MainWindow(QMainWindow):
         
     def clear_completed(self):
         for item in self.queue_manager.items[:]:
-            if item.status == QueueStatus.COMPLETE and item.id in self.completed_transcripts:
+            if item.status in (QueueStatus.COMPLETE, QueueStatus.CACHED) and item.id in self.completed_transcripts:
                 del self.completed_transcripts[item.id]
         self.queue_manager.clear_completed()
         self.refresh_queue_list()
@@ -369,47 +382,69 @@ class MainWindow(QMainWindow):
             self.add_queue_item_to_list(item)
             
     def start_processing(self):
-        if self.worker and self.worker.isRunning():
-            return
+        if self.worker_pool is None:
+            self.worker_pool = WorkerPool(
+                self.settings.get("max_workers", 1),
+                self.settings.get("threads_per_worker", 0)
+            )
+        else:
+            self.worker_pool.resize(
+                self.settings.get("max_workers", 1),
+                self.settings.get("threads_per_worker", 0)
+            )
             
+        if self.worker is None:
+            self.worker = TranscribeWorker(self.worker_pool)
+            self.worker.progress.connect(self.on_progress)
+            self.worker.segments.connect(self.on_segments)
+            self.worker.finished.connect(self.on_finished)
+            self.worker.error.connect(self.on_error)
+            self.worker.start()
+            
+        self.processing = True
         self.process_next_item()
         
     def process_next_item(self):
-        next_item = self.queue_manager.get_next_queued()
-        if not next_item:
-            self.preview_area.append("\n✓ All items processed!")
-            self.process_button.setEnabled(True)
-            return
+        assert self.worker_pool is not None
+        
+        while self.worker_pool.has_capacity():
+            next_item = self.queue_manager.get_next_queued()
+            if not next_item:
+                break
+                
+            self.queue_manager.start_item(next_item.id, self.settings)
+            self.preview_area.append(f"\n=== Processing: {next_item.filename} ===")
+            self.worker_pool.submit(next_item.id, next_item.file_path, self.settings, next_item.queued_at)
             
-        self.queue_manager.update_status(next_item.id, QueueStatus.PROCESSING)
         self.refresh_queue_list()
         
-        self.preview_area.append(f"\n=== Processing: {next_item.filename} ===")
-        
-        self.process_button.setEnabled(False)
-        
-        self.worker = TranscribeWorker(
-            next_item.id,
-            next_item.file_path,
-            self.settings
-        )
-        self.worker.progress.connect(self.on_progress)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.error.connect(self.on_error)
-        self.worker.start()
-        
+        if self.worker_pool.active_count == 0 and self.queue_manager.hashing_count == 0:
+            self.processing = False
+            self.preview_area.append("\n✓ All items processed!")
+            self.process_button.setEnabled(True)
+        else:
+            self.process_button.setEnabled(False)
+            
     def on_progress(self, item_id, progress, message):
         self.queue_manager.update_status(item_id, QueueStatus.PROCESSING, progress)
         self.refresh_queue_list()
         self.preview_area.append(f"{message} ({progress}%)")
         
-    def on_finished(self, item_id, transcript):
+    def on_segments(self, item_id, segments):
+        prefix = ""
+        if self.worker_pool and self.worker_pool.max_workers > 1:
+            item = self.queue_manager.get_item(item_id)
+            prefix = f"{item.filename} " if item else ""
+        for seg in segments:
+            self.preview_area.append(f"{prefix}[{seg['start']:.1f}s] {seg['text']}")
+        
+    def on_finished(self, item_id, transcript, output_path):
         self.queue_manager.update_status(item_id, QueueStatus.COMPLETE, 100)
+        self.queue_manager.record_output(item_id, output_path)
         self.completed_transcripts[item_id] = transcript
         
         item = self.queue_manager.get_item(item_id)
         if item:
-            output_path = f"{self.settings['output_dir']}/{Path(item.file_path).stem}_transcript.json"
             self.config_manager.add_recent_file(item.file_path, output_path)
             self.update_recent_menu()
         
@@ -417,11 +452,7 @@ class MainWindow(QMainWindow):
         
         vocab_status = " (vocab applied)" if transcript['metadata']['vocabulary_applied'] else ""
         self.preview_area.append(f"✓ Complete - {len(transcript['segments'])} segments{vocab_status}\n")
-        
-        for seg in transcript['segments'][:3]:
-            self.preview_area.append(f"[{seg['start']:.1f}s] {seg['text']}")
-            
-        self.preview_area.append("\nDouble-click item to edit transcript")
+        self.preview_area.append("Double-click item to edit transcript")
         
         self.process_next_item()
         
@@ -430,4 +461,13 @@ class MainWindow(QMainWindow):
         self.refresh_queue_list()
         self.preview_area.append(f"✗ Error: {error_msg}\n")
         
-        self.process_next_item()
\ No newline at end of file
+        self.process_next_item()
+        
+    def closeEvent(self, event):
+        if self.worker:
+            self.worker.requestInterruption()
+            self.worker.wait()
+        if self.worker_pool:
+            self.worker_pool.shutdown()
+        self.queue_manager.shutdown()
+        super().closeEvent(event)
\ No newline at end of file
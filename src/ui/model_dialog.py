@@ -5,7 +5,6 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from src.core.model_manager import ModelManager, MODEL_INFO
-import whisperx
 
 class DownloadWorker(QThread):
     progress = pyqtSignal(str)
@@ -19,6 +18,7 @@ class DownloadWorker(QThread):
     def run(self):
         try:
             self.progress.emit(f"Downloading {self.model_name}...")
+            import whisperx
             whisperx.load_model(
                 self.model_name,
                 device="cpu",
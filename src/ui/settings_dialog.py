@@ -5,6 +5,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from src.core.vocabulary_processor import VocabularyProcessor
+from src.utils.config import DEFAULT_SETTINGS
+import os
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -14,21 +16,7 @@ class SettingsDialog(QDialog):
         
         self.vocab_processor = VocabularyProcessor()
         
-        self.settings = {
-            "preset": "Balanced",
-            "model": "base",
-            "beam_size": 5,
-            "batch_size": 8,
-            "compute_type": "int8",
-            "output_dir": "outputs",
-            "enable_diarization": False,
-            "hf_token": "",
-            "min_speakers": None,
-            "max_speakers": None,
-            "enable_vocabulary": False,
-            "vocabulary_profile": "default",
-            "vocabulary_threshold": 2
-        }
+        self.settings = dict(DEFAULT_SETTINGS)
         
         self.setup_ui()
         
@@ -89,6 +77,14 @@ class SettingsDialog(QDialog):
         self.vocab_threshold_spin.setValue(self.settings["vocabulary_threshold"])
         vocab_layout.addRow("Fuzzy Threshold:", self.vocab_threshold_spin)
         
+        self.vocab_fuzzy_phrases_check = QCheckBox()
+        self.vocab_fuzzy_phrases_check.setChecked(self.settings["vocabulary_fuzzy_phrases"])
+        vocab_layout.addRow("Fuzzy Phrase Matching:", self.vocab_fuzzy_phrases_check)
+        
+        self.vocab_phonetic_check = QCheckBox()
+        self.vocab_phonetic_check.setChecked(self.settings["vocabulary_phonetic"])
+        vocab_layout.addRow("Sound-Alike Matching:", self.vocab_phonetic_check)
+        
         vocab_group.setLayout(vocab_layout)
         layout.addWidget(vocab_group)
         
@@ -120,6 +116,82 @@ class SettingsDialog(QDialog):
         diarization_group.setLayout(diarization_layout)
         layout.addWidget(diarization_group)
         
+        performance_group = QGroupBox("Performance")
+        performance_layout = QFormLayout()
+        
+        self.memory_budget_spin = QSpinBox()
+        self.memory_budget_spin.setRange(500, 64000)
+        self.memory_budget_spin.setSingleStep(500)
+        self.memory_budget_spin.setSuffix(" MB")
+        self.memory_budget_spin.setValue(self.settings["model_memory_budget_mb"])
+        performance_layout.addRow("Model Memory Budget:", self.memory_budget_spin)
+        
+        self.max_workers_spin = QSpinBox()
+        self.max_workers_spin.setRange(1, os.cpu_count() or 1)
+        self.max_workers_spin.setValue(self.settings["max_workers"])
+        performance_layout.addRow("Max Concurrent Jobs:", self.max_workers_spin)
+        
+        self.threads_spin = QSpinBox()
+        self.threads_spin.setRange(0, os.cpu_count() or 1)
+        self.threads_spin.setSpecialValueText("Auto")
+        self.threads_spin.setValue(self.settings["threads_per_worker"])
+        performance_layout.addRow("Threads per Job:", self.threads_spin)
+        
+        self.shard_workers_spin = QSpinBox()
+        self.shard_workers_spin.setRange(0, os.cpu_count() or 1)
+        self.shard_workers_spin.setSpecialValueText("Off")
+        self.shard_workers_spin.setValue(self.settings["shard_workers"])
+        self.shard_workers_spin.setToolTip(
+            "Each shard worker loads its own copy of the model; the count is reduced to fit the model memory budget."
+        )
+        performance_layout.addRow("Shard Workers:", self.shard_workers_spin)
+        
+        self.shard_seconds_spin = QSpinBox()
+        self.shard_seconds_spin.setRange(60, 7200)
+        self.shard_seconds_spin.setSingleStep(60)
+        self.shard_seconds_spin.setSuffix(" s")
+        self.shard_seconds_spin.setValue(self.settings["shard_seconds"])
+        performance_layout.addRow("Shard Length:", self.shard_seconds_spin)
+        
+        self.shard_min_duration_spin = QSpinBox()
+        self.shard_min_duration_spin.setRange(60, 36000)
+        self.shard_min_duration_spin.setSingleStep(300)
+        self.shard_min_duration_spin.setSuffix(" s")
+        self.shard_min_duration_spin.setValue(self.settings["shard_min_duration"])
+        performance_layout.addRow("Shard Files Longer Than:", self.shard_min_duration_spin)
+        
+        self.pcm_cache_spin = QSpinBox()
+        self.pcm_cache_spin.setRange(0, 256000)
+        self.pcm_cache_spin.setSingleStep(1024)
+        self.pcm_cache_spin.setSuffix(" MB")
+        self.pcm_cache_spin.setSpecialValueText("Off")
+        self.pcm_cache_spin.setValue(self.settings["pcm_cache_mb"])
+        performance_layout.addRow("Decoded Audio Cache:", self.pcm_cache_spin)
+        
+        self.stream_window_spin = QSpinBox()
+        self.stream_window_spin.setRange(0, 3600)
+        self.stream_window_spin.setSingleStep(60)
+        self.stream_window_spin.setSuffix(" s")
+        self.stream_window_spin.setSpecialValueText("Off")
+        self.stream_window_spin.setValue(self.settings["stream_window_seconds"])
+        performance_layout.addRow("Streaming Window:", self.stream_window_spin)
+        
+        self.stream_diarization_label = QLabel("Diarization is skipped while streaming is on.")
+        self.stream_diarization_label.setWordWrap(True)
+        performance_layout.addRow("", self.stream_diarization_label)
+        self.stream_window_spin.valueChanged.connect(self.update_stream_warning)
+        self.diarization_check.toggled.connect(self.update_stream_warning)
+        self.update_stream_warning()
+        
+        self.align_batch_spin = QSpinBox()
+        self.align_batch_spin.setRange(0, 64)
+        self.align_batch_spin.setSpecialValueText("Off")
+        self.align_batch_spin.setValue(self.settings["align_batch_size"])
+        performance_layout.addRow("Alignment Batch Size:", self.align_batch_spin)
+        
+        performance_group.setLayout(performance_layout)
+        layout.addWidget(performance_group)
+        
         output_group = QGroupBox("Output")
         output_layout = QHBoxLayout()
         
@@ -148,6 +220,11 @@ class SettingsDialog(QDialog):
         
         layout.addLayout(button_layout)
         
+    def update_stream_warning(self):
+        self.stream_diarization_label.setVisible(
+            self.stream_window_spin.value() > 0 and self.diarization_check.isChecked()
+        )
+        
     def refresh_vocab_profiles(self):
         self.vocab_profile_combo.clear()
         profiles = self.vocab_processor.get_profile_names()
@@ -195,7 +272,18 @@ class SettingsDialog(QDialog):
             "max_speakers": max_speakers,
             "enable_vocabulary": self.vocab_check.isChecked(),
             "vocabulary_profile": self.vocab_profile_combo.currentText(),
-            "vocabulary_threshold": self.vocab_threshold_spin.value()
+            "vocabulary_threshold": self.vocab_threshold_spin.value(),
+            "vocabulary_fuzzy_phrases": self.vocab_fuzzy_phrases_check.isChecked(),
+            "vocabulary_phonetic": self.vocab_phonetic_check.isChecked(),
+            "model_memory_budget_mb": self.memory_budget_spin.value(),
+            "max_workers": self.max_workers_spin.value(),
+            "threads_per_worker": self.threads_spin.value(),
+            "shard_workers": self.shard_workers_spin.value(),
+            "shard_seconds": self.shard_seconds_spin.value(),
+            "shard_min_duration": self.shard_min_duration_spin.value(),
+            "pcm_cache_mb": self.pcm_cache_spin.value(),
+            "stream_window_seconds": self.stream_window_spin.value(),
+            "align_batch_size": self.align_batch_spin.value()
         }
         
     def set_settings(self, settings):
@@ -215,4 +303,15 @@ class SettingsDialog(QDialog):
         self.vocab_check.setChecked(settings.get("enable_vocabulary", False))
         if settings.get("vocabulary_profile"):
             self.vocab_profile_combo.setCurrentText(settings["vocabulary_profile"])
-        self.vocab_threshold_spin.setValue(settings.get("vocabulary_threshold", 2))
\ No newline at end of file
+        self.vocab_threshold_spin.setValue(settings.get("vocabulary_threshold", 2))
+        self.vocab_fuzzy_phrases_check.setChecked(settings.get("vocabulary_fuzzy_phrases", False))
+        self.vocab_phonetic_check.setChecked(settings.get("vocabulary_phonetic", DEFAULT_SETTINGS["vocabulary_phonetic"]))
+        self.memory_budget_spin.setValue(settings.get("model_memory_budget_mb", 8000))
+        self.max_workers_spin.setValue(settings.get("max_workers", 1))
+        self.threads_spin.setValue(settings.get("threads_per_worker", 0))
+        self.shard_workers_spin.setValue(settings.get("shard_workers", 0))
+        self.shard_seconds_spin.setValue(settings.get("shard_seconds", 600))
+        self.shard_min_duration_spin.setValue(settings.get("shard_min_duration", 1800))
+        self.pcm_cache_spin.setValue(settings.get("pcm_cache_mb", DEFAULT_SETTINGS["pcm_cache_mb"]))
+        self.stream_window_spin.setValue(settings.get("stream_window_seconds", 0))
+        self.align_batch_spin.setValue(settings.get("align_batch_size", DEFAULT_SETTINGS["align_batch_size"]))
\ No newline at end of file
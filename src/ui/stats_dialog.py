@@ -4,6 +4,22 @@ from PyQt6.QtWidgets import (
 )
 from src.utils.logger import get_logger
 
+RECENT_DAYS = 14
+
+def format_percentiles(percentiles, unit: str) -> str:
+    if not percentiles or percentiles.get("p50") is None:
+        return "n/a"
+    return " / ".join(f"{name} {value:.2f}{unit}" for name, value in percentiles.items())
+
+def format_resources(resources) -> str:
+    if not resources:
+        return "n/a"
+    return (
+        f"peak {resources['peak_rss_mb']:.0f} MB, mean {resources['mean_rss_mb']:.0f} MB, "
+        f"CPU {resources['cpu_percent']:.0f}%, {resources['max_threads']} threads, "
+        f"{resources['major_faults']:.0f} major faults/file"
+    )
+
 class StatsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -41,7 +57,10 @@ class StatsDialog(QDialog):
         text += f"Total files processed: {stats['total_files']}\n"
         text += f"Total audio duration: {stats['total_audio_duration']:.1f}s ({stats['total_audio_duration']/3600:.2f}h)\n"
         text += f"Total processing time: {stats['total_processing_time']:.1f}s ({stats['total_processing_time']/3600:.2f}h)\n"
-        text += f"Average processing ratio: {stats['average_ratio']:.2f}x realtime\n\n"
+        text += f"Average processing ratio: {stats['average_ratio']:.2f}x realtime\n"
+        text += f"Real-time factor: {format_percentiles(stats.get('ratio_percentiles'), 'x')}\n"
+        text += f"Queue wait: {format_percentiles(stats.get('queue_wait_percentiles'), 's')}\n"
+        text += f"Resources: {format_resources(stats.get('resources'))}\n\n"
         
         text += "=== By Model ===\n\n"
         for model, data in stats['by_model'].items():
@@ -49,6 +68,23 @@ class StatsDialog(QDialog):
             text += f"{model}:\n"
             text += f"  Files: {data['count']}\n"
             text += f"  Total time: {data['total_time']:.1f}s\n"
-            text += f"  Avg per file: {avg_time:.1f}s\n\n"
+            text += f"  Avg per file: {avg_time:.1f}s\n"
+            text += f"  Avg ratio: {data['avg_ratio']:.2f}x\n"
+            text += f"  Real-time factor: {format_percentiles(data.get('ratio_percentiles'), 'x')}\n"
+            text += f"  Queue wait: {format_percentiles(data.get('queue_wait_percentiles'), 's')}\n"
+            text += f"  Resources: {format_resources(data.get('resources'))}\n\n"
+            
+        for title, key in [("Preset", "by_preset"), ("Compute Type", "by_compute_type"), ("Beam Size", "by_beam_size")]:
+            text += f"=== By {title} ===\n\n"
+            for name, data in stats.get(key, {}).items():
+                text += f"{name}: {data['count']} files, RTF {format_percentiles(data['ratio_percentiles'], 'x')}\n"
+                if key == "by_preset":
+                    text += f"  Resources: {format_resources(data.get('resources'))}\n"
+            text += "\n"
+            
+        text += "=== Recent Days ===\n\n"
+        for day, data in list(stats.get('by_day', {}).items())[-RECENT_DAYS:]:
+            text += f"{day}: {data['count']} files, RTF {format_percentiles(data['ratio_percentiles'], 'x')}, "
+            text += f"queue wait {format_percentiles(data['queue_wait_percentiles'], 's')}\n"
             
         self.stats_text.setText(text)
\ No newline at end of file
@@ -0,0 +1,87 @@
+from pathlib import Path
+from typing import Optional
+import hashlib
+import os
+import threading
+import numpy as np
+from src.utils.preprocessing import decode_audio
+
+DEFAULT_PCM_CACHE_MB = 4096
+
+class PcmCache:
+    def __init__(self, cache_dir: Optional[str] = None, max_size_mb: int = DEFAULT_PCM_CACHE_MB):
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = Path.home() / "Library" / "Caches" / "TranscriptionTool" / "pcm"
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_mb = max_size_mb
+        self._lock = threading.Lock()
+    
+    def get_path(self, source_path: str) -> Path:
+        path = Path(source_path).resolve()
+        stat = path.stat()
+        key = hashlib.sha1(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.f32"
+    
+    def load(self, source_path: str) -> np.ndarray:
+        cache_path = self.get_path(source_path)
+        
+        try:
+            os.utime(cache_path)
+        except FileNotFoundError:
+            temp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                decode_audio(source_path, str(temp_path))
+                os.replace(temp_path, cache_path)
+            finally:
+                if temp_path.exists():
+                    temp_path.unlink()
+            self.evict(keep=cache_path)
+        
+        if cache_path.stat().st_size == 0:
+            return np.zeros(0, dtype=np.float32)
+        return np.memmap(cache_path, dtype=np.float32, mode="r")
+    
+    def set_max_size(self, max_size_mb: int):
+        if max_size_mb == self.max_size_mb:
+            return
+        self.max_size_mb = max_size_mb
+        self.evict()
+    
+    def evict(self, keep: Optional[Path] = None):
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*.f32"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            limit = self.max_size_mb * 1024 * 1024
+            for _, size, path in entries:
+                if total <= limit:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    pass
+    
+    def clear(self):
+        for path in self.cache_dir.glob("*.f32"):
+            path.unlink()
+
+_pcm_cache_instance = None
+
+def get_pcm_cache() -> PcmCache:
+    global _pcm_cache_instance
+    if _pcm_cache_instance is None:
+        _pcm_cache_instance = PcmCache()
+    return _pcm_cache_instance
\ No newline at end of file
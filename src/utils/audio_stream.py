@@ -0,0 +1,153 @@
+from typing import Optional
+import subprocess
+import tempfile
+import threading
+import numpy as np
+
+STREAM_MARGIN_SECONDS = 5.0
+MIN_STREAM_WINDOW_SECONDS = 60.0
+
+class PcmRingBuffer:
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = np.zeros(capacity, dtype=np.float32)
+        self.start = 0
+        self.end = 0
+    
+    def __len__(self) -> int:
+        return self.end - self.start
+    
+    def free(self) -> int:
+        return self.capacity - len(self)
+    
+    def write(self, samples: np.ndarray):
+        count = len(samples)
+        if count > self.free():
+            raise ValueError("PCM ring buffer overflow")
+        
+        position = self.end % self.capacity
+        first = min(count, self.capacity - position)
+        self.data[position:position + first] = samples[:first]
+        self.data[:count - first] = samples[first:]
+        self.end += count
+    
+    def read(self, start: int, end: int) -> np.ndarray:
+        start = max(start, self.start)
+        end = min(end, self.end)
+        count = max(0, end - start)
+        
+        out = np.empty(count, dtype=np.float32)
+        position = start % self.capacity
+        first = min(count, self.capacity - position)
+        out[:first] = self.data[position:position + first]
+        out[first:] = self.data[:count - first]
+        return out
+    
+    def consume(self, upto: int):
+        self.start = max(self.start, min(upto, self.end))
+
+class AudioStream:
+    def __init__(self, source_path: str, capacity_seconds: float, sample_rate: int = 16000, read_size: int = 1 << 16):
+        self.source_path = source_path
+        self.sample_rate = sample_rate
+        self.read_size = read_size
+        self.ring = PcmRingBuffer(int(capacity_seconds * sample_rate))
+        self.eof = False
+        self.error: Optional[str] = None
+        
+        self._condition = threading.Condition()
+        self._process: Optional[subprocess.Popen] = None
+        self._stderr = None
+        self._reader: Optional[threading.Thread] = None
+        self._closed = False
+    
+    def start(self) -> "AudioStream":
+        cmd = [
+            'ffmpeg', '-nostdin',
+            '-threads', '0',
+            '-i', self.source_path,
+            '-vn',
+            '-f', 's16le',
+            '-ac', '1',
+            '-acodec', 'pcm_s16le',
+            '-ar', str(self.sample_rate),
+            '-'
+        ]
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=self._stderr)
+        self._reader = threading.Thread(target=self._read_loop, name="audio-stream", daemon=True)
+        self._reader.start()
+        return self
+    
+    def __enter__(self) -> "AudioStream":
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def total_samples(self) -> int:
+        return self.ring.end
+    
+    def _read_loop(self):
+        assert self._process is not None and self._process.stdout is not None
+        pending = b""
+        
+        while True:
+            with self._condition:
+                while self.ring.free() == 0 and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                request = min(self.read_size, self.ring.free() * 2 - len(pending))
+            
+            data = self._process.stdout.read(request)
+            if not data:
+                break
+            
+            data = pending + data
+            usable = len(data) - (len(data) % 2)
+            pending = data[usable:]
+            samples = np.frombuffer(data[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+            
+            with self._condition:
+                self.ring.write(samples)
+                self._condition.notify_all()
+        
+        returncode = self._process.wait()
+        with self._condition:
+            if returncode != 0 and self._stderr is not None:
+                self._stderr.seek(0)
+                self.error = f"Failed to load audio: {self._stderr.read().decode(errors='replace')}"
+            self.eof = True
+            self._condition.notify_all()
+    
+    def window(self, start: int, length: int) -> np.ndarray:
+        with self._condition:
+            while self.ring.end < start + length and not self.eof:
+                self._condition.wait()
+            if self.error:
+                raise RuntimeError(self.error)
+            return self.ring.read(start, start + length)
+    
+    def is_final(self, end: int) -> bool:
+        with self._condition:
+            return self.eof and end >= self.ring.end
+    
+    def consume(self, upto: int):
+        with self._condition:
+            self.ring.consume(upto)
+            self._condition.notify_all()
+    
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        if self._reader is not None:
+            self._reader.join()
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
\ No newline at end of file
@@ -2,6 +2,33 @@ from pathlib import Path
 import json
 from typing import Dict, Any, List, Optional
 
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "preset": "Balanced",
+    "model": "base",
+    "beam_size": 5,
+    "batch_size": 8,
+    "compute_type": "int8",
+    "output_dir": "outputs",
+    "enable_diarization": False,
+    "hf_token": "",
+    "min_speakers": None,
+    "max_speakers": None,
+    "enable_vocabulary": False,
+    "vocabulary_profile": "default",
+    "vocabulary_threshold": 2,
+    "vocabulary_fuzzy_phrases": False,
+    "vocabulary_phonetic": False,
+    "model_memory_budget_mb": 8000,
+    "max_workers": 1,
+    "threads_per_worker": 0,
+    "shard_workers": 0,
+    "shard_seconds": 600,
+    "shard_min_duration": 1800,
+    "pcm_cache_mb": 0,
+    "stream_window_seconds": 0,
+    "align_batch_size": 8
+}
+
 class ConfigManager:
     def __init__(self):
         self.config_dir = Path.home() / "Library" / "Application Support" / "TranscriptionTool"
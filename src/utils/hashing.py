@@ -0,0 +1,34 @@
+from pathlib import Path
+from typing import Dict, Tuple
+import hashlib
+import threading
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_digest_cache: Dict[Tuple[str, int, int], str] = {}
+_digest_lock = threading.Lock()
+
+def file_digest(file_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    cache_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    
+    with _digest_lock:
+        cached = _digest_cache.get(cache_key)
+    if cached:
+        return cached
+    
+    digest = hashlib.blake2b(digest_size=20)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, 'rb') as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    
+    content_hash = f"{stat.st_size:x}-{digest.hexdigest()}"
+    with _digest_lock:
+        _digest_cache[cache_key] = content_hash
+    return content_hash
@@ -1,19 +1,22 @@
 import logging
 from pathlib import Path
-from datetime import datetime
 import json
 from typing import Dict, Any, Optional
+from src.utils.metrics_store import MetricsStore
 
 class TranscriptionLogger:
-    def __init__(self):
-        self.log_dir = Path.home() / "Library" / "Logs" / "TranscriptionTool"
+    def __init__(self, log_dir: Optional[str] = None):
+        if log_dir:
+            self.log_dir = Path(log_dir)
+        else:
+            self.log_dir = Path.home() / "Library" / "Logs" / "TranscriptionTool"
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         self.error_log = self.log_dir / "errors.log"
-        self.performance_log = self.log_dir / "performance.json"
-        self.session_log = self.log_dir / "sessions.json"
+        self.metrics_db = self.log_dir / "metrics.db"
         
         self.setup_logging()
+        self.metrics = MetricsStore(str(self.metrics_db), str(self.log_dir))
         
     def setup_logging(self):
         logging.basicConfig(
@@ -31,72 +34,29 @@ class TranscriptionLogger:
         if details:
             self.logger.error(f"Details: {json.dumps(details)}")
             
-    def log_performance(self, performance_data: Dict[str, Any]):
-        performances = []
-        if self.performance_log.exists():
-            try:
-                with open(self.performance_log, 'r') as f:
-                    performances = json.load(f)
-            except:
-                performances = []
-                
-        performances.append({
-            **performance_data,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+    def log_timings(self, file_name: str, stage_timings: Dict[str, Dict[str, float]], overlaps: Optional[Dict[str, float]] = None):
+        self.logger.info(f"Stage timings for {file_name}: {json.dumps(stage_timings)}")
+        if overlaps:
+            self.logger.info(f"Stage overlap for {file_name}: {json.dumps(overlaps)}")
+            
+    def log_imports(self, import_times: Dict[str, Optional[float]]):
+        self.logger.info(f"Import warm-up: {json.dumps(import_times)}")
         
-        with open(self.performance_log, 'w') as f:
-            json.dump(performances, f, indent=2)
+    def log_performance(self, performance_data: Dict[str, Any]):
+        try:
+            self.metrics.append("performance", performance_data)
+        except Exception as e:
+            self.logger.error(f"Error recording performance: {e}")
             
     def log_session(self, session_data: Dict[str, Any]):
-        sessions = []
-        if self.session_log.exists():
-            try:
-                with open(self.session_log, 'r') as f:
-                    sessions = json.load(f)
-            except:
-                sessions = []
-                
-        sessions.append({
-            **session_data,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-        
-        with open(self.session_log, 'w') as f:
-            json.dump(sessions, f, indent=2)
+        try:
+            self.metrics.append("sessions", session_data)
+        except Exception as e:
+            self.logger.error(f"Error recording session: {e}")
             
     def get_performance_stats(self) -> Dict[str, Any]:
-        if not self.performance_log.exists():
-            return {}
-            
         try:
-            with open(self.performance_log, 'r') as f:
-                performances = json.load(f)
-                
-            if not performances:
-                return {}
-                
-            total_files = len(performances)
-            total_duration = sum(p.get("audio_duration", 0) for p in performances)
-            total_processing = sum(p.get("processing_time", 0) for p in performances)
-            
-            avg_ratio = total_processing / total_duration if total_duration > 0 else 0
-            
-            by_model = {}
-            for p in performances:
-                model = p.get("model", "unknown")
-                if model not in by_model:
-                    by_model[model] = {"count": 0, "avg_ratio": 0, "total_time": 0}
-                by_model[model]["count"] += 1
-                by_model[model]["total_time"] += p.get("processing_time", 0)
-                
-            return {
-                "total_files": total_files,
-                "total_audio_duration": total_duration,
-                "total_processing_time": total_processing,
-                "average_ratio": avg_ratio,
-                "by_model": by_model
-            }
+            return self.metrics.get_performance_stats()
         except Exception as e:
             self.logger.error(f"Error getting performance stats: {e}")
             return {}
@@ -107,4 +67,9 @@ def get_logger() -> TranscriptionLogger:
     global _logger_instance
     if _logger_instance is None:
         _logger_instance = TranscriptionLogger()
+    return _logger_instance
+
+def configure_logger(log_dir: Optional[str] = None) -> TranscriptionLogger:
+    global _logger_instance
+    _logger_instance = TranscriptionLogger(log_dir)
     return _logger_instance
\ No newline at end of file
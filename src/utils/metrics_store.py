@@ -0,0 +1,311 @@
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import json
+import os
+import sqlite3
+import threading
+from src.utils.sketch import QuantileSketch
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS performance (
+        id INTEGER PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        file TEXT,
+        model TEXT,
+        audio_duration REAL,
+        processing_time REAL,
+        ratio REAL,
+        data TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS performance_model ON performance (model)",
+    "CREATE INDEX IF NOT EXISTS performance_timestamp ON performance (timestamp)",
+    """CREATE TABLE IF NOT EXISTS sessions (
+        id INTEGER PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        file TEXT,
+        model TEXT,
+        data TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS sessions_timestamp ON sessions (timestamp)",
+    """CREATE TABLE IF NOT EXISTS rollups (
+        dimension TEXT NOT NULL,
+        key TEXT NOT NULL,
+        first_id INTEGER,
+        count INTEGER NOT NULL,
+        audio_duration REAL NOT NULL,
+        processing_time REAL NOT NULL,
+        ratio_sketch TEXT NOT NULL,
+        queue_wait_sketch TEXT NOT NULL,
+        resources TEXT,
+        PRIMARY KEY (dimension, key)
+    )""",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+]
+
+ROLLUP_DIMENSIONS = ["model", "preset", "compute_type", "beam_size", "day"]
+ROLLUP_VERSION = "rollups:v2"
+
+def rollup_keys(record: Dict[str, Any]) -> List[tuple]:
+    keys = [("all", "")]
+    for dimension in ROLLUP_DIMENSIONS:
+        if dimension == "day":
+            value = (record.get("timestamp") or "")[:10]
+        else:
+            value = record.get(dimension)
+        keys.append((dimension, str(value) if value not in (None, "") else "unknown"))
+    return keys
+
+class Rollup:
+    def __init__(self, first_id: Optional[int] = None):
+        self.first_id = first_id
+        self.count = 0
+        self.audio_duration = 0.0
+        self.processing_time = 0.0
+        self.ratio = QuantileSketch()
+        self.queue_wait = QuantileSketch()
+        self.resources = {"count": 0, "peak_rss_mb": 0.0, "mean_rss_mb": 0.0, "cpu_percent": 0.0, "max_threads": 0, "major_faults": 0}
+    
+    @classmethod
+    def from_row(cls, row: tuple) -> "Rollup":
+        rollup = cls(row[0])
+        rollup.count, rollup.audio_duration, rollup.processing_time = row[1], row[2], row[3]
+        rollup.ratio = QuantileSketch.from_dict(json.loads(row[4]))
+        rollup.queue_wait = QuantileSketch.from_dict(json.loads(row[5]))
+        if row[6]:
+            rollup.resources.update(json.loads(row[6]))
+        return rollup
+    
+    def add(self, record_id: int, record: Dict[str, Any]):
+        if self.first_id is None:
+            self.first_id = record_id
+        
+        audio_duration = record.get("audio_duration") or 0
+        processing_time = record.get("processing_time") or 0
+        self.count += 1
+        self.audio_duration += audio_duration
+        self.processing_time += processing_time
+        
+        ratio = record.get("ratio")
+        if ratio is None and audio_duration > 0:
+            ratio = processing_time / audio_duration
+        if ratio is not None:
+            self.ratio.add(ratio)
+        if record.get("queue_wait") is not None:
+            self.queue_wait.add(record["queue_wait"])
+        
+        usage = record.get("resources")
+        if usage and usage.get("samples"):
+            totals = self.resources
+            totals["count"] += 1
+            totals["peak_rss_mb"] = max(totals["peak_rss_mb"], usage.get("peak_rss_mb", 0))
+            totals["mean_rss_mb"] += usage.get("mean_rss_mb", 0)
+            totals["cpu_percent"] += usage.get("cpu_percent", 0)
+            totals["max_threads"] = max(totals["max_threads"], usage.get("max_threads", 0))
+            totals["major_faults"] += usage.get("major_faults", 0)
+    
+    def resource_summary(self) -> Dict[str, Any]:
+        totals = self.resources
+        count = totals["count"]
+        if not count:
+            return {}
+        return {
+            "files": count,
+            "peak_rss_mb": totals["peak_rss_mb"],
+            "mean_rss_mb": totals["mean_rss_mb"] / count,
+            "cpu_percent": totals["cpu_percent"] / count,
+            "max_threads": totals["max_threads"],
+            "major_faults": totals["major_faults"] / count
+        }
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ratio": self.processing_time / self.audio_duration if self.audio_duration > 0 else 0,
+            "total_time": self.processing_time,
+            "total_audio": self.audio_duration,
+            "ratio_percentiles": self.ratio.percentiles(),
+            "queue_wait_percentiles": self.queue_wait.percentiles(),
+            "resources": self.resource_summary()
+        }
+
+class MetricsStore:
+    def __init__(self, db_path: str, legacy_dir: Optional[str] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.legacy_dir = Path(legacy_dir) if legacy_dir else self.db_path.parent
+        self._local = threading.local()
+        
+        conn = self.connect()
+        with conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+        self.ensure_columns("rollups", {"resources": "TEXT"})
+        self.migrate_json("performance.json", "performance")
+        self.migrate_json("sessions.json", "sessions")
+        self.ensure_rollups()
+    
+    def connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def _row(self, table: str, record: Dict[str, Any]) -> tuple:
+        timestamp = record.get("timestamp") or datetime.utcnow().isoformat()
+        data = json.dumps({**record, "timestamp": timestamp})
+        if table == "performance":
+            return (
+                timestamp,
+                record.get("file"),
+                record.get("model"),
+                record.get("audio_duration"),
+                record.get("processing_time"),
+                record.get("ratio"),
+                data
+            )
+        return (timestamp, record.get("file"), record.get("model"), data)
+    
+    def _insert_sql(self, table: str) -> str:
+        if table == "performance":
+            return ("INSERT INTO performance (timestamp, file, model, audio_duration, processing_time, ratio, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)")
+        return "INSERT INTO sessions (timestamp, file, model, data) VALUES (?, ?, ?, ?)"
+    
+    def append(self, table: str, record: Dict[str, Any]):
+        record = {**record, "timestamp": datetime.utcnow().isoformat()}
+        conn = self.connect()
+        if table != "performance":
+            conn.execute(self._insert_sql(table), self._row(table, record))
+            return
+        
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            record_id = conn.execute(self._insert_sql(table), self._row(table, record)).lastrowid
+            self._update_rollups(conn, [(record_id, record)])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def _update_rollups(self, conn: sqlite3.Connection, records):
+        rollups: Dict[tuple, Rollup] = {}
+        for record_id, record in records:
+            for key in rollup_keys(record):
+                rollup = rollups.get(key)
+                if rollup is None:
+                    row = conn.execute(
+                        "SELECT first_id, count, audio_duration, processing_time, ratio_sketch, queue_wait_sketch, resources "
+                        "FROM rollups WHERE dimension = ? AND key = ?",
+                        key
+                    ).fetchone()
+                    rollup = rollups[key] = Rollup.from_row(row) if row else Rollup()
+                rollup.add(record_id, record)
+        
+        conn.executemany(
+            "INSERT OR REPLACE INTO rollups "
+            "(dimension, key, first_id, count, audio_duration, processing_time, ratio_sketch, queue_wait_sketch, resources) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    dimension, key, rollup.first_id, rollup.count, rollup.audio_duration, rollup.processing_time,
+                    json.dumps(rollup.ratio.to_dict()), json.dumps(rollup.queue_wait.to_dict()), json.dumps(rollup.resources)
+                )
+                for (dimension, key), rollup in rollups.items()
+            ]
+        )
+    
+    def ensure_columns(self, table: str, columns: Dict[str, str]):
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for name, kind in columns.items():
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {kind}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def ensure_rollups(self):
+        conn = self.connect()
+        if conn.execute("SELECT 1 FROM meta WHERE key = ?", (ROLLUP_VERSION,)).fetchone():
+            return
+        
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM meta WHERE key = ?", (ROLLUP_VERSION,)).fetchone() is None:
+                conn.execute("DELETE FROM rollups")
+                records = ((row[0], json.loads(row[1])) for row in conn.execute("SELECT id, data FROM performance ORDER BY id").fetchall())
+                self._update_rollups(conn, records)
+                conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (ROLLUP_VERSION, datetime.utcnow().isoformat()))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def migrate_json(self, file_name: str, table: str):
+        legacy_path = self.legacy_dir / file_name
+        if not legacy_path.exists():
+            return
+        
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            key = f"migrated:{file_name}"
+            if conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone() is None:
+                try:
+                    with open(legacy_path, 'r') as f:
+                        records = json.load(f)
+                except Exception as e:
+                    print(f"Error reading {legacy_path} for migration: {e}")
+                    records = []
+                conn.executemany(self._insert_sql(table), [self._row(table, record) for record in records])
+                conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, datetime.utcnow().isoformat()))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        
+        try:
+            os.replace(legacy_path, legacy_path.with_suffix(".json.migrated"))
+        except FileNotFoundError:
+            pass
+    
+    def get_records(self, table: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        sql = f"SELECT data FROM {table} ORDER BY id"
+        if limit:
+            sql = f"SELECT data FROM (SELECT id, data FROM {table} ORDER BY id DESC LIMIT {int(limit)}) ORDER BY id"
+        return [json.loads(row[0]) for row in self.connect().execute(sql)]
+    
+    def get_rollups(self) -> Dict[str, Dict[str, Rollup]]:
+        rollups: Dict[str, Dict[str, Rollup]] = {}
+        for row in self.connect().execute(
+            "SELECT dimension, key, first_id, count, audio_duration, processing_time, ratio_sketch, queue_wait_sketch, resources "
+            "FROM rollups ORDER BY dimension, first_id"
+        ):
+            rollups.setdefault(row[0], {})[row[1]] = Rollup.from_row(row[2:])
+        return rollups
+    
+    def get_performance_stats(self) -> Dict[str, Any]:
+        rollups = self.get_rollups()
+        overall = rollups.get("all", {}).get("")
+        if overall is None or not overall.count:
+            return {}
+        
+        stats = {
+            "total_files": overall.count,
+            "total_audio_duration": overall.audio_duration,
+            "total_processing_time": overall.processing_time,
+            "average_ratio": overall.processing_time / overall.audio_duration if overall.audio_duration > 0 else 0,
+            "ratio_percentiles": overall.ratio.percentiles(),
+            "queue_wait_percentiles": overall.queue_wait.percentiles(),
+            "resources": overall.resource_summary()
+        }
+        for dimension in ROLLUP_DIMENSIONS:
+            stats[f"by_{dimension}"] = {key: rollup.summary() for key, rollup in rollups.get(dimension, {}).items()}
+        return stats
\ No newline at end of file
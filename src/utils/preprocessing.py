@@ -2,6 +2,8 @@ import subprocess
 from pathlib import Path
 import tempfile
 from typing import Optional
+import numpy as np
+from src.utils.tracing import span
 
 def extract_audio_if_video(input_path: str) -> tuple[str, Optional[str]]:
     path = Path(input_path)
@@ -23,7 +25,42 @@ def extract_audio_if_video(input_path: str) -> tuple[str, Optional[str]]:
     ]
     
     try:
-        subprocess.run(cmd, capture_output=True, check=True)
+        with span("extract_audio", file=path.name):
+            subprocess.run(cmd, capture_output=True, check=True)
         return str(temp_audio), str(temp_audio)
     except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to extract audio: {e.stderr.decode()}")
\ No newline at end of file
+        raise RuntimeError(f"Failed to extract audio: {e.stderr.decode()}")
+
+def decode_audio(input_path: str, output_path: str, sample_rate: int = 16000, chunk_size: int = 1 << 20) -> int:
+    cmd = [
+        'ffmpeg', '-nostdin',
+        '-threads', '0',
+        '-i', input_path,
+        '-vn',
+        '-f', 's16le',
+        '-ac', '1',
+        '-acodec', 'pcm_s16le',
+        '-ar', str(sample_rate),
+        '-'
+    ]
+    
+    samples = 0
+    pending = b""
+    with tempfile.TemporaryFile() as stderr, open(output_path, 'wb') as out:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        assert process.stdout is not None
+        while True:
+            data = process.stdout.read(chunk_size)
+            if not data:
+                break
+            data = pending + data
+            usable = len(data) - (len(data) % 2)
+            pending = data[usable:]
+            pcm = np.frombuffer(data[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+            out.write(pcm.tobytes())
+            samples += len(pcm)
+        
+        if process.wait() != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"Failed to load audio: {stderr.read().decode(errors='replace')}")
+    return samples
\ No newline at end of file
@@ -0,0 +1,159 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+DEFAULT_SAMPLE_INTERVAL = 0.5
+IDLE_STAGE = "other"
+MB = 1024 * 1024
+
+def _read_proc_stat() -> Optional[Dict[str, float]]:
+    try:
+        with open("/proc/self/stat", 'r') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    
+    fields = stat[stat.rindex(")") + 2:].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    return {
+        "rss": int(fields[21]) * os.sysconf("SC_PAGE_SIZE"),
+        "cpu": (int(fields[11]) + int(fields[12])) / ticks,
+        "threads": int(fields[17]),
+        "minor_faults": int(fields[7]),
+        "major_faults": int(fields[9])
+    }
+
+def _read_rusage() -> Dict[str, float]:
+    if resource is None:
+        return {"rss": 0, "cpu": time.process_time(), "threads": threading.active_count(), "minor_faults": 0, "major_faults": 0}
+    
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "rss": usage.ru_maxrss * scale,
+        "cpu": usage.ru_utime + usage.ru_stime,
+        "threads": threading.active_count(),
+        "minor_faults": usage.ru_minflt,
+        "major_faults": usage.ru_majflt
+    }
+
+def read_process_usage() -> Dict[str, float]:
+    return _read_proc_stat() or _read_rusage()
+
+class StageUsage:
+    def __init__(self):
+        self.samples = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.rss_total = 0.0
+        self.peak_rss = 0.0
+        self.max_threads = 0
+        self.minor_faults = 0
+        self.major_faults = 0
+    
+    def add(self, sample: Dict[str, float], previous: Dict[str, float], wall: float):
+        self.samples += 1
+        self.wall += wall
+        self.cpu += sample["cpu"] - previous["cpu"]
+        self.rss_total += sample["rss"] * wall
+        self.peak_rss = max(self.peak_rss, sample["rss"])
+        self.max_threads = max(self.max_threads, sample["threads"])
+        self.minor_faults += sample["minor_faults"] - previous["minor_faults"]
+        self.major_faults += sample["major_faults"] - previous["major_faults"]
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "peak_rss_mb": round(self.peak_rss / MB, 1),
+            "mean_rss_mb": round(self.rss_total / self.wall / MB, 1) if self.wall > 0 else round(self.peak_rss / MB, 1),
+            "cpu_percent": round(100 * self.cpu / self.wall, 1) if self.wall > 0 else 0.0,
+            "max_threads": self.max_threads,
+            "minor_faults": self.minor_faults,
+            "major_faults": self.major_faults
+        }
+
+class ResourceSampler:
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.total = StageUsage()
+        self.stages: Dict[str, StageUsage] = {}
+        self.active: Dict[str, int] = {}
+        
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous: Optional[Dict[str, float]] = None
+        self._previous_time = 0.0
+    
+    def start(self) -> "ResourceSampler":
+        self._previous = read_process_usage()
+        self._previous_time = time.time()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+        return self
+    
+    def __enter__(self) -> "ResourceSampler":
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+    
+    def sample(self):
+        now = time.time()
+        usage = read_process_usage()
+        with self._lock:
+            if self._previous is None:
+                return
+            wall = now - self._previous_time
+            stages: List[str] = [stage for stage, depth in self.active.items() if depth > 0] or [IDLE_STAGE]
+            
+            self.total.add(usage, self._previous, wall)
+            for stage in stages:
+                self.stages.setdefault(stage, StageUsage()).add(usage, self._previous, wall)
+            self._previous = usage
+            self._previous_time = now
+    
+    def enter(self, stage: str):
+        self.sample()
+        with self._lock:
+            self.active[stage] = self.active.get(stage, 0) + 1
+    
+    def exit(self, stage: str):
+        self.sample()
+        with self._lock:
+            self.active[stage] = max(0, self.active.get(stage, 0) - 1)
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.exit(name)
+    
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.sample()
+    
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.total.summary(),
+                "by_stage": {stage: usage.summary() for stage, usage in self.stages.items()}
+            }
\ No newline at end of file
@@ -0,0 +1,110 @@
+from typing import Any, Dict, Optional
+import math
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+MIN_INDEXABLE_VALUE = 1e-9
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_bins: int = DEFAULT_MAX_BINS):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def _index(self, value: float) -> int:
+        return int(math.ceil(math.log(value) / self.log_gamma))
+    
+    def _value(self, index: int) -> float:
+        return 2 * self.gamma ** index / (self.gamma + 1)
+    
+    def add(self, value: float, weight: int = 1):
+        value = max(0.0, float(value))
+        if value < MIN_INDEXABLE_VALUE:
+            self.zero_count += weight
+        else:
+            index = self._index(value)
+            self.bins[index] = self.bins.get(index, 0) + weight
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        
+        self.count += weight
+        self.total += value * weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    def _collapse(self):
+        indexes = sorted(self.bins)
+        excess = len(indexes) - self.max_bins
+        target = indexes[excess]
+        for index in indexes[:excess]:
+            self.bins[target] += self.bins.pop(index)
+    
+    def merge(self, other: "QuantileSketch"):
+        if other.count == 0:
+            return
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        
+        seen = self.zero_count
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+    
+    def percentiles(self, quantiles=(0.5, 0.9, 0.99)) -> Dict[str, Optional[float]]:
+        return {f"p{int(round(q * 100))}": self.quantile(q) for q in quantiles}
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "bins": [[index, count] for index, count in sorted(self.bins.items())],
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "QuantileSketch":
+        if not data:
+            return cls()
+        
+        sketch = cls(data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY), data.get("max_bins", DEFAULT_MAX_BINS))
+        sketch.bins = {int(index): int(count) for index, count in data.get("bins", [])}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        sketch.total = data.get("total", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
\ No newline at end of file
@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional
+import threading
+import time
+from src.utils.tracing import span, record_span
+from src.utils.resources import ResourceSampler
+
+class StageTimings:
+    def __init__(self, origin: Optional[float] = None, sampler: Optional[ResourceSampler] = None):
+        self.origin = origin if origin is not None else time.time()
+        self.sampler = sampler
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, stage: str, start: float, end: float):
+        with self._lock:
+            entry = self.stages.get(stage)
+            if entry is None:
+                self.stages[stage] = {"start": start, "end": end, "busy": end - start}
+            else:
+                entry["start"] = min(entry["start"], start)
+                entry["end"] = max(entry["end"], end)
+                entry["busy"] += end - start
+    
+    @contextmanager
+    def measure(self, stage: str):
+        start = time.time()
+        if self.sampler is not None:
+            self.sampler.enter(stage)
+        try:
+            with span(stage):
+                yield
+        finally:
+            self.record(stage, start, time.time())
+            if self.sampler is not None:
+                self.sampler.exit(stage)
+    
+    def measure_iter(self, stage: str, items: Iterable[Any]) -> Iterator[Any]:
+        iterator = iter(items)
+        while True:
+            start = time.time()
+            if self.sampler is not None:
+                self.sampler.enter(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                end = time.time()
+                self.record(stage, start, end)
+                record_span(stage, start, end)
+                return
+            finally:
+                if self.sampler is not None:
+                    self.sampler.exit(stage)
+            end = time.time()
+            self.record(stage, start, end)
+            record_span(stage, start, end)
+            yield item
+    
+    def overlap(self, first: str, second: str) -> float:
+        with self._lock:
+            a = self.stages.get(first)
+            b = self.stages.get(second)
+            if not a or not b:
+                return 0.0
+            return max(0.0, min(a["end"], b["end"]) - max(a["start"], b["start"]))
+    
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                stage: {
+                    "start": round(entry["start"] - self.origin, 3),
+                    "end": round(entry["end"] - self.origin, 3),
+                    "busy": round(entry["busy"], 3)
+                }
+                for stage, entry in self.stages.items()
+            }
\ No newline at end of file
@@ -0,0 +1,109 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import os
+import re
+import threading
+import time
+from src.utils.logger import get_logger
+
+_current_tracer: ContextVar[Optional["Tracer"]] = ContextVar("current_tracer", default=None)
+_current_span: ContextVar[Optional[str]] = ContextVar("current_span", default=None)
+
+class Tracer:
+    def __init__(self, name: str, origin: Optional[float] = None, trace_dir: Optional[str] = None):
+        self.name = name
+        self.origin = origin if origin is not None else time.time()
+        self.trace_dir = Path(trace_dir) if trace_dir else None
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        self.threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+    
+    def add(self, name: str, start: float, end: float, args: Optional[Dict[str, Any]] = None):
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": round((start - self.origin) * 1e6),
+            "dur": round((end - start) * 1e6),
+            "pid": self.pid,
+            "tid": thread.ident
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self.threads.setdefault(thread.ident, thread.name)
+    
+    def stage_times(self) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for event in self.events:
+                totals[event["name"]] = totals.get(event["name"], 0.0) + event["dur"] / 1e6
+        return {name: round(total, 3) for name, total in totals.items()}
+    
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        with self._lock:
+            metadata = [
+                {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": self.name}}
+            ] + [
+                {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self.threads.items()
+            ]
+            events = sorted(self.events, key=lambda event: event["ts"])
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms", "otherData": {"origin": self.origin}}
+    
+    def save(self) -> Optional[str]:
+        trace_dir = self.trace_dir or get_logger().log_dir / "traces"
+        stem = re.sub(r"[^\w.-]+", "_", Path(self.name).stem)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.origin))
+        path = trace_dir / f"{stamp}_{stem}_{self.pid}.json"
+        try:
+            trace_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(self.to_chrome_trace(), f)
+            return str(path)
+        except Exception as e:
+            print(f"Error saving trace: {e}")
+            return None
+
+def current_tracer() -> Optional[Tracer]:
+    return _current_tracer.get()
+
+@contextmanager
+def activate(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+@contextmanager
+def span(name: str, **args) -> Iterator[None]:
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield
+        return
+    
+    parent = _current_span.get()
+    if parent is not None:
+        args["parent"] = parent
+    token = _current_span.set(name)
+    start = time.time()
+    try:
+        yield
+    finally:
+        end = time.time()
+        _current_span.reset(token)
+        tracer.add(name, start, end, args)
+
+def record_span(name: str, start: float, end: float, **args):
+    tracer = _current_tracer.get()
+    if tracer is not None:
+        parent = _current_span.get()
+        if parent is not None:
+            args["parent"] = parent
+        tracer.add(name, start, end, args)
\ No newline at end of file
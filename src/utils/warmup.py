@@ -0,0 +1,37 @@
+from typing import Callable, Dict, Iterable, List, Optional
+import importlib
+import threading
+import time
+
+WARMUP_MODULES = ["torch", "whisperx", "pyannote.audio", "yt_dlp"]
+
+def import_modules(modules: Iterable[str]) -> Dict[str, Optional[float]]:
+    import_times: Dict[str, Optional[float]] = {}
+    for name in modules:
+        start = time.time()
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            import_times[name] = None
+            continue
+        except Exception as e:
+            print(f"Error importing {name}: {e}")
+            import_times[name] = None
+            continue
+        import_times[name] = round(time.time() - start, 3)
+    return import_times
+
+def start_warmup(
+    modules: Optional[List[str]] = None,
+    on_done: Optional[Callable[[Dict[str, Optional[float]]], None]] = None
+) -> threading.Thread:
+    names = list(WARMUP_MODULES if modules is None else modules)
+    
+    def run():
+        import_times = import_modules(names)
+        if on_done is not None:
+            on_done(import_times)
+    
+    thread = threading.Thread(target=run, name="import-warmup", daemon=True)
+    thread.start()
+    return thread
\ No newline at end of file
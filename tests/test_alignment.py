@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+torchaudio = pytest.importorskip("torchaudio")
+pytest.importorskip("whisperx")
+
+from src.core.alignment import BatchedAlignModel, align_batched
+
+LABELS = ["<pad>", "|", "a", "e", "i", "o", "n", "s", "t", "r"]
+SEGMENTS = [
+    {"start": 0.0, "end": 1.6, "text": "a taste"},
+    {"start": 1.6, "end": 2.4, "text": "rose"},
+    {"start": 2.4, "end": 4.9, "text": "ants rest on a tree"},
+    {"start": 4.9, "end": 5.3, "text": "tin"},
+    {"start": 5.3, "end": 7.5, "text": "rain on tin"},
+]
+
+def make_model(extractor_mode: str):
+    torch.manual_seed(0)
+    model = torchaudio.models.wav2vec2_model(
+        extractor_mode=extractor_mode,
+        extractor_conv_layer_config=None,
+        extractor_conv_bias=False,
+        encoder_embed_dim=32,
+        encoder_projection_dropout=0.0,
+        encoder_pos_conv_kernel=16,
+        encoder_pos_conv_groups=4,
+        encoder_num_layers=2,
+        encoder_num_heads=2,
+        encoder_attention_dropout=0.0,
+        encoder_ff_interm_features=64,
+        encoder_ff_interm_dropout=0.0,
+        encoder_dropout=0.0,
+        encoder_layer_norm_first=extractor_mode == "layer_norm",
+        encoder_layer_drop=0.0,
+        aux_num_out=len(LABELS)
+    )
+    return model.eval()
+
+def words(result):
+    return [word for seg in result["segments"] for word in seg.get("words", [])]
+
+@pytest.mark.parametrize("extractor_mode", ["group_norm", "layer_norm"])
+def test_batched_alignment_matches_unbatched(extractor_mode):
+    model = make_model(extractor_mode)
+    metadata = {"language": "en", "dictionary": {label: i for i, label in enumerate(LABELS)}, "type": "torchaudio"}
+    audio = np.random.default_rng(0).standard_normal(16000 * 8).astype(np.float32) * 0.1
+    
+    expected = words(align_batched([dict(seg) for seg in SEGMENTS], model, metadata, audio, "cpu", batch_size=1))
+    actual = words(align_batched([dict(seg) for seg in SEGMENTS], model, metadata, audio, "cpu", batch_size=4))
+    
+    assert [word["word"] for word in actual] == [word["word"] for word in expected]
+    for got, want in zip(actual, expected):
+        assert ("start" in got) == ("start" in want)
+        if "start" in want:
+            assert got["start"] == pytest.approx(want["start"], abs=0.021)
+            assert got["end"] == pytest.approx(want["end"], abs=0.021)
+            assert got["score"] == pytest.approx(want["score"], abs=1e-3)
+
+def test_emissions_are_served_only_for_views_of_the_precomputed_audio():
+    batched = BatchedAlignModel(make_model("layer_norm"), batch_size=4)
+    audio = torch.from_numpy(np.random.default_rng(1).standard_normal((1, 16000 * 3)).astype(np.float32))
+    batched.precompute([{"start": 0.0, "end": 1.0, "text": "rose"}], audio, {label: i for i, label in enumerate(LABELS)})
+    
+    crop = audio[:, 0:16000]
+    assert batched._span(crop) == (0, 16000)
+    assert batched(crop)[0] is batched.emissions[(0, 16000)]
+    assert batched._span(crop.clone()) is None
+    assert batched._span(audio[:, 16000:32000]) == (16000, 32000)
+    assert (16000, 32000) not in batched.emissions
+    
+    batched.clear()
+    assert batched._span(crop) is None
\ No newline at end of file
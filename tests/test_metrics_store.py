@@ -0,0 +1,69 @@
+import json
+import os
+import pytest
+from src.utils import metrics_store
+from src.utils.metrics_store import MetricsStore
+
+RECORDS = [
+    {"timestamp": "2026-01-0%dT10:00:00" % day, "file": f"clip{day}.wav", "model": "base",
+     "audio_duration": 60.0, "processing_time": 6.0 * day, "ratio": 0.1 * day}
+    for day in (1, 2, 3)
+]
+
+def write_legacy(tmp_path):
+    legacy_path = tmp_path / "performance.json"
+    legacy_path.write_text(json.dumps(RECORDS))
+    return legacy_path
+
+def open_store(tmp_path) -> MetricsStore:
+    return MetricsStore(str(tmp_path / "metrics.db"), str(tmp_path))
+
+def test_migration_imports_legacy_records_once(tmp_path):
+    legacy_path = write_legacy(tmp_path)
+    store = open_store(tmp_path)
+    assert [record["file"] for record in store.get_records("performance")] == ["clip1.wav", "clip2.wav", "clip3.wav"]
+    assert not legacy_path.exists()
+    assert legacy_path.with_suffix(".json.migrated").exists()
+    
+    assert len(open_store(tmp_path).get_records("performance")) == 3
+
+def test_migration_is_idempotent_when_legacy_file_reappears(tmp_path):
+    legacy_path = write_legacy(tmp_path)
+    open_store(tmp_path)
+    os.replace(legacy_path.with_suffix(".json.migrated"), legacy_path)
+    
+    store = open_store(tmp_path)
+    assert len(store.get_records("performance")) == 3
+    assert store.get_performance_stats()["total_files"] == 3
+    assert not legacy_path.exists()
+
+def test_migration_tolerates_legacy_file_renamed_by_another_process(tmp_path, monkeypatch):
+    write_legacy(tmp_path)
+    
+    def replaced_elsewhere(source, target):
+        raise FileNotFoundError(source)
+    
+    monkeypatch.setattr(metrics_store.os, "replace", replaced_elsewhere)
+    store = open_store(tmp_path)
+    assert len(store.get_records("performance")) == 3
+
+def test_append_updates_rollups(tmp_path):
+    write_legacy(tmp_path)
+    store = open_store(tmp_path)
+    store.append("performance", {"file": "new.wav", "model": "small", "audio_duration": 30.0, "processing_time": 3.0, "ratio": 0.1})
+    
+    stats = store.get_performance_stats()
+    assert stats["total_files"] == 4
+    assert stats["total_audio_duration"] == pytest.approx(210.0)
+    assert set(stats["by_model"]) == {"base", "small"}
+
+def test_rollup_percentiles_track_recorded_ratios(tmp_path):
+    store = open_store(tmp_path)
+    ratios = [0.05 * (index + 1) for index in range(40)]
+    for ratio in ratios:
+        store.append("performance", {"file": "a.wav", "model": "base", "audio_duration": 10.0, "processing_time": 10.0 * ratio, "ratio": ratio})
+    
+    percentiles = store.get_performance_stats()["by_model"]["base"]["ratio_percentiles"]
+    for name, q in (("p50", 0.5), ("p90", 0.9)):
+        expected = sorted(ratios)[int(q * (len(ratios) - 1))]
+        assert percentiles[name] == pytest.approx(expected, rel=0.01)
\ No newline at end of file
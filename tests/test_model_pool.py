@@ -0,0 +1,65 @@
+import threading
+import time
+import pytest
+from src.core.model_pool import ModelPool
+
+def slow_loader(started: threading.Event, release: threading.Event, calls: list, value="slow"):
+    def load():
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value
+    return load
+
+def test_cached_hits_are_not_blocked_by_a_slow_load():
+    pool = ModelPool(memory_budget_mb=1000)
+    pool.get("cached", lambda: "ready", 10)
+    started, release, calls = threading.Event(), threading.Event(), []
+    loader = threading.Thread(target=pool.get, args=("slow", slow_loader(started, release, calls), 10))
+    loader.start()
+    started.wait(5)
+    
+    began = time.monotonic()
+    assert pool.get("cached", lambda: "reloaded", 10) == "ready"
+    assert time.monotonic() - began < 0.5
+    
+    release.set()
+    loader.join()
+
+def test_concurrent_gets_share_one_load():
+    pool = ModelPool(memory_budget_mb=1000)
+    started, release, calls = threading.Event(), threading.Event(), []
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(pool.get("asr", slow_loader(started, release, calls), 10)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+    
+    assert calls == ["slow"]
+    assert results == ["slow"] * 4
+
+def test_failed_load_lets_waiters_retry():
+    pool = ModelPool(memory_budget_mb=1000)
+    
+    def fail():
+        raise RuntimeError("download failed")
+    
+    with pytest.raises(RuntimeError):
+        pool.get("asr", fail, 10)
+    assert pool.get("asr", lambda: "loaded", 10) == "loaded"
+
+def test_budget_uses_declared_sizes():
+    pool = ModelPool(memory_budget_mb=500)
+    pool.get("a", lambda: "a", 300)
+    pool.get("b", lambda: "b", 150)
+    pool.get("a", lambda: "a2", 300)
+    pool.get("c", lambda: "c", 100)
+    assert [key for key, _, _ in pool.get_entries()] == ["a", "c"]
+    assert pool.total_size_mb() == 400
\ No newline at end of file
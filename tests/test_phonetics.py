@@ -0,0 +1,49 @@
+import pytest
+from src.core.phonetics import PhoneticIndex, metaphone
+from src.core.vocabulary_matcher import VocabularyMatcher
+
+@pytest.mark.parametrize("word, expected", [
+    ("though", "0"),
+    ("night", "NT"),
+    ("ghost", "KST"),
+    ("aghast", "AKST"),
+    ("Schmidt", "SKMT"),
+    ("school", "SKL"),
+    ("Smith", "SM0"),
+    ("knight", "NT"),
+    ("phone", "FN"),
+    ("Dodd", "T"),
+])
+def test_metaphone(word, expected):
+    assert metaphone(word) == expected
+
+def test_index_matches_sound_alikes():
+    index = PhoneticIndex.build(["schmidt", "philip"])
+    assert index.lookup("schmit") == 0
+    assert index.lookup("though") is None
+    assert index.lookup("filip") == 1
+
+def test_index_skips_short_words():
+    index = PhoneticIndex.build(["nate", "kate"])
+    assert index.lookup("note") is None
+    assert index.lookup("gate") is None
+
+def test_matcher_uses_given_phonetic_index():
+    terms = {"schmidt": "Schmidt"}
+    matcher = VocabularyMatcher(terms, PhoneticIndex.build(list(terms)))
+    assert matcher.lookup("schmitt", 0, phonetic=True) == "Schmidt"
+
+def test_matcher_rejects_distant_sound_alikes():
+    terms = {"schmidt": "Schmidt", "nathan": "Nathan"}
+    matcher = VocabularyMatcher(terms, PhoneticIndex.build(list(terms)))
+    assert matcher.lookup("smith", 0, phonetic=True) is None
+    assert matcher.lookup("schmitt", 0, phonetic=True) == "Schmidt"
+
+@pytest.mark.parametrize("terms", [
+    {"nate": "Nate", "kate": "Kate"},
+    {"nathan": "Nathan", "schmidt": "Schmidt", "nottingham": "Nottingham"},
+])
+def test_common_words_are_left_alone(terms):
+    matcher = VocabularyMatcher(terms, PhoneticIndex.build(list(terms)))
+    words = "Last night we took a note and had a neat coat at the gate though nothing matched".split()
+    assert matcher.correct_words(words, 0, phonetic=True) == words
\ No newline at end of file
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from src.utils.sketch import QuantileSketch
+
+QUANTILES = [0.0, 0.01, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]
+
+def exact_quantile(values, q):
+    ordered = np.sort(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+def build(values, **kwargs) -> QuantileSketch:
+    sketch = QuantileSketch(**kwargs)
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+@pytest.mark.parametrize("relative_accuracy", [0.01, 0.05])
+def test_quantiles_within_relative_accuracy(relative_accuracy):
+    values = np.random.default_rng(0).lognormal(mean=-1.0, sigma=1.5, size=5000)
+    sketch = build(values, relative_accuracy=relative_accuracy)
+    for q in QUANTILES:
+        expected = exact_quantile(values, q)
+        assert abs(sketch.quantile(q) - expected) <= relative_accuracy * expected + 1e-12
+
+def test_merge_matches_single_sketch():
+    values = np.random.default_rng(1).exponential(scale=2.0, size=3000)
+    left = build(values[:1000])
+    right = build(values[1000:])
+    left.merge(right)
+    whole = build(values)
+    assert left.count == whole.count
+    assert left.bins == whole.bins
+    for q in QUANTILES:
+        assert left.quantile(q) == pytest.approx(whole.quantile(q))
+
+def test_round_trip_preserves_quantiles():
+    values = np.random.default_rng(2).gamma(shape=2.0, size=1000)
+    sketch = build(values)
+    restored = QuantileSketch.from_dict(sketch.to_dict())
+    assert restored.percentiles() == sketch.percentiles()
+    assert restored.mean == pytest.approx(sketch.mean)
+
+def test_collapse_keeps_upper_quantiles_accurate():
+    values = np.random.default_rng(3).lognormal(mean=0.0, sigma=2.0, size=5000)
+    sketch = build(values, relative_accuracy=0.05, max_bins=64)
+    assert len(sketch.bins) == 64
+    assert build(values, relative_accuracy=0.05, max_bins=4096).bins.keys() > sketch.bins.keys()
+    for q in (0.9, 0.99, 1.0):
+        expected = exact_quantile(values, q)
+        assert abs(sketch.quantile(q) - expected) <= sketch.relative_accuracy * expected
+
+def test_zeros_and_empty_sketch():
+    assert QuantileSketch().quantile(0.5) is None
+    sketch = build([0.0, 0.0, 0.0, 1.0])
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == pytest.approx(1.0, rel=sketch.relative_accuracy)
\ No newline at end of file
@@ -0,0 +1,84 @@
+import copy
+import random
+import pytest
+from src.core.speaker_assignment import assign_word_speakers
+
+pd = pytest.importorskip("pandas")
+whisperx_diarize = pytest.importorskip("whisperx.diarize")
+
+def make_segment(words):
+    return {
+        "start": words[0][0],
+        "end": words[-1][1],
+        "text": " ".join(f"w{index}" for index in range(len(words))),
+        "words": [{"word": f"w{index}", "start": start, "end": end} for index, (start, end) in enumerate(words)]
+    }
+
+def speakers(transcript):
+    return [
+        (seg.get("speaker"), [word.get("speaker") for word in seg.get("words", [])])
+        for seg in transcript["segments"]
+    ]
+
+def compare(turns, transcript, fill_nearest):
+    frame = pd.DataFrame(turns, columns=["start", "end", "speaker"])
+    expected = whisperx_diarize.assign_word_speakers(frame.copy(), copy.deepcopy(transcript), fill_nearest=fill_nearest)
+    actual = assign_word_speakers(frame.copy(), copy.deepcopy(transcript), fill_nearest=fill_nearest)
+    assert speakers(actual) == speakers(expected)
+
+FIXED_CASES = {
+    "alternating": (
+        [(0.0, 2.0, "SPEAKER_00"), (2.0, 4.5, "SPEAKER_01"), (4.5, 6.0, "SPEAKER_00")],
+        [make_segment([(0.1, 0.5), (1.8, 2.3), (2.5, 3.0)]), make_segment([(4.0, 4.8), (5.0, 5.5)])]
+    ),
+    "long_background_speaker": (
+        [(0.0, 14400.0, "SPEAKER_02")] + [(float(start), start + 0.5, f"SPEAKER_0{start % 2}") for start in range(10, 60)],
+        [make_segment([(start + 0.1, start + 0.4), (start + 0.45, start + 0.9)]) for start in range(5, 70, 3)]
+    ),
+    "ties": (
+        [(0.0, 2.0, "SPEAKER_01"), (2.0, 4.0, "SPEAKER_00"), (4.0, 5.0, "SPEAKER_00"), (5.0, 6.0, "SPEAKER_01")],
+        [make_segment([(1.0, 3.0), (3.5, 4.5), (4.5, 5.5)]), make_segment([(1.5, 2.5)])]
+    ),
+    "gaps_and_untimed_words": (
+        [(1.0, 2.0, "SPEAKER_00"), (8.0, 9.0, "SPEAKER_01")],
+        [make_segment([(0.0, 0.5), (3.0, 3.5), (6.5, 7.0), (10.0, 10.5)]), {
+            "start": 4.0, "end": 5.0, "text": "5 %", "words": [{"word": "5"}, {"word": "%", "start": 4.0, "end": 5.0}]
+        }]
+    ),
+    "zero_length": (
+        [(1.0, 1.0, "SPEAKER_00"), (0.5, 3.0, "SPEAKER_01")],
+        [make_segment([(1.0, 1.0), (0.9, 1.1), (3.0, 3.0)])]
+    ),
+}
+
+@pytest.mark.parametrize("fill_nearest", [False, True])
+@pytest.mark.parametrize("case", sorted(FIXED_CASES))
+def test_matches_whisperx_fixed(case, fill_nearest):
+    turns, segments = FIXED_CASES[case]
+    compare(turns, {"segments": segments}, fill_nearest)
+
+@pytest.mark.parametrize("fill_nearest", [False, True])
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_whisperx_randomized(seed, fill_nearest):
+    rng = random.Random(seed)
+    duration = rng.choice([30, 120, 600])
+    speaker_count = rng.randint(1, 4)
+    
+    turns = []
+    for _ in range(rng.randint(1, 80)):
+        start = rng.randrange(0, duration * 2) / 2
+        turns.append((start, start + rng.randint(0, 20) / 2, f"SPEAKER_{rng.randrange(speaker_count):02d}"))
+    if rng.random() < 0.3:
+        turns.append((0.0, float(duration), f"SPEAKER_{speaker_count:02d}"))
+    
+    segments = []
+    position = 0.0
+    while position < duration:
+        words = []
+        for _ in range(rng.randint(1, 12)):
+            length = rng.randint(0, 4) / 4
+            words.append((position, position + length))
+            position += length + rng.randint(0, 8) / 4
+        segments.append(make_segment(words))
+    
+    compare(turns, {"segments": segments}, fill_nearest)
\ No newline at end of file
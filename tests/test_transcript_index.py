@@ -0,0 +1,48 @@
+import json
+from src.core.transcript_index import TranscriptIndex
+from src.core.vocabulary_registry import VocabularyRegistry
+
+SETTINGS = {
+    "model": "base",
+    "beam_size": 5,
+    "compute_type": "int8",
+    "enable_diarization": False,
+    "enable_vocabulary": True,
+    "vocabulary_profile": "names",
+    "vocabulary_threshold": 2,
+}
+
+def write_transcript(path):
+    transcript = {
+        "metadata": {
+            "model": "base",
+            "parameters": {"beam_size": 5, "compute_type": "int8"},
+            "vocabulary_applied": True,
+        },
+        "segments": [],
+    }
+    path.write_text(json.dumps(transcript))
+    return str(path)
+
+def make_index(tmp_path):
+    registry = VocabularyRegistry(str(tmp_path / "vocabularies"))
+    registry.save_profile("names", {"nate": "Nate"})
+    index = TranscriptIndex(str(tmp_path / "index.json"), vocabulary_registry=registry)
+    return index, registry
+
+def test_lookup_hits_for_unchanged_profile(tmp_path):
+    index, _ = make_index(tmp_path)
+    index.record("abc", SETTINGS, write_transcript(tmp_path / "out.json"))
+    assert index.lookup("abc", SETTINGS) is not None
+
+def test_editing_profile_misses_cache(tmp_path):
+    index, registry = make_index(tmp_path)
+    index.record("abc", SETTINGS, write_transcript(tmp_path / "out.json"))
+    registry.save_profile("names", {"nate": "Nate", "kate": "Kate"})
+    assert index.lookup("abc", SETTINGS) is None
+
+def test_alignment_settings_change_key(tmp_path):
+    index, _ = make_index(tmp_path)
+    index.record("abc", SETTINGS, write_transcript(tmp_path / "out.json"))
+    assert index.lookup("abc", dict(SETTINGS, align_batch_size=1)) is None
+    assert index.lookup("abc", dict(SETTINGS, stream_window_seconds=30)) is None
\ No newline at end of file
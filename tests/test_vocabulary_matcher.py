@@ -0,0 +1,24 @@
+import pytest
+from src.core.phrase_matcher import phrase_barriers
+from src.core.vocabulary_matcher import VocabularyMatcher
+
+TERMS = {"open ai chat gpt": "OpenAI-ChatGPT", "open ai": "OpenAI", "chat gpt": "ChatGPT"}
+
+@pytest.mark.parametrize("text, expected", [
+    ("Open AI, chat gpt", "OpenAI, ChatGPT"),
+    ("open ai chat gpt", "OpenAI-ChatGPT"),
+    ("use open ai; chat gpt.", "use OpenAI; ChatGPT."),
+    ("\"open ai\" chat gpt", "\"OpenAI\" ChatGPT"),
+    ("open ai - chat gpt", "OpenAI - ChatGPT"),
+])
+def test_phrases_stop_at_punctuation(text, expected):
+    matcher = VocabularyMatcher(TERMS)
+    assert " ".join(matcher.correct_words(text.split(), 0)) == expected
+
+def test_phrase_spanning_a_clause_is_not_matched():
+    matcher = VocabularyMatcher({"open ai chat gpt": "OpenAI-ChatGPT"})
+    assert matcher.correct_words("Open AI, chat gpt".split(), 0) == ["Open", "AI,", "chat", "gpt"]
+
+def test_barriers_ignore_whitespace_and_hyphens():
+    assert phrase_barriers(["open-", "ai", "chat", "-gpt"]) == set()
+    assert phrase_barriers(["open", "ai,", "chat", "\"gpt\""]) == {2, 3}
\ No newline at end of file
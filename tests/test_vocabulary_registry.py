@@ -0,0 +1,46 @@
+import json
+from src.core.vocabulary_registry import VocabularyRegistry
+
+def test_matcher_is_shared_until_profile_changes(tmp_path):
+    registry = VocabularyRegistry(str(tmp_path))
+    registry.save_profile("names", {"nathan": "Nathan"})
+    matcher = registry.get_matcher(["names"])
+    assert registry.get_matcher(["names"]) is matcher
+    
+    registry.save_profile("names", {"nathan": "Nathan", "schmidt": "Schmidt"})
+    updated = registry.get_matcher(["names"])
+    assert updated is not matcher
+    assert updated.lookup("schmidt", 0) == "Schmidt"
+
+def test_external_edit_invalidates_profile_and_phonetic_index(tmp_path):
+    registry = VocabularyRegistry(str(tmp_path))
+    registry.save_profile("names", {"schmidt": "Schmidt"})
+    assert registry.get_matcher(["names"]).lookup("schmitt", 0, phonetic=True) == "Schmidt"
+    
+    registry.get_path("names").write_text(json.dumps({"philip": "Philip", "nathan": "Nathan"}))
+    matcher = registry.get_matcher(["names"])
+    assert matcher.lookup("schmitt", 0, phonetic=True) is None
+    assert matcher.lookup("filip", 1, phonetic=True) == "Philip"
+    assert registry.get_profile("names").terms == {"philip": "Philip", "nathan": "Nathan"}
+
+def test_combined_matcher_follows_member_edits(tmp_path):
+    registry = VocabularyRegistry(str(tmp_path))
+    registry.save_profile("people", {"nathan": "Nathan"})
+    registry.save_profile("places", {"nottingham": "Nottingham"})
+    combined = registry.get_matcher(["people", "places"])
+    assert combined.lookup("nottingham", 0) == "Nottingham"
+    
+    registry.save_profile("places", {"leicester": "Leicester"})
+    combined = registry.get_matcher(["people", "places"])
+    assert combined.lookup("nottingham", 0) is None
+    assert combined.lookup("leicester", 0) == "Leicester"
+    assert combined.lookup("nathan", 0) == "Nathan"
+
+def test_deleted_profile_is_dropped(tmp_path):
+    registry = VocabularyRegistry(str(tmp_path))
+    registry.save_profile("names", {"nathan": "Nathan"})
+    registry.get_matcher(["names"])
+    registry.delete_profile("names")
+    assert registry.get_profile("names") is None
+    assert registry.get_matcher(["names"]) is None
+    assert registry.get_profile_names() == []
\ No newline at end of file
@@ -0,0 +1,54 @@
+import queue
+import time
+from src.core.worker_pool import EVENT_ERROR, EVENT_PROGRESS, WorkerHandle, WorkerPool
+
+class FakeProcess:
+    def __init__(self, alive: bool):
+        self.alive = alive
+        self.exitcode = None if alive else -9
+    
+    def is_alive(self) -> bool:
+        return self.alive
+
+def make_pool(monkeypatch):
+    pool = WorkerPool(max_workers=2, threads_per_worker=1, pipeline_depth=2)
+    monkeypatch.setattr(pool, "_spawn", lambda: WorkerHandle(FakeProcess(True), queue.Queue()))
+    pool._events = queue.Queue()
+    pool._workers = [WorkerHandle(FakeProcess(True), queue.Queue()), WorkerHandle(FakeProcess(True), queue.Queue())]
+    for index, item_id in enumerate(["a", "b", "c"]):
+        worker = pool._workers[index % 2]
+        worker.items.append(item_id)
+        pool._pending[item_id] = worker
+    return pool
+
+def test_crash_is_noticed_while_other_worker_streams_events(monkeypatch):
+    pool = make_pool(monkeypatch)
+    pool._workers[0].process.alive = False
+    pool._workers[0].process.exitcode = -9
+    
+    errors = []
+    deadline = time.monotonic() + 3
+    while len(errors) < 2 and time.monotonic() < deadline:
+        pool._events.put((EVENT_PROGRESS, "b", 50, "Transcribing audio..."))
+        event = pool.get_event(timeout=0.05)
+        if event and event[0] == EVENT_ERROR:
+            errors.append(event[1])
+    
+    assert sorted(errors) == ["a", "c"]
+    assert pool.active_count == 1
+
+def test_failed_items_count_as_active_until_delivered(monkeypatch):
+    pool = make_pool(monkeypatch)
+    pool._workers[0].process.alive = False
+    pool._workers[1].items.clear()
+    del pool._pending["b"]
+    
+    assert pool.get_event(timeout=0.01)[1] == "a"
+    assert pool.active_count == 1
+    assert pool.get_event(timeout=0.01)[1] == "c"
+    assert pool.active_count == 0
+
+def test_events_for_released_items_are_dropped(monkeypatch):
+    pool = make_pool(monkeypatch)
+    pool._events.put((EVENT_PROGRESS, "zombie", 50, ""))
+    assert pool.get_event(timeout=0.01) is None
\ No newline at end of file